@@ -0,0 +1,51 @@
+"""Numeric kernels for collision tests.
+
+Numba is optional: when it is installed the kernels are JIT-compiled to tight
+native loops, otherwise NumPy broadcast implementations are used.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
+
+
+def _aabb_pairs_loop(a, b, out_pairs):
+    """Write overlapping (index_a, index_b) pairs into out_pairs, return count."""
+    count = 0
+    for i in range(a.shape[0]):
+        left, top, right, bottom = a[i, 0], a[i, 1], a[i, 2], a[i, 3]
+        for j in range(b.shape[0]):
+            # Same strict edge test as Rect.colliderect
+            if (
+                left < b[j, 2]
+                and right > b[j, 0]
+                and top < b[j, 3]
+                and bottom > b[j, 1]
+            ):
+                out_pairs[count, 0] = i
+                out_pairs[count, 1] = j
+                count += 1
+    return count
+
+
+def _aabb_pairs_numpy(a, b, out_pairs):
+    """Broadcast fallback for _aabb_pairs_loop when Numba is unavailable."""
+    hit = (
+        (a[:, None, 0] < b[None, :, 2])
+        & (a[:, None, 2] > b[None, :, 0])
+        & (a[:, None, 1] < b[None, :, 3])
+        & (a[:, None, 3] > b[None, :, 1])
+    )
+    pairs = np.argwhere(hit)
+    count = len(pairs)
+    out_pairs[:count] = pairs
+    return count
+
+
+if njit is not None:
+    aabb_pairs = njit(cache=True, fastmath=True)(_aabb_pairs_loop)
+else:
+    aabb_pairs = _aabb_pairs_numpy
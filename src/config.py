@@ -4,6 +4,12 @@
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+# Wait for the next frame with tick_busy_loop instead of tick; SDL_Delay can
+# overshoot by several milliseconds, which shows up as frame-time jitter
+PRECISE_FRAME_PACING = True
+# Ask SDL to sync flips to the display refresh (falls back if unsupported)
+VSYNC_ENABLED = True
+HEADLESS_DRIVERS = ("dummy", "offscreen")  # SDL video drivers without a display
 
 # Colors (Neon theme)
 BLACK = (0, 0, 0)
@@ -55,6 +61,7 @@ class BonusType:
 FREEZE_DURATION = 5000  # 5 seconds in milliseconds
 RAPID_FIRE_DURATION = 5000  # 5 seconds
 SHIELD_DURATION = 3000  # 3 seconds
+SHIELD_RADIUS = 35  # Radius of the shield circle drawn around the player
 
 # Scoring
 ENEMY_SCORE = 10
@@ -3,11 +3,22 @@
 import random
 from typing import Union
 
+import numpy as np
 import pygame
 
 from .config import *
+from .performance import (
+    PooledGroup,
+    bonus_pool,
+    bullet_pool,
+    enemy_pool,
+    explosion_pool,
+)
 from .sprites import sprite_cache
 
+# Playfield bounds used for off-screen culling
+_WORLD_RECT = pygame.Rect(0, 0, SCREEN_WIDTH, SCREEN_HEIGHT)
+
 
 class Player(pygame.sprite.Sprite):
     """Player spaceship entity."""
@@ -98,7 +109,7 @@ class Player(pygame.sprite.Sprite):
         """Activate triple shot for next shot."""
         self.triple_shot_active = True
 
-    def update(self, keys):
+    def update(self, keys, current_time: int | None = None):
         """Update player position based on input."""
         if keys[pygame.K_LEFT] and self.rect.left > 0:
             self.rect.x -= self.speed
@@ -106,7 +117,8 @@ class Player(pygame.sprite.Sprite):
             self.rect.x += self.speed
 
         # Check if bonuses expired
-        current_time = pygame.time.get_ticks()
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
         if self.rapid_fire_active and current_time > self.rapid_fire_end_time:
             self.rapid_fire_active = False
         if self.shield_active and current_time > self.shield_end_time:
@@ -118,6 +130,12 @@ class Enemy(pygame.sprite.Sprite):
 
     def __init__(self, x: int, y: int, row: int = 0, is_elite: bool = False):
         super().__init__()
+        self.animation_speed = 0.1  # Frames per game frame
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y, row, is_elite)
+
+    def reset(self, x: int, y: int, row: int = 0, is_elite: bool = False):
+        """Reinitialize enemy state so pooled instances can be reused."""
         self.is_elite = is_elite
 
         # Load appropriate animation frames
@@ -127,12 +145,11 @@ class Enemy(pygame.sprite.Sprite):
             self.frames = sprite_cache.get("enemy_frames")
 
         self.current_frame = 0
-        self.animation_speed = 0.1  # Frames per game frame
         self.animation_counter = 0.0
 
         # Set initial image
         self.image = self.frames[0] if self.frames else sprite_cache.get("enemy")
-        self.rect = self.image.get_rect()
+        self.rect.size = self.image.get_size()
         self.rect.x = x
         self.rect.y = y
         self.row = row
@@ -166,7 +183,7 @@ class Enemy(pygame.sprite.Sprite):
 
     def can_shoot(self) -> bool:
         """Randomly determine if enemy shoots this frame."""
-        # Get difficulty modifier from game
+        # Get difficulty modifier from game (imported here: game imports us)
         difficulty = 1.0
         try:
             from .game import Game
@@ -184,11 +201,12 @@ class Enemy(pygame.sprite.Sprite):
         return random.random() < shoot_chance
 
     def shoot(
-        self,
+        self, current_time: int | None = None
     ) -> Union["Bullet", "EliteBullet", list["Bullet"], list["EliteBullet"]]:
         """Create a bullet at enemy position. Elite enemies can shoot multiple bullets."""
         if self.is_elite:
-            current_time = pygame.time.get_ticks()
+            if current_time is None:
+                current_time = pygame.time.get_ticks()
             # Elite enemies have special attack patterns
             if (
                 current_time - self.last_special_attack > 5000
@@ -235,84 +253,126 @@ class Enemy(pygame.sprite.Sprite):
         return Bullet(self.rect.centerx, self.rect.bottom, ENEMY_BULLET_SPEED, "enemy")
 
 
-class Bullet(pygame.sprite.Sprite):
+class _PooledSprite(pygame.sprite.Sprite):
+    """Sprite base that points pool_cls at each class derived from it."""
+
+    # Class whose pool free list this sprite is requested from and returned to
+    pool_cls: type["_PooledSprite"]
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # A class may alias another class's free list by declaring pool_cls
+        if "pool_cls" not in cls.__dict__:
+            cls.pool_cls = cls
+
+
+class Bullet(_PooledSprite):
     """Bullet entity for both player and enemies."""
 
-    def __init__(self, x: int, y: int, speed: int, owner: str):
+    def __init__(
+        self,
+        x: int,
+        y: int,
+        speed: int,
+        owner: str,
+        vx: float = 0.0,
+        image_key: str | None = None,
+    ):
         super().__init__()
-        sprite_name = "player_bullet" if owner == "player" else "enemy_bullet"
-        self.image = sprite_cache.get(sprite_name)
-        self.rect = self.image.get_rect()
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        Bullet.reset(self, x, y, speed, owner, vx, image_key)
+
+    def reset(
+        self,
+        x: int,
+        y: int,
+        speed: int,
+        owner: str,
+        vx: float = 0.0,
+        image_key: str | None = None,
+    ):
+        """Reinitialize bullet state so pooled instances can be reused."""
+        if image_key is None:
+            image_key = "player_bullet" if owner == "player" else "enemy_bullet"
+        self.image = sprite_cache.get(image_key)
+        self.rect.size = self.image.get_size()
         self.rect.centerx = x
         self.rect.centery = y
-        self.speed = speed
+        self.speed = speed  # Vertical velocity
         self.owner = owner
+        # Horizontal velocity, accumulated in _fx for sub-pixel movement
+        self.vx = vx
+        self._fx = float(self.rect.x)
         # Initialize optional attributes for pooling compatibility
         self.x_velocity: float = 0.0
         self.x_direction = 0
 
+    def pool_key(self) -> tuple:
+        """Get the class and constructor args to request this bullet from a pool."""
+        return (
+            self.pool_cls,
+            self.rect.centerx,
+            self.rect.centery,
+            self.speed,
+            self.owner,
+        )
+
     def update(self):
         """Update bullet position."""
         self.rect.y += self.speed
+        if self.vx:
+            # Resync if the rect was moved externally (e.g. reused from the pool)
+            if int(self._fx) != self.rect.x:
+                self._fx = float(self.rect.x)
+            self._fx += self.vx
+            self.rect.x = int(self._fx)
 
         # Remove bullet if it goes off screen
-        if self.rect.bottom < 0 or self.rect.top > SCREEN_HEIGHT:
+        if not _WORLD_RECT.colliderect(self.rect):
             self.kill()
-            # Return bullet to pool when killed
-            try:
-                from .performance import bullet_pool
 
-                bullet_pool.release_bullet(self)
-            except ImportError:
-                pass
+    def kill(self):
+        """Remove bullet from all groups and return it to the pool."""
+        super().kill()
+        bullet_pool.release_bullet(self)
 
 
 class EliteBullet(Bullet):
     """Special bullet for elite enemies with angled movement."""
 
     def __init__(self, x: int, y: int, speed: int, owner: str, x_direction: int):
-        super().__init__(x, y, speed, owner)
+        super().__init__(x, y, speed, owner, x_direction * 2, "elite_bullet")
         self.x_direction = x_direction  # -1 for left, 0 for straight, 1 for right
-        # Make elite bullets visually distinct (purple tint)
-        purple_surface = pygame.Surface(self.image.get_size())
-        purple_surface.fill((255, 100, 255))
-        self.image.blit(purple_surface, (0, 0), special_flags=pygame.BLEND_MULT)
 
-    def update(self):
-        """Update bullet position with angled movement."""
-        self.rect.y += self.speed
-        self.rect.x += self.x_direction * 2  # Horizontal movement
+    def reset(  # type: ignore[override]
+        self, x: int, y: int, speed: int, owner: str, x_direction: int
+    ):
+        """Reinitialize elite bullet state so pooled instances can be reused."""
+        super().reset(x, y, speed, owner, x_direction * 2, "elite_bullet")
+        self.x_direction = x_direction
 
-        # Remove bullet if it goes off screen
-        if (
-            self.rect.bottom < 0
-            or self.rect.top > SCREEN_HEIGHT
-            or self.rect.left > SCREEN_WIDTH
-            or self.rect.right < 0
-        ):
-            self.kill()
+    def pool_key(self) -> tuple:
+        """Get the class and constructor args to request this bullet from a pool."""
+        return (*super().pool_key(), self.x_direction)
 
 
 class TripleShotBullet(Bullet):
     """Special bullet for triple shot that moves at an angle."""
 
     def __init__(self, x: int, y: int, speed: int, owner: str, x_velocity: float):
-        super().__init__(x, y, speed, owner)
+        super().__init__(x, y, speed, owner, x_velocity * abs(speed))
         self.x_velocity: float = x_velocity
 
-    def update(self):
-        """Update bullet position with angled movement."""
-        self.rect.y += self.speed
-        self.rect.x += int(self.x_velocity * abs(self.speed))
+    def reset(  # type: ignore[override]
+        self, x: int, y: int, speed: int, owner: str, x_velocity: float
+    ):
+        """Reinitialize triple shot bullet state so pooled instances can be reused."""
+        super().reset(x, y, speed, owner, x_velocity * abs(speed))
+        self.x_velocity = x_velocity
 
-        # Remove bullet if it goes off screen
-        if (
-            self.rect.bottom < 0
-            or self.rect.top > SCREEN_HEIGHT
-            or self.rect.right < 0
-            or self.rect.left > SCREEN_WIDTH
-        ):
-            self.kill()
+    def pool_key(self) -> tuple:
+        """Get the class and constructor args to request this bullet from a pool."""
+        return (*super().pool_key(), self.x_velocity)
 
 
 class Bonus(pygame.sprite.Sprite):
@@ -320,13 +380,18 @@ class Bonus(pygame.sprite.Sprite):
 
     def __init__(self, x: int, y: int):
         super().__init__()
+        self.speed = BONUS_FALL_SPEED
+        self.value = BONUS_SCORE
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.reset(x, y)
+
+    def reset(self, x: int, y: int):
+        """Reinitialize bonus with a new random shape so it can be reused."""
         self.shape_type = random.randint(0, 4)
         self.image = sprite_cache.get(f"bonus_{self.shape_type}")
-        self.rect = self.image.get_rect()
+        self.rect.size = self.image.get_size()
         self.rect.centerx = x
         self.rect.centery = y
-        self.speed = BONUS_FALL_SPEED
-        self.value = BONUS_SCORE
 
     def update(self):
         """Update bonus position."""
@@ -335,6 +400,8 @@ class Bonus(pygame.sprite.Sprite):
         # Remove bonus if it falls off screen
         if self.rect.top > SCREEN_HEIGHT:
             self.kill()
+            # Return bonus to pool
+            bonus_pool.release_bonus(self)
 
 
 class Explosion(pygame.sprite.Sprite):
@@ -361,12 +428,7 @@ class Explosion(pygame.sprite.Sprite):
             if self.current_frame >= len(self.frames):
                 self.kill()
                 # Return explosion to pool when animation completes
-                try:
-                    from .performance import explosion_pool
-
-                    explosion_pool.release_explosion(self)
-                except ImportError:
-                    pass
+                explosion_pool.release_explosion(self)
             else:
                 self.image = self.frames[self.current_frame]
                 self.rect = self.image.get_rect(center=self.rect.center)
@@ -376,13 +438,15 @@ class EnemyGroup:
     """Manages the formation of enemies with classic Space Invaders movement."""
 
     def __init__(self):
-        self.enemies = pygame.sprite.Group()
+        # Enemies removed from the formation are returned to the pool
+        self._release_enemy = enemy_pool.release_enemy
+        self.enemies = PooledGroup(self._on_enemy_removed, on_add=self._on_enemy_added)
         self.moving_right = True
         self.drop_timer = 0
         self.frozen = False
         self.freeze_end_time = 0
         # Cache for bottom enemies to reduce recalculation
-        self._bottom_enemies_cache = []
+        self._bottom_enemies_cache: list[Enemy] = []
         self._cache_dirty = True
 
     def create_formation(self, wave: int = 1, difficulty_modifier: float = 1.0):  # noqa: ARG002
@@ -402,70 +466,78 @@ class EnemyGroup:
             elite_percentage = 0.1 + (wave - 2) * 0.02  # +2% per wave after wave 2
             elite_count = int(total_enemies * min(elite_percentage, 0.3))  # Cap at 30%
 
-        # Create list of positions and randomly assign elites
-        positions = []
-        for row in range(ENEMY_ROWS):
-            for col in range(ENEMY_COLS):
-                x = col * ENEMY_SPACING_X + 50
-                y = row * ENEMY_SPACING_Y + ENEMY_START_Y
-                positions.append((x, y, row))
+        # Build the formation grid in one vectorized pass
+        rows, cols = np.mgrid[:ENEMY_ROWS, :ENEMY_COLS]
+        xs = cols.ravel() * ENEMY_SPACING_X + 50
+        ys = rows.ravel() * ENEMY_SPACING_Y + ENEMY_START_Y
 
-        # Randomly select positions for elite enemies
+        # Randomly select position indices for elite enemies
+        is_elite = np.zeros(total_enemies, dtype=bool)
         if elite_count > 0:
-            elite_positions = random.sample(positions, elite_count)
-        else:
-            elite_positions = []
-
-        # Create enemies
-        for x, y, row in positions:
-            is_elite = (x, y, row) in elite_positions
-            enemy = Enemy(x, y, row, is_elite)
+            is_elite[np.random.choice(total_enemies, elite_count, replace=False)] = True
+
+        # Create enemies, reusing pooled instances where possible
+        for x, y, row, elite in zip(
+            xs.tolist(),
+            ys.tolist(),
+            rows.ravel().tolist(),
+            is_elite.tolist(),
+            strict=True,
+        ):
+            enemy = enemy_pool.get_enemy(Enemy, x, y, row, elite)
             self.enemies.add(enemy)
 
-        # Mark cache as dirty when formation changes
-        self._cache_dirty = True
-
-    def update(self):
+    def update(self, current_time: int | None = None):
         """Update all enemies with formation movement."""
         # Check if freeze expired
-        if self.frozen and pygame.time.get_ticks() > self.freeze_end_time:
-            self.frozen = False
+        if self.frozen:
+            if current_time is None:
+                current_time = pygame.time.get_ticks()
+            if current_time > self.freeze_end_time:
+                self.frozen = False
 
         # Don't move if frozen
         if self.frozen:
             return
 
-        # Check if any enemy hit the edge
-        hit_edge = False
-        for enemy in self.enemies:
-            if (enemy.rect.right >= SCREEN_WIDTH - 10 and enemy.direction > 0) or (
-                enemy.rect.left <= 10 and enemy.direction < 0
-            ):
-                hit_edge = True
-                break
+        sprites = self.enemies.sprites()
+        if not sprites:
+            return
+
+        # Enemies always reverse together, so any one of them carries the
+        # formation direction; test it against the formation's bounding box
+        direction = sprites[0].direction
+        bounds = sprites[0].rect.unionall([enemy.rect for enemy in sprites])
+        hit_edge = (bounds.right >= SCREEN_WIDTH - 10 and direction > 0) or (
+            bounds.left <= 10 and direction < 0
+        )
 
         # If hit edge, reverse all enemies
         if hit_edge:
-            for enemy in self.enemies:
+            for enemy in sprites:
                 enemy.reverse_direction()
 
         # Update all enemies
         self.enemies.update()
 
-        # Mark cache as dirty if any enemies were removed
-        if len(self.enemies) != len(self._bottom_enemies_cache):
-            self._cache_dirty = True
+    def _on_enemy_added(self, _enemy: Enemy):
+        """Invalidate the shooter cache when an enemy joins the formation."""
+        self._cache_dirty = True
+
+    def _on_enemy_removed(self, enemy: Enemy):
+        """Invalidate the shooter cache and return the enemy to the pool."""
+        self._cache_dirty = True
+        self._release_enemy(enemy)
 
     def get_bottom_enemies(self) -> list[Enemy]:
-        """Get enemies that can shoot (bottom row of each column)."""
-        # Use cached result if available
-        if not self._cache_dirty and self._bottom_enemies_cache:
-            # Validate cache - remove any dead enemies
-            self._bottom_enemies_cache = [
-                e for e in self._bottom_enemies_cache if e.alive()
-            ]
-            if self._bottom_enemies_cache:
-                return list(self._bottom_enemies_cache)
+        """Get enemies that can shoot (bottom row of each column).
+
+        The returned list is the internal cache and must not be mutated.
+        """
+        # Cache is invalidated whenever an enemy joins or leaves the formation.
+        # Columns move sideways and down as a whole, so movement keeps it valid
+        if not self._cache_dirty:
+            return self._bottom_enemies_cache
 
         # Recalculate bottom enemies
         columns: dict[int, list[Enemy]] = {}
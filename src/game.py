@@ -3,20 +3,23 @@
 import json
 import os
 import random
+from collections.abc import Callable
 
+import numpy as np
 import pygame
 
 from .config import *
 from .entities import (
     Bonus,
-    EliteBullet,
+    Bullet,
+    Enemy,
     EnemyGroup,
     Explosion,
     Player,
-    TripleShotBullet,
 )
 from .hud import HUD, MinimapHUD
 from .neon_effects import (
+    HUE_RGB,
     HeartBeat,
     NeonEffect,
     NeonGrid,
@@ -25,61 +28,76 @@ from .neon_effects import (
     RainbowPulse,
     SparkleEffect,
     StarField,
+    _premultiply,
+)
+from .performance import (
+    CollisionBuffers,
+    FastDrawGroup,
+    OptimizedGroup,
+    bonus_pool,
+    bullet_pool,
+    effect_pool,
+    explosion_pool,
 )
-from .performance import OptimizedGroup, bullet_pool, explosion_pool
 from .settings_menu import SettingsMenu
 from .sounds import sound_manager
 
 
+def _skip_effect(_x: int, _y: int) -> None:
+    """Stand-in effect spawner used while particles are disabled."""
+
+
 class Game:
     """Main game class managing states and game logic."""
 
     _instance = None
 
+    # Effect spawners, rebound whenever particles_enabled changes
+    _spawn_explosion: Callable[[int, int], None]
+    _spawn_sparkle: Callable[[int, int], None]
+    _spawn_rainbow_pulse: Callable[[int, int], None]
+
+    vsync = False  # Whether the window was opened with vsync
+
+    # Shield glow rings as (surface, half size), built on first use
+    _shield_layers: list[tuple[pygame.Surface, int]] | None = None
+
     def __init__(self):
         Game._instance = self
         pygame.init()
-        self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.screen = self._create_screen()
         pygame.display.set_caption("Neon Invaders")
         self.clock = pygame.time.Clock()
         self.font = pygame.font.Font(None, 36)
         self.big_font = pygame.font.Font(None, 72)
 
-        # Load and scale background image
-        try:
-            self.background = pygame.image.load("assets/background.png").convert()
-            self.background = pygame.transform.scale(
-                self.background, (SCREEN_WIDTH, SCREEN_HEIGHT)
-            )
-        except pygame.error:
-            # If background.png doesn't exist, create a simple gradient background
-            self.background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            for y in range(SCREEN_HEIGHT):
-                color_value = int(20 + (y / SCREEN_HEIGHT) * 30)
-                pygame.draw.line(
-                    self.background,
-                    (color_value, 0, color_value),
-                    (0, y),
-                    (SCREEN_WIDTH, y),
-                )
+        self.background = self._load_background()
 
         # Game state
         self.state = GameState.MENU
+        self.frame_ticks = 0  # pygame.time.get_ticks() sampled once per update
         self.running = True
         self.wave = 1
         self.high_score = self.load_high_score()
 
         # Sprite groups - use optimized groups for better collision detection
-        self.all_sprites = pygame.sprite.Group()
+        # Not LayeredDirty: the background is repainted every frame, which
+        # leaves every sprite dirty, so a plain batched blit is cheaper
+        self.all_sprites = FastDrawGroup()
         self.player_bullets = OptimizedGroup()
         self.enemy_bullets = OptimizedGroup()
         self.bonuses = pygame.sprite.Group()
         self.explosions = pygame.sprite.Group()
+        self.collision_buffers = CollisionBuffers()
 
         # Game entities
         self.player = None
         self.enemy_group = EnemyGroup()
 
+        # Pooled effects, created before the particles_enabled setter runs
+        self.rainbow_pulses = []  # For bonus collection effects
+        self.sparkle_effects = []  # For various sparkle animations
+
         # HUD systems
         self.hud = HUD(self.screen)
         self.minimap = MinimapHUD(self.screen)
@@ -99,14 +117,70 @@ class Game:
         # Visual effects
         self.starfield = StarField(STAR_COUNT) if STARS_ENABLED else None
         self.neon_grid = NeonGrid(60, NEON_PURPLE, 20) if NEON_GRID_ENABLED else None
-        self.rainbow_pulses = []  # For bonus collection effects
-        self.sparkle_effects = []  # For various sparkle animations
         self.player_trail = (
             NeonTrail(NEON_GREEN, PLAYER_TRAIL_LENGTH) if PLAYER_TRAIL_ENABLED else None
         )
         self.menu_heartbeat = HeartBeat((SCREEN_WIDTH - 50, 50), NEON_RED)
         self.neon_effect = NeonEffect(NEON_CYAN)
 
+        # Rendering caches
+        self._overlays: dict[int, pygame.Surface] = {}  # Dimming overlays by alpha
+        self._fps_texts: dict[int, pygame.Surface] = {}  # FPS counter by value
+        self._paused_frame_presented = False  # Pause screen is static once shown
+
+        # Bonus type -> effect handler, looked up instead of an elif chain
+        self._bonus_handlers = {
+            BonusType.EXTRA_LIFE: self._bonus_extra_life,
+            BonusType.FREEZE_ENEMIES: self._bonus_freeze_enemies,
+            BonusType.TRIPLE_SHOT: self._bonus_triple_shot,
+            BonusType.SHIELD: self._bonus_shield,
+            BonusType.RAPID_FIRE: self._bonus_rapid_fire,
+        }
+
+        # Game state -> screen drawer, looked up once per frame in draw()
+        self._draw_handlers = {
+            GameState.MENU: self.draw_menu,
+            GameState.SETTINGS: self.draw_settings,
+            GameState.PLAYING: self.draw_game,
+            GameState.PAUSED: self.draw_paused,
+            GameState.GAME_OVER: self.draw_game_over,
+            GameState.WAVE_CLEAR: self.draw_wave_clear,
+        }
+
+    def _create_screen(self) -> pygame.Surface:
+        """Open the game window, with vsync when it is enabled and supported."""
+        # Headless drivers have no display refresh to wait for
+        if VSYNC_ENABLED and pygame.display.get_driver() not in HEADLESS_DRIVERS:
+            try:
+                # SDL only honours vsync for windows backed by a renderer
+                screen = pygame.display.set_mode(
+                    (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SCALED, vsync=1
+                )
+            except pygame.error:
+                pass
+            else:
+                self.vsync = True
+                return screen
+        self.vsync = False
+        return pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+    @staticmethod
+    def _load_background() -> pygame.Surface:
+        """Load and scale the background image, or build a gradient fallback."""
+        try:
+            background = pygame.image.load("assets/background.png").convert()
+            return pygame.transform.scale(background, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        except pygame.error:
+            # If background.png doesn't exist, create a simple gradient background
+            # in one array operation (surfarray is indexed [x, y])
+            row_values = (20 + np.arange(SCREEN_HEIGHT) * 30 / SCREEN_HEIGHT).astype(
+                np.uint8
+            )
+            pixels = np.zeros((SCREEN_WIDTH, SCREEN_HEIGHT, 3), dtype=np.uint8)
+            pixels[:, :, 0] = row_values[None, :]
+            pixels[:, :, 2] = row_values[None, :]
+            return pygame.surfarray.make_surface(pixels)
+
     def load_high_score(self) -> int:
         """Load high score from file."""
         try:
@@ -124,8 +198,18 @@ class Game:
         if self.player and self.player.score > self.high_score:
             self.high_score = self.player.score
             try:
-                with open("highscore.json", "w") as f:
-                    json.dump({"high_score": self.high_score}, f)
+                # Write a temp file and rename it so a crash never leaves a
+                # truncated high score file behind
+                data = b'{"high_score": %d}' % self.high_score
+                fd = os.open(
+                    "highscore.json.tmp", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644
+                )
+                try:
+                    os.write(fd, data)
+                    os.fsync(fd)
+                finally:
+                    os.close(fd)
+                os.replace("highscore.json.tmp", "highscore.json")
             except:
                 pass
 
@@ -153,6 +237,10 @@ class Game:
             if event.type == pygame.QUIT:
                 self.running = False
 
+            # The window lost its pixels, so present the pause screen again
+            if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEORESIZE):
+                self._paused_frame_presented = False
+
             if event.type == pygame.KEYDOWN:
                 if self.state == GameState.MENU:
                     if event.key == pygame.K_SPACE:
@@ -192,6 +280,8 @@ class Game:
 
                 elif self.state == GameState.SETTINGS:
                     if event.key == pygame.K_ESCAPE:
+                        # Don't leave a same-frame volume change unapplied
+                        self.settings_menu.apply_pending_volume()
                         self.state = GameState.MENU
                     else:
                         # Delegate navigation to settings menu
@@ -199,32 +289,22 @@ class Game:
 
     def player_shoot(self):
         """Handle player shooting."""
-        if self.player and self.player.can_shoot(pygame.time.get_ticks()):
-            bullets = self.player.shoot(pygame.time.get_ticks())
+        # Shots come from input events, before update() samples the frame time
+        current_time = pygame.time.get_ticks()
+        if self.player and self.player.can_shoot(current_time):
+            bullets = self.player.shoot(current_time)
             for bullet in bullets:
-                # Use bullet pool - handle special bullet types
-                if isinstance(bullet, TripleShotBullet):
-                    pooled_bullet = bullet_pool.get_bullet(
-                        TripleShotBullet,
-                        bullet.rect.centerx,
-                        bullet.rect.centery,
-                        bullet.speed,
-                        bullet.owner,
-                        bullet.x_velocity,
-                    )
-                else:
-                    pooled_bullet = bullet_pool.get_bullet(
-                        type(bullet),
-                        bullet.rect.centerx,
-                        bullet.rect.centery,
-                        bullet.speed,
-                        bullet.owner,
-                    )
-                self.player_bullets.add(pooled_bullet)
-                self.all_sprites.add(pooled_bullet)
+                self._pool_and_register(bullet, self.player_bullets)
             # Play shooting sound
             sound_manager.play("player_shoot")
 
+    def _pool_and_register(self, bullet: Bullet, group: pygame.sprite.Group):
+        """Swap a freshly shot bullet for a pooled one and add it to the groups."""
+        # The bullet describes its own pool request
+        pooled_bullet = bullet_pool.get_bullet(*bullet.pool_key())
+        group.add(pooled_bullet)
+        self.all_sprites.add(pooled_bullet)
+
     def enemy_shoot(self):
         """Handle enemy shooting."""
         # Don't shoot if frozen
@@ -234,51 +314,11 @@ class Game:
         bottom_enemies = self.enemy_group.get_bottom_enemies()
         for enemy in bottom_enemies:
             if enemy.can_shoot():
-                result = enemy.shoot()
+                result = enemy.shoot(self.frame_ticks)
                 # Elite enemies can return a list of bullets
-                if isinstance(result, list):
-                    for bullet in result:
-                        # Handle EliteBullet with x_direction parameter
-                        if hasattr(bullet, "x_direction"):
-                            pooled_bullet = bullet_pool.get_bullet(
-                                EliteBullet,
-                                bullet.rect.centerx,
-                                bullet.rect.centery,
-                                bullet.speed,
-                                bullet.owner,
-                                bullet.x_direction,
-                            )
-                        else:
-                            pooled_bullet = bullet_pool.get_bullet(
-                                type(bullet),
-                                bullet.rect.centerx,
-                                bullet.rect.centery,
-                                bullet.speed,
-                                bullet.owner,
-                            )
-                        self.enemy_bullets.add(pooled_bullet)
-                        self.all_sprites.add(pooled_bullet)
-                else:
-                    # Handle single bullet
-                    if hasattr(result, "x_direction"):
-                        pooled_bullet = bullet_pool.get_bullet(
-                            EliteBullet,
-                            result.rect.centerx,
-                            result.rect.centery,
-                            result.speed,
-                            result.owner,
-                            result.x_direction,
-                        )
-                    else:
-                        pooled_bullet = bullet_pool.get_bullet(
-                            type(result),
-                            result.rect.centerx,
-                            result.rect.centery,
-                            result.speed,
-                            result.owner,
-                        )
-                    self.enemy_bullets.add(pooled_bullet)
-                    self.all_sprites.add(pooled_bullet)
+                bullets = result if isinstance(result, list) else (result,)
+                for bullet in bullets:
+                    self._pool_and_register(bullet, self.enemy_bullets)
                 # Play enemy shooting sound
                 sound_manager.play("enemy_shoot")
 
@@ -290,24 +330,40 @@ class Game:
             self.neon_grid.update()
         self.menu_heartbeat.update()
 
-        # Update rainbow pulses
-        for pulse in self.rainbow_pulses[:]:
+        # Nothing left to update while particles are off (lists were cleared)
+        if not self._particles_enabled:
+            return
+
+        # Update rainbow pulses, compacting survivors in place
+        pulses = self.rainbow_pulses
+        write = 0
+        for pulse in pulses:
             pulse.update()
-            if not pulse.active:
-                self.rainbow_pulses.remove(pulse)
+            if pulse.active:
+                pulses[write] = pulse
+                write += 1
+            else:
+                effect_pool.release_effect(pulse)
+        del pulses[write:]
 
-        # Update sparkle effects
-        for sparkle in self.sparkle_effects[:]:
+        # Update sparkle effects, compacting survivors in place
+        sparkles = self.sparkle_effects
+        write = 0
+        for sparkle in sparkles:
             sparkle.update()
-            if not sparkle.active:
-                self.sparkle_effects.remove(sparkle)
+            if sparkle.active:
+                sparkles[write] = sparkle
+                write += 1
+            else:
+                effect_pool.release_effect(sparkle)
+        del sparkles[write:]
 
     def _update_game_playing(self):
         """Update game logic when in PLAYING state."""
         # Update player with keyboard input
         keys = pygame.key.get_pressed()
         if self.player:
-            self.player.update(keys)
+            self.player.update(keys, self.frame_ticks)
             # Add trail effect for player movement if enabled
             if self.player_trail:
                 self.player_trail.add_point(
@@ -315,14 +371,14 @@ class Game:
                 )
 
         # Update all other sprites
-        self.enemy_group.update()
+        self.enemy_group.update(self.frame_ticks)
         self.player_bullets.update()
         self.enemy_bullets.update()
         self.bonuses.update()
         self.explosions.update()
 
         # Update HUD
-        self.hud.update(self.player, self.wave, self.enemy_group)
+        self.hud.update(self.player, self.wave, self.enemy_group, self.frame_ticks)
 
         # Enemy shooting
         self.enemy_shoot()
@@ -363,15 +419,21 @@ class Game:
 
         # Add celebration sparkles only if particles enabled
         if self.particles_enabled:
+            randint = random.randint
             for _ in range(5):
-                x = random.randint(100, SCREEN_WIDTH - 100)
-                y = random.randint(100, SCREEN_HEIGHT - 100)
-                self.sparkle_effects.append(SparkleEffect((x, y)))
+                x = randint(100, SCREEN_WIDTH - 100)
+                y = randint(100, SCREEN_HEIGHT - 100)
+                self._add_sparkle(x, y)
 
     def update(self):
         """Update game state."""
-        # Always update visual effects
-        self._update_visual_effects()
+        # Sample the clock once and share it with everything updated this frame
+        self.frame_ticks = pygame.time.get_ticks()
+
+        # Visual effects freeze with the game while paused, so the pause
+        # screen drawn once in draw() stays an exact picture of the frame
+        if self.state != GameState.PAUSED:
+            self._update_visual_effects()
 
         # Update settings menu animations
         if self.state == GameState.SETTINGS:
@@ -381,46 +443,100 @@ class Game:
         if self.state == GameState.PLAYING:
             self._update_game_playing()
 
+    @property
+    def particles_enabled(self) -> bool:
+        """Whether particle effects are spawned and drawn."""
+        return self._particles_enabled
+
+    @particles_enabled.setter
+    def particles_enabled(self, enabled: bool):
+        self._particles_enabled = enabled
+        # Rebind the spawners once so collision code calls them unconditionally
+        if enabled:
+            self._spawn_explosion = self._add_explosion
+            self._spawn_sparkle = self._add_sparkle
+            self._spawn_rainbow_pulse = self._add_rainbow_pulse
+        else:
+            self._spawn_explosion = _skip_effect
+            self._spawn_sparkle = _skip_effect
+            self._spawn_rainbow_pulse = _skip_effect
+            # Drop effects still in flight; they are no longer drawn or updated
+            effect_pool.release_all(self.rainbow_pulses)
+            effect_pool.release_all(self.sparkle_effects)
+
+    def _add_explosion(self, x: int, y: int) -> None:
+        """Spawn a pooled explosion at a position."""
+        explosion = explosion_pool.get_explosion(Explosion, x, y)
+        self.explosions.add(explosion)
+        self.all_sprites.add(explosion)
+
+    def _add_sparkle(self, x: int, y: int) -> None:
+        """Spawn a pooled sparkle effect at a position."""
+        self.sparkle_effects.append(effect_pool.get_effect(SparkleEffect, (x, y)))
+
+    def _add_rainbow_pulse(self, x: int, y: int) -> None:
+        """Spawn a pooled rainbow pulse at a position."""
+        self.rainbow_pulses.append(effect_pool.get_effect(RainbowPulse, (x, y)))
+
+    def _kill_enemies_hit_by_player_bullets(self) -> list[Enemy]:
+        """Kill enemies hit by player bullets and the bullets that hit them."""
+        bullets = self.player_bullets.sprites()
+        enemies = self.enemy_group.enemies.sprites()
+        pairs = self.collision_buffers.overlap_pairs(bullets, enemies)
+
+        killed = []
+        for bullet_index, enemy_index in pairs.tolist():
+            enemy = enemies[enemy_index]
+            # An enemy can only be destroyed by the first bullet that reaches it
+            if enemy.alive():
+                enemy.kill()
+                bullets[bullet_index].kill()
+                killed.append(enemy)
+        return killed
+
+    def _kill_enemy_bullets_hitting_player(self) -> list[Bullet]:
+        """Kill enemy bullets overlapping the player, using the spatial grid."""
+        player_rect = self.player.rect
+        # Rect.colliderect beats hand-inlined AABB math on cached tuples here:
+        # the candidate list is short and CPython specializes the C method call
+        hits = [
+            bullet
+            for bullet in self.enemy_bullets.query_rect(player_rect)
+            if player_rect.colliderect(bullet.rect)
+        ]
+        for bullet in hits:
+            bullet.kill()
+        return hits
+
     def check_collisions(self):
         """Check all game collisions."""
-        # Player bullets hitting enemies
-        for bullet in self.player_bullets:
-            hit_enemies = pygame.sprite.spritecollide(
-                bullet, self.enemy_group.enemies, True
-            )
-            if hit_enemies:
-                bullet.kill()
-                for enemy in hit_enemies:
-                    if self.player:
-                        self.player.score += ENEMY_SCORE
-                    # Register kill for combo system
-                    self.hud.register_kill()
-                    # Use explosion pool only if particles are enabled
-                    if self.particles_enabled:
-                        explosion = explosion_pool.get_explosion(
-                            Explosion, enemy.rect.centerx, enemy.rect.centery
-                        )
-                        self.explosions.add(explosion)
-                        self.all_sprites.add(explosion)
-                    # Play explosion sound
-                    sound_manager.play("explosion")
+        # Looked up per call (not per kill) so tests can still patch random
+        rand = random.random
 
-                    # Chance to spawn bonus
-                    if random.random() < BONUS_SPAWN_CHANCE:
-                        bonus = Bonus(enemy.rect.centerx, enemy.rect.centery)
-                        self.bonuses.add(bonus)
-                        self.all_sprites.add(bonus)
-                        # Add sparkle effect for bonus spawn only if particles enabled
-                        if self.particles_enabled:
-                            self.sparkle_effects.append(
-                                SparkleEffect((bonus.rect.centerx, bonus.rect.centery))
-                            )
+        # Player bullets hitting enemies
+        for enemy in self._kill_enemies_hit_by_player_bullets():
+            if self.player:
+                self.player.score += ENEMY_SCORE
+            # Register kill for combo system
+            self.hud.register_kill(self.frame_ticks)
+            # Explosion is a no-op while particles are disabled
+            self._spawn_explosion(enemy.rect.centerx, enemy.rect.centery)
+            # Play explosion sound
+            sound_manager.play("explosion")
+
+            # Chance to spawn bonus
+            if rand() < BONUS_SPAWN_CHANCE:
+                bonus = bonus_pool.get_bonus(
+                    Bonus, enemy.rect.centerx, enemy.rect.centery
+                )
+                self.bonuses.add(bonus)
+                self.all_sprites.add(bonus)
+                # Add sparkle effect for bonus spawn
+                self._spawn_sparkle(bonus.rect.centerx, bonus.rect.centery)
 
         # Enemy bullets hitting player
         if self.player:
-            hit_player = pygame.sprite.spritecollide(
-                self.player, self.enemy_bullets, True
-            )
+            hit_player = self._kill_enemy_bullets_hitting_player()
             if hit_player:
                 if self.player.shield_active:
                     # Play shield hit sound
@@ -429,13 +545,9 @@ class Game:
                     # Play explosion sound
                     sound_manager.play("explosion")
                 self.player.hit()
-                # Use explosion pool only if particles are enabled
-                if self.particles_enabled:
-                    explosion = explosion_pool.get_explosion(
-                        Explosion, self.player.rect.centerx, self.player.rect.centery
-                    )
-                    self.explosions.add(explosion)
-                    self.all_sprites.add(explosion)
+                self._spawn_explosion(
+                    self.player.rect.centerx, self.player.rect.centery
+                )
 
         # Player collecting bonuses
         if self.player:
@@ -446,44 +558,41 @@ class Game:
                 self.apply_bonus_effect(bonus.shape_type)
                 # Play bonus collection sound
                 sound_manager.play("bonus_collect")
-                # Add rainbow pulse effect at collection point only if particles enabled
-                if self.particles_enabled:
-                    self.rainbow_pulses.append(
-                        RainbowPulse((bonus.rect.centerx, bonus.rect.centery))
-                    )
+                # Add rainbow pulse effect at collection point
+                self._spawn_rainbow_pulse(bonus.rect.centerx, bonus.rect.centery)
+                # Return collected bonus to the pool
+                bonus_pool.release_bonus(bonus)
 
     def apply_bonus_effect(self, bonus_type: int):
         """Apply bonus effect based on Tetris block type."""
-        current_time = pygame.time.get_ticks()
-
         if self.player:
-            if bonus_type == BonusType.EXTRA_LIFE:
-                # O-block (cyan) - add 1 life
-                self.player.add_life()
+            handler = self._bonus_handlers.get(bonus_type)
+            if handler:
+                handler(self.frame_ticks)
                 self.player.score += BONUS_SCORE
 
-            elif bonus_type == BonusType.FREEZE_ENEMIES:
-                # T-block (yellow) - freeze enemies for 5 seconds
-                self.enemy_group.freeze(FREEZE_DURATION)
-                self.player.score += BONUS_SCORE
+        # Play power-up sound for all bonus types
+        sound_manager.play("power_up")
 
-            elif bonus_type == BonusType.TRIPLE_SHOT:
-                # I-block (purple) - triple shot
-                self.player.activate_triple_shot()
-                self.player.score += BONUS_SCORE
+    def _bonus_extra_life(self, _current_time: int):
+        """O-block (cyan) - add 1 life."""
+        self.player.add_life()
 
-            elif bonus_type == BonusType.SHIELD:
-                # S-block (pink) - temporary shield
-                self.player.activate_shield(current_time)
-                self.player.score += BONUS_SCORE
+    def _bonus_freeze_enemies(self, _current_time: int):
+        """T-block (yellow) - freeze enemies for 5 seconds."""
+        self.enemy_group.freeze(FREEZE_DURATION)
 
-            elif bonus_type == BonusType.RAPID_FIRE:
-                # Z-block (green) - rapid fire
-                self.player.activate_rapid_fire(current_time)
-                self.player.score += BONUS_SCORE
+    def _bonus_triple_shot(self, _current_time: int):
+        """I-block (purple) - triple shot."""
+        self.player.activate_triple_shot()
 
-        # Play power-up sound for all bonus types
-        sound_manager.play("power_up")
+    def _bonus_shield(self, current_time: int):
+        """S-block (pink) - temporary shield."""
+        self.player.activate_shield(current_time)
+
+    def _bonus_rapid_fire(self, current_time: int):
+        """Z-block (green) - rapid fire."""
+        self.player.activate_rapid_fire(current_time)
 
     def next_wave(self):
         """Progress to next wave."""
@@ -581,9 +690,11 @@ class Game:
         if self.neon_grid:
             self.neon_grid.draw(self.screen)
 
+        # The starfield, grid and heartbeat move every frame, so only the text
+        # is static; it stays as separate cached blits because one composited
+        # layer would also blend the empty space between the lines
         # Title with neon glow effect
-        NeonText.draw_glowing_text(
-            self.screen,
+        self._draw_cached_text(
             "NEON INVADERS",
             self.big_font,
             (SCREEN_WIDTH // 2, 150),
@@ -592,40 +703,36 @@ class Game:
         )
 
         # High score
-        NeonText.draw_glowing_text(
-            self.screen,
+        self._draw_cached_text(
             f"High Score: {self.high_score}",
             self.font,
             (SCREEN_WIDTH // 2, 250),
             NEON_YELLOW,
         )
 
-        # Instructions with pulsing effect
-        pulse_offset = abs(pygame.time.get_ticks() % 2000 - 1000) / 1000.0
+        # Instructions with pulsing effect, quantized so each step is cached
+        pulse_offset = (abs(pygame.time.get_ticks() % 2000 - 1000) * 16 // 1000) / 16
         start_color = (
             int(NEON_CYAN[0] * (0.7 + 0.3 * pulse_offset)),
             int(NEON_CYAN[1] * (0.7 + 0.3 * pulse_offset)),
             int(NEON_CYAN[2] * (0.7 + 0.3 * pulse_offset)),
         )
 
-        NeonText.draw_glowing_text(
-            self.screen,
+        self._draw_cached_text(
             "Press SPACE to Start",
             self.font,
             (SCREEN_WIDTH // 2, 350),
             start_color,
         )
 
-        NeonText.draw_glowing_text(
-            self.screen,
+        self._draw_cached_text(
             "Press S for Settings",
             self.font,
             (SCREEN_WIDTH // 2, 400),
             NEON_PURPLE,
         )
 
-        NeonText.draw_glowing_text(
-            self.screen,
+        self._draw_cached_text(
             "Press ESC to Quit",
             self.font,
             (SCREEN_WIDTH // 2, 450),
@@ -653,13 +760,11 @@ class Game:
             self.player_trail.draw(self.screen)
 
         # Draw all sprites
-        self.all_sprites.draw(self.screen)
+        self.all_sprites.fast_draw(self.screen)
 
         # Draw shield visual effect with enhanced glow
         if self.player and self.player.shield_active:
-            self.neon_effect.draw_glowing_circle(
-                self.screen, (self.player.rect.centerx, self.player.rect.centery), 35, 3
-            )
+            self._draw_shield(self.player.rect.center)
 
         # Draw rainbow pulses only if particles enabled
         if self.particles_enabled:
@@ -671,7 +776,7 @@ class Game:
                 sparkle.draw(self.screen)
 
         # Draw HUD elements
-        self.hud.render()
+        self.hud.render(self.frame_ticks)
 
         # Draw hearts for lives
         if self.player:
@@ -682,24 +787,79 @@ class Game:
 
         # Draw FPS if enabled
         if self.show_fps:
-            fps_text = self.font.render(
-                f"FPS: {int(self.clock.get_fps())}", True, NEON_ORANGE
+            self.screen.blit(
+                self._get_fps_surface(), (SCREEN_WIDTH - 150, SCREEN_HEIGHT - 30)
             )
-            self.screen.blit(fps_text, (SCREEN_WIDTH - 150, SCREEN_HEIGHT - 30))
+
+    def _draw_shield(self, center: tuple[int, int]):
+        """Draw the player shield from pre-rendered glow rings."""
+        if self._shield_layers is None:
+            # Same rings as NeonEffect.draw_glowing_circle(radius=35, width=3),
+            # rendered once onto ring-sized surfaces instead of full screens
+            self._shield_layers = []
+            for i in range(3):
+                glow_radius = SHIELD_RADIUS + (3 - i) * 3
+                half = glow_radius + 1
+                layer = pygame.Surface((half * 2, half * 2), pygame.SRCALPHA)
+                # Additive glow: the layer alpha is premultiplied into the color
+                color = _premultiply(NEON_CYAN, 30 + i * 20)
+                pygame.draw.circle(layer, color, (half, half), glow_radius, 3)
+                self._shield_layers.append((layer, half))
+
+        cx, cy = center
+        self.screen.blits(
+            [
+                (layer, (cx - half, cy - half), None, pygame.BLEND_RGBA_ADD)
+                for layer, half in self._shield_layers
+            ],
+            doreturn=False,
+        )
+        # Draw the core circle
+        pygame.draw.circle(self.screen, NEON_CYAN, center, SHIELD_RADIUS, 3)
+
+    def _get_fps_surface(self) -> pygame.Surface:
+        """Get the FPS counter surface, rendering each value only once."""
+        fps = int(self.clock.get_fps())
+        surface = self._fps_texts.get(fps)
+        if surface is None:
+            # The counter hovers around a few values; anything else is a spike
+            if len(self._fps_texts) >= 64:
+                self._fps_texts.clear()
+            surface = self.font.render(f"FPS: {fps}", True, NEON_ORANGE)
+            self._fps_texts[fps] = surface
+        return surface
+
+    def _draw_cached_text(
+        self,
+        text: str,
+        font: pygame.font.Font,
+        pos: tuple[int, int],
+        color: tuple[int, int, int],
+        glow_intensity: int = 3,
+    ):
+        """Draw glowing text centered at pos, rendering each variant only once."""
+        text_surface = NeonText.render_glowing_text(text, font, color, glow_intensity)
+        self.screen.blit(text_surface, text_surface.get_rect(center=pos))
+
+    def _get_overlay(self, alpha: int) -> pygame.Surface:
+        """Get a cached full-screen black overlay with the given alpha."""
+        overlay = self._overlays.get(alpha)
+        if overlay is None:
+            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            overlay.set_alpha(alpha)
+            overlay.fill(BLACK)
+            self._overlays[alpha] = overlay
+        return overlay
 
     def draw_paused(self):
         """Draw pause screen."""
         self.draw_game()  # Draw game in background
 
         # Darken screen
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_overlay(128), (0, 0))
 
         # Pause text with glow
-        NeonText.draw_glowing_text(
-            self.screen,
+        self._draw_cached_text(
             "PAUSED",
             self.big_font,
             (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2),
@@ -707,8 +867,7 @@ class Game:
             glow_intensity=4,
         )
 
-        NeonText.draw_glowing_text(
-            self.screen,
+        self._draw_cached_text(
             "Press ESC to Resume | Q to Quit",
             self.font,
             (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 80),
@@ -725,14 +884,10 @@ class Game:
             self.starfield.draw(self.screen)
 
         # Darken background for game over
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(180)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._get_overlay(180), (0, 0))
 
         # Game over text with dramatic glow
-        NeonText.draw_glowing_text(
-            self.screen,
+        self._draw_cached_text(
             "GAME OVER",
             self.big_font,
             (SCREEN_WIDTH // 2, 150),
@@ -742,8 +897,7 @@ class Game:
 
         # Final score
         if self.player:
-            NeonText.draw_glowing_text(
-                self.screen,
+            self._draw_cached_text(
                 f"Final Score: {self.player.score}",
                 self.font,
                 (SCREEN_WIDTH // 2, 250),
@@ -754,16 +908,13 @@ class Game:
             if self.player.score > self.high_score:
                 # Animate new high score with rainbow effect
                 time_offset = pygame.time.get_ticks() / 100
-                hue = int(time_offset * 10) % 360
-                color = pygame.Color(0)
-                color.hsva = (hue, 100, 100, 100)
+                hue = int(time_offset * 10) % 360 // 15 * 15  # 24 cached hues
 
-                NeonText.draw_glowing_text(
-                    self.screen,
+                self._draw_cached_text(
                     "NEW HIGH SCORE!",
                     self.font,
                     (SCREEN_WIDTH // 2, 300),
-                    (color.r, color.g, color.b),
+                    HUE_RGB[hue],
                     glow_intensity=3,
                 )
 
@@ -771,10 +922,9 @@ class Game:
                 if self.particles_enabled and random.random() < 0.3:
                     x = SCREEN_WIDTH // 2 + random.randint(-150, 150)
                     y = 300 + random.randint(-20, 20)
-                    self.sparkle_effects.append(SparkleEffect((x, y)))
+                    self._add_sparkle(x, y)
             else:
-                NeonText.draw_glowing_text(
-                    self.screen,
+                self._draw_cached_text(
                     f"High Score: {self.high_score}",
                     self.font,
                     (SCREEN_WIDTH // 2, 300),
@@ -782,8 +932,7 @@ class Game:
                 )
 
         # Continue text
-        NeonText.draw_glowing_text(
-            self.screen,
+        self._draw_cached_text(
             "Press SPACE to Continue",
             self.font,
             (SCREEN_WIDTH // 2, 400),
@@ -800,8 +949,7 @@ class Game:
         self.draw_game()  # Draw game in background
 
         # Wave clear text with celebration effect
-        NeonText.draw_glowing_text(
-            self.screen,
+        self._draw_cached_text(
             f"WAVE {self.wave} CLEAR!",
             self.big_font,
             (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2),
@@ -809,16 +957,14 @@ class Game:
             glow_intensity=4,
         )
 
-        NeonText.draw_glowing_text(
-            self.screen,
+        self._draw_cached_text(
             f"Wave Bonus: {WAVE_CLEAR_BONUS}",
             self.font,
             (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60),
             NEON_YELLOW,
         )
 
-        NeonText.draw_glowing_text(
-            self.screen,
+        self._draw_cached_text(
             "Press SPACE to Continue",
             self.font,
             (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 100),
@@ -848,27 +994,38 @@ class Game:
 
     def draw(self):
         """Draw appropriate screen based on game state."""
-        if self.state == GameState.MENU:
-            self.draw_menu()
-        elif self.state == GameState.SETTINGS:
-            self.draw_settings()
-        elif self.state == GameState.PLAYING:
-            self.draw_game()
-        elif self.state == GameState.PAUSED:
-            self.draw_paused()
-        elif self.state == GameState.GAME_OVER:
-            self.draw_game_over()
-        elif self.state == GameState.WAVE_CLEAR:
-            self.draw_wave_clear()
-
+        if self.state == GameState.PAUSED:
+            # Nothing moves while paused (update() skips the visual effects),
+            # so once the pause screen has been presented the display
+            # already holds the right pixels
+            if self._paused_frame_presented:
+                return
+            self._paused_frame_presented = True
+        else:
+            self._paused_frame_presented = False
+
+        draw_screen = self._draw_handlers.get(self.state)
+        if draw_screen:
+            draw_screen()
+
+        # Every remaining state repaints the scrolling grid and starfield
+        # across the whole screen, so a full flip is cheaper than tracking
+        # dirty rects that would cover the display anyway
         pygame.display.flip()
 
     def run(self):
         """Main game loop."""
+        # With vsync the flip already waits for the display, so spinning would
+        # only burn CPU; the FPS cap stays so game speed, which is counted in
+        # frames, does not follow high refresh rate monitors
+        if PRECISE_FRAME_PACING and not self.vsync:
+            tick = self.clock.tick_busy_loop
+        else:
+            tick = self.clock.tick
         while self.running:
             self.handle_events()
             self.update()
             self.draw()
-            self.clock.tick(FPS)
+            tick(FPS)
 
         pygame.quit()
@@ -17,6 +17,7 @@ from .config import (
     PLAYER_TRAIL_LENGTH,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
+    SHIELD_RADIUS,
     STAR_COUNT,
     STARS_ENABLED,
     WAVE_CLEAR_BONUS,
@@ -27,9 +28,8 @@ from .game import Game
 from .neon_effects import (
     NeonGrid,
     NeonTrail,
-    RainbowPulse,
-    SparkleEffect,
 )
+from .performance import bonus_pool, effect_pool
 from .performance_optimizations import (
     OptimizedStarField,
     fast_neon,
@@ -38,59 +38,6 @@ from .performance_optimizations import (
 from .sounds import sound_manager
 
 
-class OptimizedNeonGrid(NeonGrid):
-    """Optimized neon grid with cached rendering."""
-
-    def __init__(
-        self,
-        grid_size: int = 50,
-        color: tuple[int, int, int] = NEON_CYAN,
-        alpha: int = 30,
-    ):
-        super().__init__(grid_size, color, alpha)
-        self.grid_surface = pygame.Surface(
-            (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
-        )
-        self.needs_redraw = True
-
-    def update(self):
-        """Update grid animation."""
-        super().update()
-        self.needs_redraw = True
-
-    def draw(self, surface: pygame.Surface):
-        """Draw the animated grid with caching."""
-        if self.needs_redraw:
-            self.grid_surface.fill((0, 0, 0, 0))
-
-            # Draw vertical lines
-            for x in range(0, SCREEN_WIDTH + self.grid_size, self.grid_size):
-                pygame.draw.line(
-                    self.grid_surface,
-                    self.color,
-                    (x, 0),
-                    (x, SCREEN_HEIGHT),
-                    1,
-                )
-
-            # Draw horizontal lines with perspective effect
-            for y in range(0, SCREEN_HEIGHT + self.grid_size, self.grid_size):
-                # Make lines closer together near the bottom (perspective)
-                adjusted_y = int(y + self.offset * (y / SCREEN_HEIGHT))
-                if adjusted_y < SCREEN_HEIGHT:
-                    pygame.draw.line(
-                        self.grid_surface,
-                        self.color,
-                        (0, adjusted_y),
-                        (SCREEN_WIDTH, adjusted_y),
-                        1,
-                    )
-
-            self.needs_redraw = False
-
-        surface.blit(self.grid_surface, (0, 0))
-
-
 class OptimizedNeonTrail(NeonTrail):
     """Optimized trail with reduced rendering."""
 
@@ -99,16 +46,9 @@ class OptimizedNeonTrail(NeonTrail):
         if len(self.trail_points) < 2:
             return
 
-        # Draw trail as a single line strip with varying width
-        points = list(self.trail_points)
-
-        for i in range(1, len(points)):
-            alpha = int(180 * (i / len(points)))
-            width = max(1, int(2 * (i / len(points))))
-
-            # Simple line without multiple glow layers
-            color = (*self.color, alpha)
-            pygame.draw.line(surface, color[:3], points[i - 1], points[i], width)
+        # Simple opaque strip without glow layers; every segment is 1px wide
+        # (2 * i / len < 2), so one draw.lines call covers the whole trail
+        pygame.draw.lines(surface, self.color, False, self.trail_points, 1)
 
 
 class OptimizedGame(Game):
@@ -125,9 +65,7 @@ class OptimizedGame(Game):
             )  # Reduce star count
 
         if NEON_GRID_ENABLED:
-            self.neon_grid = OptimizedNeonGrid(
-                80, NEON_PURPLE, 15
-            )  # Larger grid, less lines
+            self.neon_grid = NeonGrid(80, NEON_PURPLE, 15)  # Larger grid, less lines
 
         if PLAYER_TRAIL_ENABLED:
             self.player_trail = OptimizedNeonTrail(
@@ -152,70 +90,89 @@ class OptimizedGame(Game):
 
         self.menu_heartbeat.update()
 
-        # Update rainbow pulses with limit
-        for pulse in self.rainbow_pulses[:]:
-            pulse.update()
-            if not pulse.active:
-                self.rainbow_pulses.remove(pulse)
-
-        # Limit rainbow pulses
-        if len(self.rainbow_pulses) > self.max_rainbow_pulses:
-            self.rainbow_pulses = self.rainbow_pulses[-self.max_rainbow_pulses :]
+        # Nothing left to update while particles are off (lists were cleared)
+        if not self._particles_enabled:
+            return
 
-        # Update sparkle effects with limit
-        for sparkle in self.sparkle_effects[:]:
-            if self.effect_frame_skip == 0:
+        # Update rainbow pulses with limit, compacting survivors in place
+        pulses = self.rainbow_pulses
+        write = 0
+        for pulse in pulses:
+            pulse.update()
+            if pulse.active:
+                pulses[write] = pulse
+                write += 1
+            else:
+                effect_pool.release_effect(pulse)
+        del pulses[write:]
+
+        # Limit rainbow pulses (keep the newest)
+        self._trim_effects(pulses, self.max_rainbow_pulses)
+
+        # Update sparkle effects with limit, compacting survivors in place
+        sparkles = self.sparkle_effects
+        update_sparkles = self.effect_frame_skip == 0
+        write = 0
+        for sparkle in sparkles:
+            if update_sparkles:
                 sparkle.update()
-            if not sparkle.active:
-                self.sparkle_effects.remove(sparkle)
-
-        # Limit sparkle effects
-        if len(self.sparkle_effects) > self.max_sparkle_effects:
-            self.sparkle_effects = self.sparkle_effects[-self.max_sparkle_effects :]
+            if sparkle.active:
+                sparkles[write] = sparkle
+                write += 1
+            else:
+                effect_pool.release_effect(sparkle)
+        del sparkles[write:]
+
+        # Limit sparkle effects (keep the newest)
+        self._trim_effects(sparkles, self.max_sparkle_effects)
+
+    @staticmethod
+    def _trim_effects(effects: list, limit: int):
+        """Drop the oldest effects beyond a limit, returning them to the pool."""
+        excess = len(effects) - limit
+        if excess > 0:
+            for effect in effects[:excess]:
+                effect_pool.release_effect(effect)
+            del effects[:excess]
 
     def check_collisions(self):
         """Check collisions with optimized particle effects."""
+        # particles_enabled is a property; read it once for the whole pass
+        particles_enabled = self.particles_enabled
+
         # Player bullets hitting enemies
-        for bullet in self.player_bullets:
-            hit_enemies = pygame.sprite.spritecollide(
-                bullet, self.enemy_group.enemies, True
-            )
-            if hit_enemies:
-                bullet.kill()
-                for enemy in hit_enemies:
-                    if self.player:
-                        self.player.score += ENEMY_SCORE
-                    # Register kill for combo system
-                    self.hud.register_kill()
-
-                    # Use optimized particle pool
-                    if self.particles_enabled:
-                        particle_pool.emit(
-                            enemy.rect.centerx, enemy.rect.centery, 5, NEON_ORANGE
-                        )
+        for enemy in self._kill_enemies_hit_by_player_bullets():
+            if self.player:
+                self.player.score += ENEMY_SCORE
+            # Register kill for combo system
+            self.hud.register_kill(self.frame_ticks)
+
+            # Use optimized particle pool
+            if particles_enabled:
+                particle_pool.emit(
+                    enemy.rect.centerx, enemy.rect.centery, 5, NEON_ORANGE
+                )
 
-                    # Play explosion sound
-                    sound_manager.play("explosion")
+            # Play explosion sound
+            sound_manager.play("explosion")
 
-                    # Chance to spawn bonus
-                    if random.random() < BONUS_SPAWN_CHANCE:
-                        bonus = Bonus(enemy.rect.centerx, enemy.rect.centery)
-                        self.bonuses.add(bonus)
-                        self.all_sprites.add(bonus)
-                        # Limit sparkle effects
-                        if (
-                            self.particles_enabled
-                            and len(self.sparkle_effects) < self.max_sparkle_effects
-                        ):
-                            self.sparkle_effects.append(
-                                SparkleEffect((bonus.rect.centerx, bonus.rect.centery))
-                            )
+            # Chance to spawn bonus
+            if random.random() < BONUS_SPAWN_CHANCE:
+                bonus = bonus_pool.get_bonus(
+                    Bonus, enemy.rect.centerx, enemy.rect.centery
+                )
+                self.bonuses.add(bonus)
+                self.all_sprites.add(bonus)
+                # Limit sparkle effects
+                if (
+                    particles_enabled
+                    and len(self.sparkle_effects) < self.max_sparkle_effects
+                ):
+                    self._add_sparkle(bonus.rect.centerx, bonus.rect.centery)
 
         # Enemy bullets hitting player
         if self.player:
-            hit_player = pygame.sprite.spritecollide(
-                self.player, self.enemy_bullets, True
-            )
+            hit_player = self._kill_enemy_bullets_hitting_player()
             if hit_player:
                 if self.player.shield_active:
                     # Play shield hit sound
@@ -226,7 +183,7 @@ class OptimizedGame(Game):
                 self.player.hit()
 
                 # Use optimized particle pool
-                if self.particles_enabled:
+                if particles_enabled:
                     particle_pool.emit(
                         self.player.rect.centerx, self.player.rect.centery, 8, NEON_RED
                     )
@@ -242,12 +199,12 @@ class OptimizedGame(Game):
                 sound_manager.play("bonus_collect")
                 # Add rainbow pulse with limit
                 if (
-                    self.particles_enabled
+                    particles_enabled
                     and len(self.rainbow_pulses) < self.max_rainbow_pulses
                 ):
-                    self.rainbow_pulses.append(
-                        RainbowPulse((bonus.rect.centerx, bonus.rect.centery))
-                    )
+                    self._add_rainbow_pulse(bonus.rect.centerx, bonus.rect.centery)
+                # Return collected bonus to the pool
+                bonus_pool.release_bonus(bonus)
 
     def draw_game(self):
         """Draw game with optimized rendering."""
@@ -263,21 +220,23 @@ class OptimizedGame(Game):
             self.player_trail.draw(self.screen)
 
         # Draw all sprites
-        self.all_sprites.draw(self.screen)
+        self.all_sprites.fast_draw(self.screen)
 
         # Draw shield with optimized glow
         if self.player and self.player.shield_active:
             fast_neon.draw_fast_glow_circle(
                 self.screen,
                 (self.player.rect.centerx, self.player.rect.centery),
-                35,
+                SHIELD_RADIUS,
                 NEON_CYAN,
             )
 
         # Update and draw particle pool
         if self.particles_enabled:
-            particle_pool.update()
-            particle_pool.draw(self.screen)
+            # Most frames have no live particles; skip scanning the pool
+            if particle_pool.has_live():
+                particle_pool.update()
+                particle_pool.draw(self.screen)
 
             # Draw rainbow pulses
             for pulse in self.rainbow_pulses:
@@ -288,7 +247,7 @@ class OptimizedGame(Game):
                 sparkle.draw(self.screen)
 
         # Draw HUD elements
-        self.hud.render()
+        self.hud.render(self.frame_ticks)
 
         # Draw hearts for lives
         if self.player:
@@ -299,10 +258,9 @@ class OptimizedGame(Game):
 
         # Draw FPS if enabled
         if self.show_fps:
-            fps_text = self.font.render(
-                f"FPS: {int(self.clock.get_fps())}", True, NEON_ORANGE
+            self.screen.blit(
+                self._get_fps_surface(), (SCREEN_WIDTH - 150, SCREEN_HEIGHT - 30)
             )
-            self.screen.blit(fps_text, (SCREEN_WIDTH - 150, SCREEN_HEIGHT - 30))
 
     def _handle_wave_clear(self):
         """Handle wave clear with limited particles."""
@@ -316,4 +274,4 @@ class OptimizedGame(Game):
                 x = random.randint(100, SCREEN_WIDTH - 100)
                 y = random.randint(100, SCREEN_HEIGHT - 100)
                 if len(self.sparkle_effects) < self.max_sparkle_effects:
-                    self.sparkle_effects.append(SparkleEffect((x, y)))
+                    self._add_sparkle(x, y)
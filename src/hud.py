@@ -2,6 +2,7 @@
 
 import math
 
+import numpy as np
 import pygame
 
 from .config import (
@@ -17,12 +18,15 @@ from .config import (
     SCREEN_WIDTH,
     SHIELD_DURATION,
 )
+from .particle_kernels import project_points
 from .sprites import sprite_cache
 
 
 class AnimatedText:
     """Text that can animate with various effects."""
 
+    CACHE_SIZE = 8  # Finished surfaces kept per text
+
     def __init__(
         self,
         text: str,
@@ -44,19 +48,29 @@ class AnimatedText:
         self.effect_duration = 0
         self.effect_start_time = 0
         self.align = align  # "center" or "left"
-
-    def start_effect(self, effect: str, duration: int = 1000):
+        # Last rendered surface, reused until the text or color changes
+        self._surface: pygame.Surface | None = None
+        self._surface_key: tuple | None = None
+        # Finished surfaces by (text, color, scale, alpha)
+        self._cache: dict[tuple, pygame.Surface] = {}
+
+    def start_effect(
+        self, effect: str, duration: int = 1000, current_time: int | None = None
+    ):
         """Start an animation effect."""
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
         self.effect = effect
         self.effect_duration = duration
-        self.effect_start_time = pygame.time.get_ticks()
+        self.effect_start_time = current_time
 
-    def update(self):
+    def update(self, current_time: int | None = None):
         """Update animation state."""
         if not self.effect:
             return
 
-        current_time = pygame.time.get_ticks()
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
         elapsed = current_time - self.effect_start_time
         progress = min(elapsed / self.effect_duration, 1.0)
 
@@ -88,17 +102,37 @@ class AnimatedText:
             self.pos = self.base_pos
             self.color = self.base_color
 
-    def render(self, screen: pygame.Surface):
-        """Render the animated text."""
-        text_surface = self.font.render(self.text, True, self.color)
-
-        if self.scale != 1.0:
-            width = int(text_surface.get_width() * self.scale)
-            height = int(text_surface.get_height() * self.scale)
+    def _render_scaled(self, scale: float) -> pygame.Surface:
+        """Build the text surface for a scale and the current alpha."""
+        base_key = (self.text, self.color)
+        if self._surface is None or base_key != self._surface_key:
+            self._surface = self.font.render(self.text, True, self.color)
+            self._surface_key = base_key
+        text_surface = self._surface
+
+        if scale != 1.0:
+            width = int(text_surface.get_width() * scale)
+            height = int(text_surface.get_height() * scale)
             text_surface = pygame.transform.scale(text_surface, (width, height))
 
         if self.alpha < 255:
+            # Fade a copy so the unscaled surface stays fully opaque
+            if text_surface is self._surface:
+                text_surface = text_surface.copy()
             text_surface.set_alpha(self.alpha)
+        return text_surface
+
+    def render(self, screen: pygame.Surface):
+        """Render the animated text."""
+        scale = round(self.scale, 2)
+        key = (self.text, self.color, scale, self.alpha)
+        text_surface = self._cache.get(key)
+        if text_surface is None:
+            text_surface = self._render_scaled(scale)
+            # Evict the oldest entry once the cache is full
+            if len(self._cache) >= self.CACHE_SIZE:
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = text_surface
 
         if self.align == "left":
             rect = text_surface.get_rect(topleft=self.pos)
@@ -124,8 +158,13 @@ class HUD:
             "Wave: 1", self.font, NEON_YELLOW, (SCREEN_WIDTH - 100, 30)
         )
 
-        # Bonus indicators
-        self.bonus_indicators: list[dict] = []
+        # Bonus indicators, one parallel list per field
+        self._ind_icon: list[str] = []
+        self._ind_text: list[str] = []
+        self._ind_color: list[tuple] = []
+        self._ind_pos: list[tuple[int, int]] = []
+        self._ind_progress: list[float] = []
+        self._indicator_texts: dict[tuple, pygame.Surface] = {}  # Label surfaces
 
         # Score change animation
         self.score_change_texts: list[tuple] = []
@@ -134,47 +173,70 @@ class HUD:
         # Wave transition
         self.wave_transition_text: AnimatedText | None = None
 
+        self.last_wave = 1
+
         # Combo system
         self.combo_count = 0
+        self._combo_surface: pygame.Surface | None = None
+        self._combo_surface_count = 0
         self.combo_timer = 0
         self.last_kill_time = 0
 
-    def update(self, player, wave: int, enemy_group):  # noqa: ARG002
+    def update(
+        self,
+        player,
+        wave: int,
+        enemy_group,  # noqa: ARG002
+        current_time: int | None = None,
+    ):
         """Update HUD elements."""
+        # One clock sample shared by every animation this frame
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
+
         # Update score with animation
         if player and player.score != self.last_score:
             score_diff = player.score - self.last_score
             self.last_score = player.score
+            # Rendered once per change; a whole-string Font.render measured
+            # faster than composing cached digit glyphs and keeps the kerning
             self.score_text.text = f"Score: {player.score}"
-            self.score_text.start_effect("pulse", 500)
+            self.score_text.start_effect("pulse", 500, current_time)
 
             # Add floating score change
-            self.add_score_change(score_diff)
+            self.add_score_change(score_diff, current_time)
 
         # Update wave
-        self.wave_text.text = f"Wave: {wave}"
+        if wave != self.last_wave:
+            self.last_wave = wave
+            self.wave_text.text = f"Wave: {wave}"
 
         # Update animations
-        self.score_text.update()
-        self.wave_text.update()
-
-        # Update floating score texts
-        current_time = pygame.time.get_ticks()
-        self.score_change_texts = [
-            (text, pos, start_time, value)
-            for text, pos, start_time, value in self.score_change_texts
-            if current_time - start_time < 2000
-        ]
+        self.score_text.update(current_time)
+        self.wave_text.update(current_time)
+
+        # Update floating score texts; they are added in time order, so the
+        # expired ones are always at the front and can be dropped in place
+        texts = self.score_change_texts
+        expired = 0
+        for _text, _pos, start_time, _value in texts:
+            if current_time - start_time < 2000:
+                break
+            expired += 1
+        if expired:
+            del texts[:expired]
 
         # Update combo timer
         if current_time - self.last_kill_time > 2000:
             self.combo_count = 0
 
         # Update bonus indicators
-        self.update_bonus_indicators(player)
+        self.update_bonus_indicators(player, current_time)
 
-    def add_score_change(self, value: int):
+    def add_score_change(self, value: int, current_time: int | None = None):
         """Add a floating score change indicator."""
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
         if value > 0:
             text = f"+{value}"
             color = NEON_GREEN
@@ -184,65 +246,86 @@ class HUD:
 
         surface = self.small_font.render(text, True, color)
         pos = [20, 55]  # Position score changes below the score text
-        self.score_change_texts.append((surface, pos, pygame.time.get_ticks(), value))
+        self.score_change_texts.append((surface, pos, current_time, value))
 
-    def register_kill(self):
+    def register_kill(self, current_time: int | None = None):
         """Register an enemy kill for combo tracking."""
-        current_time = pygame.time.get_ticks()
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
         if current_time - self.last_kill_time < 2000:  # 2 second combo window
             self.combo_count += 1
         else:
             self.combo_count = 1
         self.last_kill_time = current_time
 
-    def update_bonus_indicators(self, player):
+    @property
+    def bonus_indicators(self) -> list[dict]:
+        """Active bonus indicators as one dict per indicator."""
+        return [
+            {"icon": icon, "text": text, "color": color, "pos": pos, "progress": prog}
+            for icon, text, color, pos, prog in zip(
+                self._ind_icon,
+                self._ind_text,
+                self._ind_color,
+                self._ind_pos,
+                self._ind_progress,
+                strict=True,
+            )
+        ]
+
+    def _add_indicator(
+        self, icon: str, text: str, color: tuple, pos: tuple[int, int], progress: float
+    ):
+        """Append one bonus indicator to the parallel field lists."""
+        self._ind_icon.append(icon)
+        self._ind_text.append(text)
+        self._ind_color.append(color)
+        self._ind_pos.append(pos)
+        self._ind_progress.append(progress)
+
+    def update_bonus_indicators(self, player, current_time: int | None = None):
         """Update active bonus indicators."""
-        self.bonus_indicators.clear()
+        self._ind_icon.clear()
+        self._ind_text.clear()
+        self._ind_color.clear()
+        self._ind_pos.clear()
+        self._ind_progress.clear()
 
         if not player:
             return
 
         y_offset = 70
-        current_time = pygame.time.get_ticks()
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
 
         # Shield indicator
         if player.shield_active and current_time < player.shield_end_time:
             remaining = (player.shield_end_time - current_time) / 1000
-            self.bonus_indicators.append(
-                {
-                    "icon": "shield",
-                    "text": f"Shield: {remaining:.1f}s",
-                    "color": NEON_CYAN,
-                    "pos": (20, y_offset),
-                    "progress": remaining / (SHIELD_DURATION / 1000),
-                }
+            self._add_indicator(
+                "shield",
+                f"Shield: {remaining:.1f}s",
+                NEON_CYAN,
+                (20, y_offset),
+                remaining / (SHIELD_DURATION / 1000),
             )
             y_offset += 35
 
         # Rapid fire indicator
         if player.rapid_fire_active and current_time < player.rapid_fire_end_time:
             remaining = (player.rapid_fire_end_time - current_time) / 1000
-            self.bonus_indicators.append(
-                {
-                    "icon": "rapid",
-                    "text": f"Rapid Fire: {remaining:.1f}s",
-                    "color": NEON_GREEN,
-                    "pos": (20, y_offset),
-                    "progress": remaining / (RAPID_FIRE_DURATION / 1000),
-                }
+            self._add_indicator(
+                "rapid",
+                f"Rapid Fire: {remaining:.1f}s",
+                NEON_GREEN,
+                (20, y_offset),
+                remaining / (RAPID_FIRE_DURATION / 1000),
             )
             y_offset += 35
 
         # Triple shot indicator
         if player.triple_shot_active:
-            self.bonus_indicators.append(
-                {
-                    "icon": "triple",
-                    "text": "Triple Shot Ready!",
-                    "color": NEON_PURPLE,
-                    "pos": (20, y_offset),
-                    "progress": 1.0,
-                }
+            self._add_indicator(
+                "triple", "Triple Shot Ready!", NEON_PURPLE, (20, y_offset), 1.0
             )
             y_offset += 35
 
@@ -256,14 +339,27 @@ class HUD:
         )
         self.wave_transition_text.start_effect("fade_in", 1000)
 
-    def render(self):
+    def _get_indicator_text(self, text: str, color: tuple) -> pygame.Surface:
+        """Get a bonus indicator label, rendering it only when it changes."""
+        key = (text, color)
+        surface = self._indicator_texts.get(key)
+        if surface is None:
+            # Countdown labels change every 0.1s, so drop stale ones in bulk
+            if len(self._indicator_texts) >= 32:
+                self._indicator_texts.clear()
+            surface = self.small_font.render(text, True, color)
+            self._indicator_texts[key] = surface
+        return surface
+
+    def render(self, current_time: int | None = None):
         """Render all HUD elements."""
         # Draw main HUD elements
         self.score_text.render(self.screen)
         self.wave_text.render(self.screen)
 
         # Draw floating score changes
-        current_time = pygame.time.get_ticks()
+        if current_time is None:
+            current_time = pygame.time.get_ticks()
         for text_surface, pos, start_time, _value in self.score_change_texts:
             age = current_time - start_time
             # Float upward and fade out
@@ -274,40 +370,44 @@ class HUD:
 
         # Draw combo indicator
         if self.combo_count > 1:
-            combo_text = self.font.render(
-                f"COMBO x{self.combo_count}!", True, NEON_ORANGE
-            )
+            # Only re-render when the combo count changes
+            combo_text = self._combo_surface
+            if combo_text is None or self._combo_surface_count != self.combo_count:
+                combo_text = self.font.render(
+                    f"COMBO x{self.combo_count}!", True, NEON_ORANGE
+                )
+                self._combo_surface = combo_text
+                self._combo_surface_count = self.combo_count
             combo_rect = combo_text.get_rect(center=(SCREEN_WIDTH // 2, 100))
             self.screen.blit(combo_text, combo_rect)
 
         # Draw bonus indicators with progress bars
-        for indicator in self.bonus_indicators:
+        bar_width = 100
+        bar_height = 4
+        for text, color, pos, progress in zip(
+            self._ind_text,
+            self._ind_color,
+            self._ind_pos,
+            self._ind_progress,
+            strict=True,
+        ):
             # Draw icon or text
-            text = self.small_font.render(indicator["text"], True, indicator["color"])
-            self.screen.blit(text, indicator["pos"])
+            self.screen.blit(self._get_indicator_text(text, color), pos)
 
             # Draw progress bar
-            bar_width = 100
-            bar_height = 4
-            bar_x = indicator["pos"][0]
-            bar_y = indicator["pos"][1] + 25
-
-            # Background
-            pygame.draw.rect(
-                self.screen,
-                (*indicator["color"], 64),
-                (bar_x, bar_y, bar_width, bar_height),
-            )
+            bar_x, bar_y = pos
+            bar_y += 25
+            fill_width = int(bar_width * progress)
+
+            # Background, hidden anyway once the bar is full
+            if fill_width < bar_width:
+                self.screen.fill((*color, 64), (bar_x, bar_y, bar_width, bar_height))
             # Progress
-            pygame.draw.rect(
-                self.screen,
-                indicator["color"],
-                (bar_x, bar_y, int(bar_width * indicator["progress"]), bar_height),
-            )
+            self.screen.fill(color, (bar_x, bar_y, fill_width, bar_height))
 
         # Draw wave transition if active
         if self.wave_transition_text:
-            self.wave_transition_text.update()
+            self.wave_transition_text.update(current_time)
             self.wave_transition_text.render(self.screen)
             if not self.wave_transition_text.effect:
                 self.wave_transition_text = None
@@ -323,42 +423,71 @@ class HUD:
 class MinimapHUD:
     """Mini radar showing enemy positions."""
 
+    ENEMY_COLOR = (*NEON_PINK, 200)
+    ELITE_COLOR = (*NEON_RED, 200)
+    REFRESH_INTERVAL = 4  # Rebuild every 4th frame (15 Hz at 60 FPS)
+
     def __init__(self, screen: pygame.Surface):
         self.screen = screen
         self.width = 120  # 20% smaller (150 * 0.8)
         self.height = 80  # 20% smaller (100 * 0.8)
         self.x = SCREEN_WIDTH - self.width - 10
         self.y = SCREEN_HEIGHT - self.height - 10  # Bottom right
+        # Screen -> minimap scale factors for x and y
+        self._scale_x = self.width / SCREEN_WIDTH
+        self._scale_y = self.height / SCREEN_HEIGHT
 
-    def render(self, enemy_group, player):
-        """Render the minimap."""
-        # Create a surface with per-pixel alpha for transparency
-        minimap_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-
+        # Static background and border, drawn once
+        self._bg_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         # Background with 50% transparency
         pygame.draw.rect(
-            minimap_surface, (*NEON_CYAN, 16), (0, 0, self.width, self.height)
+            self._bg_surface, (*NEON_CYAN, 16), (0, 0, self.width, self.height)
         )
         pygame.draw.rect(
-            minimap_surface, (*NEON_CYAN, 128), (0, 0, self.width, self.height), 2
+            self._bg_surface, (*NEON_CYAN, 128), (0, 0, self.width, self.height), 2
         )
+        # Per-frame surface with per-pixel alpha, reused between frames
+        self._surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+        self._frame_counter = 0
+        self._enemy_count = -1  # Enemy count shown by the last rebuild
 
-        # Scale factors
-        scale_x = self.width / SCREEN_WIDTH
-        scale_y = self.height / SCREEN_HEIGHT
+    def render(self, enemy_group, player):
+        """Render the minimap, rebuilding it at a reduced rate."""
+        # Markers move less than a pixel per frame at this scale, so only
+        # rebuild periodically or when an enemy dies or a wave spawns
+        self._frame_counter = (self._frame_counter + 1) % self.REFRESH_INTERVAL
+        enemy_count = len(enemy_group.enemies)
+        if self._frame_counter == 1 or enemy_count != self._enemy_count:
+            self._enemy_count = enemy_count
+            self._rebuild(enemy_group, player)
+
+        # Blit the minimap surface with transparency
+        self.screen.blit(self._surface, (self.x, self.y))
+
+    def _rebuild(self, enemy_group, player):
+        """Redraw the enemy and player markers onto the minimap surface."""
+        # Start from the cached background instead of redrawing it
+        minimap_surface = self._surface
+        minimap_surface.fill((0, 0, 0, 0))
+        minimap_surface.blit(self._bg_surface, (0, 0))
 
-        # Draw enemies
-        for enemy in enemy_group.enemies:
-            x = int(enemy.rect.centerx * scale_x)
-            y = int(enemy.rect.centery * scale_y)
-            color = (*NEON_RED, 200) if enemy.is_elite else (*NEON_PINK, 200)
-            pygame.draw.circle(minimap_surface, color, (x, y), 2)
+        # Scale factors
+        scale_x, scale_y = self._scale_x, self._scale_y
+
+        # Draw enemies, projecting all positions onto the minimap at once
+        enemies = list(enemy_group.enemies)
+        if enemies:
+            centers = np.array(
+                [(enemy.rect.centerx, enemy.rect.centery) for enemy in enemies],
+                dtype=np.float64,
+            )
+            points = project_points(centers, scale_x, scale_y).tolist()
+            for enemy, point in zip(enemies, points, strict=True):
+                color = self.ELITE_COLOR if enemy.is_elite else self.ENEMY_COLOR
+                pygame.draw.circle(minimap_surface, color, point, 2)
 
         # Draw player
         if player:
             x = int(player.rect.centerx * scale_x)
             y = int(player.rect.centery * scale_y)
             pygame.draw.circle(minimap_surface, (*NEON_GREEN, 255), (x, y), 3)
-
-        # Blit the minimap surface with transparency
-        self.screen.blit(minimap_surface, (self.x, self.y))
@@ -1,9 +1,11 @@
 """Neon visual effects for the retro game."""
 
+import functools
 import math
 import random
-from typing import Any
+from collections import deque
 
+import numpy as np
 import pygame
 
 from .config import (
@@ -19,6 +21,60 @@ from .config import (
     SCREEN_WIDTH,
     STAR_COUNT,
 )
+from .particle_kernels import step_particles
+
+# One full sine period in 1024 steps, indexed by integer phase (& _SIN_MASK)
+_SIN_STEPS = 1024
+_SIN_MASK = _SIN_STEPS - 1
+_SIN_LUT = np.sin(np.linspace(0, 2 * math.pi, _SIN_STEPS, endpoint=False)).astype(
+    np.float32
+)
+# Python floats for scalar lookups, which are slow on NumPy arrays
+_SIN_LIST: list[float] = _SIN_LUT.tolist()
+_COS_OFFSET = _SIN_STEPS // 4  # cos(a) == sin(a + pi / 2)
+# Star twinkle advances ~0.1 rad per frame
+_TWINKLE_STEP = 16
+
+# Shared scratch surfaces for glow layers, keyed by power-of-two size
+_scratch_surfaces: dict[tuple[int, int], pygame.Surface] = {}
+
+
+def _get_scratch(size: tuple[int, int]) -> pygame.Surface:
+    """Get a shared SRCALPHA surface cleared and clipped to its top-left `size`."""
+    width, height = size
+    key = (1 << max(width - 1, 0).bit_length(), 1 << max(height - 1, 0).bit_length())
+    scratch = _scratch_surfaces.get(key)
+    if scratch is None:
+        scratch = pygame.Surface(key, pygame.SRCALPHA)
+        _scratch_surfaces[key] = scratch
+    # Clip drawing to the requested size, as if the surface were exactly that big
+    scratch.set_clip((0, 0, width, height))
+    scratch.fill((0, 0, 0, 0))
+    return scratch
+
+
+def _draw_translucent_circle(
+    surface: pygame.Surface,
+    color,
+    center: tuple[int, int],
+    radius: int,
+    width: int = 0,
+):
+    """Blend a translucent circle onto surface through the shared scratch."""
+    pad = radius + 2
+    bounds = pygame.Rect(center[0] - pad, center[1] - pad, pad * 2 + 1, pad * 2 + 1)
+    if not surface.get_rect().contains(bounds):
+        # Keep clipped circles rasterized exactly as on a target-sized surface
+        bounds = surface.get_rect()
+    scratch = _get_scratch(bounds.size)
+    local_center = (center[0] - bounds.x, center[1] - bounds.y)
+    pygame.draw.circle(scratch, color, local_center, radius, width)
+    surface.blit(scratch, bounds, pygame.Rect((0, 0), bounds.size))
+
+
+def _premultiply(color: tuple[int, int, int], alpha: int) -> tuple[int, int, int]:
+    """Scale a color by alpha for additive (BLEND_RGBA_ADD) glow layers."""
+    return (color[0] * alpha // 255, color[1] * alpha // 255, color[2] * alpha // 255)
 
 
 class NeonEffect:
@@ -51,18 +107,31 @@ class NeonEffect:
         width: int = 2,
     ):
         """Draw a line with neon glow effect."""
+        # Each glow layer is drawn on a scratch surface covering only the line
+        pad = width + 8
+        bounds = pygame.Rect(
+            min(start_pos[0], end_pos[0]) - pad,
+            min(start_pos[1], end_pos[1]) - pad,
+            abs(end_pos[0] - start_pos[0]) + pad * 2,
+            abs(end_pos[1] - start_pos[1]) + pad * 2,
+        )
+        if not surface.get_rect().contains(bounds):
+            # Lines are clipped to the target before rasterizing, so ones that
+            # leave it need a target-sized scratch to keep the same pixels
+            bounds = surface.get_rect()
+        local_start = (start_pos[0] - bounds.x, start_pos[1] - bounds.y)
+        local_end = (end_pos[0] - bounds.x, end_pos[1] - bounds.y)
+        area = pygame.Rect((0, 0), bounds.size)
+
         # Draw the glow
         for i in range(3):
             glow_width = width + (3 - i) * 2
             alpha = 50 + i * 30
-            glow_color = (*self.color, alpha)
+            glow_color = _premultiply(self.color, alpha)
 
-            # Create a temporary surface for the glow
-            temp_surface = pygame.Surface(
-                (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
-            )
-            pygame.draw.line(temp_surface, glow_color, start_pos, end_pos, glow_width)
-            surface.blit(temp_surface, (0, 0))
+            scratch = _get_scratch(bounds.size)
+            pygame.draw.line(scratch, glow_color, local_start, local_end, glow_width)
+            surface.blit(scratch, bounds, area, pygame.BLEND_RGBA_ADD)
 
         # Draw the core line
         pygame.draw.line(surface, self.color, start_pos, end_pos, width)
@@ -75,17 +144,20 @@ class NeonEffect:
         width: int = 0,
     ):
         """Draw a circle with neon glow effect."""
+        # Each glow layer is drawn on a scratch surface covering only the circle
+        pad = radius + 10
+        bounds = pygame.Rect(center[0] - pad, center[1] - pad, pad * 2, pad * 2)
+        area = pygame.Rect((0, 0), bounds.size)
+
         # Draw the glow layers
         for i in range(3):
             glow_radius = radius + (3 - i) * 3
             alpha = 30 + i * 20
-            glow_color = (*self.color, alpha)
+            glow_color = _premultiply(self.color, alpha)
 
-            temp_surface = pygame.Surface(
-                (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
-            )
-            pygame.draw.circle(temp_surface, glow_color, center, glow_radius, width)
-            surface.blit(temp_surface, (0, 0))
+            scratch = _get_scratch(bounds.size)
+            pygame.draw.circle(scratch, glow_color, (pad, pad), glow_radius, width)
+            surface.blit(scratch, bounds, area, pygame.BLEND_RGBA_ADD)
 
         # Draw the core circle
         pygame.draw.circle(surface, self.color, center, radius, width)
@@ -98,23 +170,24 @@ class NeonEffect:
         border_radius: int = 0,
     ):
         """Draw a rectangle with neon glow effect."""
+        # Each glow layer is drawn on a scratch surface covering only the rect
+        bounds = rect.inflate(20, 20)
+        area = pygame.Rect((0, 0), bounds.size)
+
         # Draw glow layers
         for i in range(3):
             glow_size = (3 - i) * 3
             glow_rect = rect.inflate(glow_size * 2, glow_size * 2)
+            glow_rect.move_ip(-bounds.x, -bounds.y)
             alpha = 30 + i * 20
-            glow_color = (*self.color, alpha)
+            glow_color = _premultiply(self.color, alpha)
 
-            temp_surface = pygame.Surface(
-                (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
-            )
+            scratch = _get_scratch(bounds.size)
             if border_radius > 0:
-                pygame.draw.rect(
-                    temp_surface, glow_color, glow_rect, width, border_radius
-                )
+                pygame.draw.rect(scratch, glow_color, glow_rect, width, border_radius)
             else:
-                pygame.draw.rect(temp_surface, glow_color, glow_rect, width)
-            surface.blit(temp_surface, (0, 0))
+                pygame.draw.rect(scratch, glow_color, glow_rect, width)
+            surface.blit(scratch, bounds, area, pygame.BLEND_RGBA_ADD)
 
         # Draw the core rectangle
         if border_radius > 0:
@@ -129,54 +202,56 @@ class NeonTrail:
     def __init__(self, color: tuple[int, int, int], max_length: int = 10):
         self.color = color
         self.max_length = max_length
-        self.trail_points: list[tuple[int, int]] = []
+        # Appending to a full deque drops the oldest point in O(1)
+        self.trail_points: deque[tuple[int, int]] = deque(maxlen=max_length)
 
     def add_point(self, pos: tuple[int, int]):
         """Add a point to the trail."""
         self.trail_points.append(pos)
-        if len(self.trail_points) > self.max_length:
-            self.trail_points.pop(0)
 
     def draw(self, surface: pygame.Surface):
         """Draw the neon trail."""
-        if len(self.trail_points) < 2:
+        points = self.trail_points
+        if len(points) < 2:
             return
 
-        for i in range(1, len(self.trail_points)):
+        # Segments are drawn on a shared scratch covering only the trail; the
+        # widest glow line is 7px, so a 10px margin holds every segment
+        xs = [p[0] for p in points]
+        ys = [p[1] for p in points]
+        pad = 10
+        bounds = pygame.Rect(
+            min(xs) - pad,
+            min(ys) - pad,
+            max(xs) - min(xs) + pad * 2,
+            max(ys) - min(ys) + pad * 2,
+        )
+        if not surface.get_rect().contains(bounds):
+            # Lines are clipped to the target before rasterizing, so trails
+            # that leave it need a target-sized scratch to keep the same pixels
+            bounds = surface.get_rect()
+        local = [(x - bounds.x, y - bounds.y) for x, y in points]
+        area = pygame.Rect((0, 0), bounds.size)
+
+        for i in range(1, len(points)):
             # Calculate alpha based on position in trail
-            alpha = int(255 * (i / len(self.trail_points)) * 0.5)
-            width = max(1, int(3 * (i / len(self.trail_points))))
+            alpha = int(255 * (i / len(points)) * 0.5)
+            width = max(1, int(3 * (i / len(points))))
 
             # Draw glow
             glow_alpha = alpha // 3
             glow_width = width + 4
-            glow_color = (*self.color, glow_alpha)
+            glow_color = _premultiply(self.color, glow_alpha)
 
-            temp_surface = pygame.Surface(
-                (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
-            )
-            pygame.draw.line(
-                temp_surface,
-                glow_color,
-                self.trail_points[i - 1],
-                self.trail_points[i],
-                glow_width,
-            )
-            surface.blit(temp_surface, (0, 0))
+            scratch = _get_scratch(bounds.size)
+            pygame.draw.line(scratch, glow_color, local[i - 1], local[i], glow_width)
+            surface.blit(scratch, bounds, area, pygame.BLEND_RGBA_ADD)
 
             # Draw core line
             color = (*self.color, alpha)
-            temp_surface = pygame.Surface(
-                (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
-            )
-            pygame.draw.line(
-                temp_surface,
-                color,
-                self.trail_points[i - 1],
-                self.trail_points[i],
-                width,
-            )
-            surface.blit(temp_surface, (0, 0))
+            scratch = _get_scratch(bounds.size)
+            pygame.draw.line(scratch, color, local[i - 1], local[i], width)
+            surface.blit(scratch, bounds, area)
 
     def clear(self):
         """Clear the trail."""
@@ -223,74 +298,33 @@ class NeonPulse:
             if radius > 0:
                 alpha = max(0, self.alpha - i * 50)
                 color = (*self.color, alpha)
+                _draw_translucent_circle(surface, color, self.center, radius, 2)
 
-                temp_surface = pygame.Surface(
-                    (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
-                )
-                pygame.draw.circle(temp_surface, color, self.center, radius, 2)
-                surface.blit(temp_surface, (0, 0))
-
-
-class NeonParticle:
-    """Individual neon particle for particle effects."""
-
-    def __init__(
-        self,
-        pos: tuple[int, int],
-        velocity: tuple[float, float],
-        color: tuple[int, int, int],
-        lifetime: int = 60,
-        size: int = 3,
-    ):
-        self.pos = [float(pos[0]), float(pos[1])]
-        self.velocity = [float(velocity[0]), float(velocity[1])]
-        self.color = color
-        self.lifetime = lifetime
-        self.max_lifetime = lifetime
-        self.size = size
-        self.active = True
-
-    def update(self):
-        """Update particle position and lifetime."""
-        if not self.active:
-            return
 
-        self.pos[0] += self.velocity[0]
-        self.pos[1] += self.velocity[1]
-        self.lifetime -= 1
+# Particle circles by (color, radius, alpha), shared by every particle
+_particle_sprites: dict[tuple, pygame.Surface] = {}
 
-        # Add slight gravity effect
-        self.velocity[1] += 0.1
 
-        if self.lifetime <= 0:
-            self.active = False
+def _quantize_alpha(alpha):
+    """Round alpha (an int or int array) to the nearest multiple of 16.
 
-    def draw(self, surface: pygame.Surface):
-        """Draw the particle with glow."""
-        if not self.active:
-            return
-
-        # Make particles more transparent
-        alpha = int(110 * (self.lifetime / self.max_lifetime))  # Reduced from 255
-
-        # Draw glow
-        glow_size = self.size + 3
-        glow_alpha = alpha // 4  # More transparent glow
-        glow_color = (*self.color, glow_alpha)
+    Alphas from 248 up round down to 240 instead of wrapping around to 0.
+    """
+    # Fewer distinct alphas means fewer cached sprites and more sharing
+    return np.minimum(alpha + 8, 255) & 0xF0
 
-        temp_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.circle(
-            temp_surface, glow_color, (int(self.pos[0]), int(self.pos[1])), glow_size
-        )
-        surface.blit(temp_surface, (0, 0))
 
-        # Draw core
-        color = (*self.color, alpha)
-        temp_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.circle(
-            temp_surface, color, (int(self.pos[0]), int(self.pos[1])), self.size
-        )
-        surface.blit(temp_surface, (0, 0))
+def _get_particle_sprite(
+    color: tuple[int, int, int], radius: int, alpha: int = 255
+) -> pygame.Surface:
+    """Get a pre-drawn translucent circle centered at (radius, radius)."""
+    key = (color, radius, alpha)
+    sprite = _particle_sprites.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((radius * 2 + 1, radius * 2 + 1), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (*color, alpha), (radius, radius), radius)
+        _particle_sprites[key] = sprite
+    return sprite
 
 
 class NeonExplosion:
@@ -303,49 +337,77 @@ class NeonExplosion:
         particle_count: int | None = None,
     ):
         self.center = center
-        self.particles = []
+        self.color = color
 
         # Use config value if particle_count not specified
         if particle_count is None:
             particle_count = PARTICLE_COUNT
 
-        # Create particles
-        for _ in range(particle_count):
-            angle = random.uniform(0, 2 * math.pi)
-            speed = random.uniform(1, 5)
-            velocity = (
-                math.cos(angle) * speed,
-                math.sin(angle) * speed - 2,  # Slight upward bias
-            )
-
-            # Vary particle properties
-            size = random.randint(2, 4)
-            lifetime = random.randint(30, 60)
+        # Particle state as parallel arrays, stepped together each frame
+        angle = np.random.uniform(0, 2 * math.pi, particle_count)
+        speed = np.random.uniform(1, 5, particle_count)
+        self.pos_x = np.full(particle_count, float(center[0]))
+        self.pos_y = np.full(particle_count, float(center[1]))
+        self.vx = np.cos(angle) * speed
+        self.vy = np.sin(angle) * speed - 2  # Slight upward bias
 
-            particle = NeonParticle(center, velocity, color, lifetime, size)
-            self.particles.append(particle)
+        # Vary particle properties
+        self.size = np.random.randint(2, 5, particle_count)
+        self.life = np.random.randint(30, 61, particle_count)
+        self.max_life = self.life.copy()
 
         # Also create a pulse effect
         self.pulse = NeonPulse(center, color, max_radius=30, speed=3)
 
     def update(self):
         """Update all particles and effects."""
-        for particle in self.particles:
-            particle.update()
+        step_particles(self.pos_x, self.pos_y, self.vx, self.vy, self.life)
         self.pulse.update()
 
-        # Remove inactive particles
-        self.particles = [p for p in self.particles if p.active]
+        # Remove expired particles
+        alive = self.life > 0
+        if not alive.all():
+            self.pos_x = self.pos_x[alive]
+            self.pos_y = self.pos_y[alive]
+            self.vx = self.vx[alive]
+            self.vy = self.vy[alive]
+            self.size = self.size[alive]
+            self.life = self.life[alive]
+            self.max_life = self.max_life[alive]
 
     def draw(self, surface: pygame.Surface):
         """Draw the explosion effect."""
         self.pulse.draw(surface)
-        for particle in self.particles:
-            particle.draw(surface)
+
+        # Make particles more transparent (reduced from 255)
+        alphas = _quantize_alpha((110 * (self.life / self.max_life)).astype(int))
+        # Additive glow then core for each particle, in one blits call
+        specs: list[tuple] = []
+        color = self.color
+        for x, y, size, alpha in zip(
+            self.pos_x.astype(int).tolist(),
+            self.pos_y.astype(int).tolist(),
+            self.size.tolist(),
+            alphas.tolist(),
+            strict=True,
+        ):
+            glow_size = size + 3
+            specs.append(
+                (
+                    _get_particle_sprite(_premultiply(color, alpha // 4), glow_size),
+                    (x - glow_size, y - glow_size),
+                    None,
+                    pygame.BLEND_RGBA_ADD,
+                )
+            )
+            specs.append(
+                (_get_particle_sprite(color, size, alpha), (x - size, y - size))
+            )
+        surface.blits(specs, doreturn=False)
 
     def is_active(self) -> bool:
         """Check if the explosion is still active."""
-        return len(self.particles) > 0 or self.pulse.active
+        return len(self.life) > 0 or self.pulse.active
 
 
 class NeonGrid:
@@ -362,40 +424,74 @@ class NeonGrid:
         self.offset = 0
         self.scroll_speed = 0.5
 
+        # Pre-rendered 1px line sprites. Horizontal lines leave gaps where the
+        # vertical lines cross, so every grid pixel is still blended only once
+        vertical_line = pygame.Surface((1, SCREEN_HEIGHT), pygame.SRCALPHA)
+        vertical_line.fill(self.color)
+        self._horizontal_line = pygame.Surface((SCREEN_WIDTH, 1), pygame.SRCALPHA)
+        self._horizontal_line.fill(self.color)
+        self._columns = []
+        for x in range(0, SCREEN_WIDTH, grid_size):
+            self._horizontal_line.set_at((x, 0), (0, 0, 0, 0))
+            self._columns.append((vertical_line, (x, 0)))
+
     def update(self):
         """Update grid animation."""
         self.offset += self.scroll_speed
         if self.offset >= self.grid_size:
             self.offset = 0
 
-    def draw(self, surface: pygame.Surface):
-        """Draw the animated grid."""
-        temp_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-
-        # Draw vertical lines
-        for x in range(0, SCREEN_WIDTH + self.grid_size, self.grid_size):
-            pygame.draw.line(
-                temp_surface,
-                self.color,
-                (x, 0),
-                (x, SCREEN_HEIGHT),
-                1,
-            )
-
-        # Draw horizontal lines with perspective effect
+    def _row_positions(self) -> tuple[int, ...]:
+        """Get the on-screen y of each horizontal line for the current offset."""
+        rows = []
         for y in range(0, SCREEN_HEIGHT + self.grid_size, self.grid_size):
             # Make lines closer together near the bottom (perspective)
             adjusted_y = int(y + self.offset * (y / SCREEN_HEIGHT))
             if adjusted_y < SCREEN_HEIGHT:
-                pygame.draw.line(
-                    temp_surface,
-                    self.color,
-                    (0, adjusted_y),
-                    (SCREEN_WIDTH, adjusted_y),
-                    1,
-                )
+                rows.append(adjusted_y)
+        return tuple(rows)
+
+    def draw(self, surface: pygame.Surface):
+        """Draw the animated grid."""
+        # Vertical lines, then horizontal lines with perspective effect
+        blits = self._columns.copy()
+        line = self._horizontal_line
+        blits.extend((line, (0, y)) for y in self._row_positions())
+        surface.blits(blits, doreturn=False)
+
+
+@functools.lru_cache(maxsize=256)
+def _glow_text_layers(
+    text: str,
+    font: pygame.font.Font,
+    color: tuple[int, int, int],
+    glow_intensity: int,
+) -> tuple[pygame.Surface, ...]:
+    """Render the glow layers and core text that draw_glowing_text blits."""
+    layers = []
+    for i in range(glow_intensity):
+        glow_size = (glow_intensity - i) * 2
+        glow_alpha = 50 + i * 30
+
+        # Create glow surface
+        glow_surface = font.render(text, True, (*color, glow_alpha))
+        glow_surface = pygame.transform.smoothscale(
+            glow_surface,
+            (
+                glow_surface.get_width() + glow_size,
+                glow_surface.get_height() + glow_size,
+            ),
+        )
+
+        # Settle the glow onto a transparent layer, as the blend onto the
+        # target expects, so each frame is a plain blit
+        layer = pygame.Surface(glow_surface.get_size(), pygame.SRCALPHA)
+        layer.blit(glow_surface, (0, 0))
+        layers.append(layer)
 
-        surface.blit(temp_surface, (0, 0))
+    # Core text goes on top
+    layers.append(font.render(text, True, color))
+    return tuple(layers)
 
 
 class NeonText:
@@ -411,45 +507,67 @@ class NeonText:
         glow_intensity: int = 3,
     ):
         """Draw text with neon glow effect."""
-        # Create text surface
-        text_surface = font.render(text, True, color)
-        text_rect = text_surface.get_rect(center=pos)
+        # Glow layers then the core text, each centered on pos
+        layers = _glow_text_layers(text, font, color, glow_intensity)
+        surface.blits(
+            [(layer, layer.get_rect(center=pos)) for layer in layers], doreturn=False
+        )
 
-        # Draw glow layers
-        for i in range(glow_intensity):
-            glow_size = (glow_intensity - i) * 2
-            glow_alpha = 50 + i * 30
-
-            # Create glow surface
-            glow_surface = font.render(text, True, (*color, glow_alpha))
-            glow_surface = pygame.transform.smoothscale(
-                glow_surface,
-                (
-                    glow_surface.get_width() + glow_size,
-                    glow_surface.get_height() + glow_size,
-                ),
-            )
+    @staticmethod
+    def render_glowing_text(
+        text: str,
+        font: pygame.font.Font,
+        color: tuple[int, int, int],
+        glow_intensity: int = 3,
+    ) -> pygame.Surface:
+        """Get glowing text on a transparent surface, shared between callers."""
+        return _glow_text_surface(text, font, color, glow_intensity)
 
-            # Draw glow
-            glow_rect = glow_surface.get_rect(center=pos)
-            temp_surface = pygame.Surface(
-                (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
-            )
-            temp_surface.blit(glow_surface, glow_rect)
-            surface.blit(temp_surface, (0, 0))
 
-        # Draw core text
-        surface.blit(text_surface, text_rect)
+@functools.lru_cache(maxsize=256)
+def _glow_text_surface(
+    text: str,
+    font: pygame.font.Font,
+    color: tuple[int, int, int],
+    glow_intensity: int,
+) -> pygame.Surface:
+    """Composite the cached glow layers and core text onto one surface."""
+    layers = _glow_text_layers(text, font, color, glow_intensity)
+    core = layers[-1]
+    pad = glow_intensity * 2
+    result = pygame.Surface(
+        (core.get_width() + pad, core.get_height() + pad), pygame.SRCALPHA
+    )
+    center = result.get_rect().center
+    result.blits(
+        [(layer, layer.get_rect(center=center)) for layer in layers], doreturn=False
+    )
+    return result
+
+
+def _hue_to_rgb(hue: int) -> tuple[int, int, int]:
+    """Convert a hue in degrees to a fully saturated, full-value RGB color."""
+    color = pygame.Color(0)
+    color.hsva = (hue, 100, 100, 100)
+    return (color.r, color.g, color.b)
+
+
+# RGB for every whole hue, so draw code skips building a Color for hsva
+HUE_RGB = [_hue_to_rgb(hue) for hue in range(360)]
 
 
 class RainbowPulse:
     """Creates a cute rainbow pulse effect."""
 
     def __init__(self, center: tuple[int, int], max_radius: int = 60):
+        self.speed = 1.5
+        self.reset(center, max_radius)
+
+    def reset(self, center: tuple[int, int], max_radius: int = 60):
+        """Restart the pulse so pooled instances can be reused."""
         self.center = center
         self.max_radius = max_radius
         self.current_radius = 0
-        self.speed = 1.5
         self.active = True
         self.hue = 0
 
@@ -474,97 +592,97 @@ class RainbowPulse:
             radius = int(self.current_radius - i * 3)
             if radius > 0:
                 hue = (self.hue + i * 30) % 360
-                color = pygame.Color(0)
-                color.hsva = (hue, 100, 100, 50 - i * 10)
-
-                temp_surface = pygame.Surface(
-                    (SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA
-                )
-                pygame.draw.circle(temp_surface, color, self.center, radius, 2)
-                surface.blit(temp_surface, (0, 0))
+                # 50% opacity fading by 10% per ring, as 0-255 alpha
+                color = (*HUE_RGB[hue], (50 - i * 10) * 255 // 100)
+                _draw_translucent_circle(surface, color, self.center, radius, 2)
 
 
 class StarField:
     """Creates an animated starfield background."""
 
     def __init__(self, star_count: int | None = None):
-        self.stars = []
         # Use config value if star_count not specified
         if star_count is None:
             star_count = STAR_COUNT
 
-        for _ in range(star_count):
-            self.stars.append(
-                {
-                    "x": random.randint(0, SCREEN_WIDTH),
-                    "y": random.randint(0, SCREEN_HEIGHT),
-                    "speed": random.uniform(0.5, 3),
-                    "size": random.randint(1, 3),
-                    "brightness": random.uniform(0.3, 0.8),  # Slightly dimmer
-                    "twinkle": random.uniform(0, math.pi * 2),
-                }
-            )
+        # Star state as parallel arrays so each frame updates all stars at once
+        self.x = np.random.randint(0, SCREEN_WIDTH + 1, star_count)
+        self.y = np.random.randint(0, SCREEN_HEIGHT + 1, star_count).astype(float)
+        self.speed = np.random.uniform(0.5, 3, star_count)
+        self.size = np.random.randint(1, 4, star_count)
+        self.brightness = np.random.uniform(0.3, 0.8, star_count)  # Slightly dimmer
+        self.twinkle = np.random.randint(0, _SIN_STEPS, star_count)  # Sine phase
+
+        # Pre-rendered star surfaces keyed by size (and glow alpha)
+        self._glows: dict[tuple[int, int], pygame.Surface] = {}
+        self._cores: dict[int, pygame.Surface] = {}
 
     def update(self):
         """Update star positions."""
-        for star in self.stars:
-            star["y"] += star["speed"]
-            star["twinkle"] += 0.1
-
-            if star["y"] > SCREEN_HEIGHT:
-                star["y"] = 0
-                star["x"] = random.randint(0, SCREEN_WIDTH)
+        self.y += self.speed
+        self.twinkle += _TWINKLE_STEP
+        self.twinkle &= _SIN_MASK
+
+        wrapped = self.y > SCREEN_HEIGHT
+        count = int(np.count_nonzero(wrapped))
+        if count:
+            self.y[wrapped] = 0
+            self.x[wrapped] = np.random.randint(0, SCREEN_WIDTH + 1, count)
+
+    def _get_glow(self, size: int, alpha: int) -> pygame.Surface:
+        """Get the glow surface for a star size and alpha."""
+        glow = self._glows.get((size, alpha))
+        if glow is None:
+            glow = pygame.Surface((size * 4, size * 4), pygame.SRCALPHA)
+            pygame.draw.circle(
+                glow, (*NEON_CYAN, alpha), (size * 2, size * 2), size * 2
+            )
+            self._glows[(size, alpha)] = glow
+        return glow
+
+    def _get_core(self, size: int) -> pygame.Surface:
+        """Get the solid core surface for a star size."""
+        core = self._cores.get(size)
+        if core is None:
+            core = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
+            pygame.draw.circle(core, NEON_CYAN, (size, size), size)
+            self._cores[size] = core
+        return core
 
     def draw(self, surface: pygame.Surface):
         """Draw the starfield."""
-        for star in self.stars:
-            # Calculate twinkle effect
-            twinkle = (math.sin(star["twinkle"]) + 1) * 0.5
-            alpha = int(star["brightness"] * twinkle * 255)
-
-            # Draw star with glow
-            color = (*NEON_CYAN, min(alpha, 180))  # Cap transparency
-            pos = (int(star["x"]), int(star["y"]))
-
-            # Glow
-            glow_surf = pygame.Surface(
-                (star["size"] * 4, star["size"] * 4), pygame.SRCALPHA
+        # Calculate twinkle effect for every star at once
+        twinkle = (_SIN_LUT[self.twinkle] + 1) * 0.5
+        alphas = (self.brightness * twinkle * 255).astype(int)
+
+        blits = []
+        for x, y, size, alpha in zip(
+            self.x.tolist(),
+            self.y.astype(int).tolist(),
+            self.size.tolist(),
+            alphas.tolist(),
+            strict=True,
+        ):
+            # Glow (more transparent), then the core on top
+            glow_offset = size * 2
+            blits.append(
+                (self._get_glow(size, alpha // 4), (x - glow_offset, y - glow_offset))
             )
-            pygame.draw.circle(
-                glow_surf,
-                (*NEON_CYAN, alpha // 4),  # More transparent glow
-                (star["size"] * 2, star["size"] * 2),
-                star["size"] * 2,
-            )
-            surface.blit(
-                glow_surf, (pos[0] - star["size"] * 2, pos[1] - star["size"] * 2)
-            )
-
-            # Core
-            pygame.draw.circle(surface, color, pos, star["size"])
-
+            blits.append((self._get_core(size), (x - size, y - size)))
+        surface.blits(blits, doreturn=False)
 
-class HeartBeat:
-    """Creates a cute heartbeat animation effect."""
 
-    def __init__(self, pos: tuple[int, int], color: tuple[int, int, int] = NEON_PINK):
-        self.pos = pos
-        self.color = color
-        self.scale = 1.0
-        self.beat_phase = 0
-        self.active = True
+# Heart glow and body sprites by (color, size), drawn once per beat size
+_heart_sprites: dict[tuple, tuple[pygame.Surface, pygame.Surface]] = {}
 
-    def update(self):
-        """Update heartbeat animation."""
-        self.beat_phase += 0.15
-        # Create double-beat pattern like real heartbeat
-        self.scale = 1.0 + math.sin(self.beat_phase) * 0.3
-        if math.sin(self.beat_phase - 0.3) > 0.8:
-            self.scale += 0.2
 
-    def draw(self, surface: pygame.Surface):
-        """Draw animated heart."""
-        size = int(20 * self.scale)
+def _get_heart_sprites(
+    color: tuple[int, int, int], size: int
+) -> tuple[pygame.Surface, pygame.Surface]:
+    """Get the pre-drawn (glow, heart) sprites for a heart of the given size."""
+    key = (color, size)
+    sprites = _heart_sprites.get(key)
+    if sprites is None:
         heart_surf = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
 
         # Draw heart shape
@@ -573,14 +691,14 @@ class HeartBeat:
         # Left curve
         pygame.draw.circle(
             heart_surf,
-            self.color,
+            color,
             (center_x - size // 4, center_y - size // 4),
             size // 3,
         )
         # Right curve
         pygame.draw.circle(
             heart_surf,
-            self.color,
+            color,
             (center_x + size // 4, center_y - size // 4),
             size // 3,
         )
@@ -590,23 +708,109 @@ class HeartBeat:
             (center_x + size // 2, center_y),
             (center_x, center_y + size // 2),
         ]
-        pygame.draw.polygon(heart_surf, self.color, points)
+        pygame.draw.polygon(heart_surf, color, points)
 
         # Add glow
         glow_surf = pygame.Surface((size * 3, size * 3), pygame.SRCALPHA)
-        pygame.draw.circle(glow_surf, (*self.color, 50), (size * 1.5, size * 1.5), size)
+        pygame.draw.circle(glow_surf, (*color, 50), (size * 1.5, size * 1.5), size)
+
+        sprites = (glow_surf, heart_surf)
+        _heart_sprites[key] = sprites
+    return sprites
+
+
+class HeartBeat:
+    """Creates a cute heartbeat animation effect."""
+
+    def __init__(self, pos: tuple[int, int], color: tuple[int, int, int] = NEON_PINK):
+        self.pos = pos
+        self.color = color
+        self.scale = 1.0
+        self.beat_phase = 0
+        self.active = True
+
+    def update(self):
+        """Update heartbeat animation."""
+        self.beat_phase += 0.15
+        # Create double-beat pattern like real heartbeat
+        self.scale = 1.0 + math.sin(self.beat_phase) * 0.3
+        if math.sin(self.beat_phase - 0.3) > 0.8:
+            self.scale += 0.2
+
+    def draw(self, surface: pygame.Surface):
+        """Draw animated heart."""
+        size = int(20 * self.scale)
+        glow_surf, heart_surf = _get_heart_sprites(self.color, size)
 
         # Blit to main surface
         surface.blit(glow_surf, (self.pos[0] - size * 1.5, self.pos[1] - size * 1.5))
         surface.blit(heart_surf, (self.pos[0] - size, self.pos[1] - size))
 
 
+# Four-pointed stars by (color, size, alpha), shared by every sparkle
+_sparkle_sprites: dict[tuple, pygame.Surface] = {}
+
+
+def _get_sparkle_sprite(
+    color: tuple[int, int, int], size: int, alpha: int
+) -> pygame.Surface:
+    """Get a pre-drawn translucent star centered at (size, size)."""
+    key = (color, size, alpha)
+    sprite = _sparkle_sprites.get(key)
+    if sprite is None:
+        sprite = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
+        c = size
+        # Four-pointed star
+        points = [
+            (c, c - size),
+            (c + size // 2, c - size // 2),
+            (c + size, c),
+            (c + size // 2, c + size // 2),
+            (c, c + size),
+            (c - size // 2, c + size // 2),
+            (c - size, c),
+            (c - size // 2, c - size // 2),
+        ]
+        pygame.draw.polygon(sprite, (*color, alpha), points)
+        _sparkle_sprites[key] = sprite
+    return sprite
+
+
+class Sparkle:
+    """A single drifting star owned by a SparkleEffect."""
+
+    __slots__ = ("color", "life", "max_life", "size", "vx", "vy", "x", "y")
+
+    def __init__(
+        self,
+        x: float,
+        y: float,
+        vx: float,
+        vy: float,
+        size: int,
+        color: tuple[int, int, int],
+    ):
+        self.x = x
+        self.y = y
+        self.vx = vx
+        self.vy = vy
+        self.size = size
+        self.color = color
+        self.life = 30
+        self.max_life = 30
+
+
 class SparkleEffect:
     """Creates cute sparkle effects."""
 
     def __init__(self, pos: tuple[int, int]):
+        self.sparkles: list[Sparkle] = []
+        self.reset(pos)
+
+    def reset(self, pos: tuple[int, int]):
+        """Restart the effect so pooled instances can be reused."""
         self.pos = pos
-        self.sparkles: list[dict[str, Any]] = []
+        self.sparkles.clear()
         self.spawn_timer = 0
         self.active = True
 
@@ -616,57 +820,41 @@ class SparkleEffect:
 
         # Spawn new sparkle
         if self.spawn_timer % 5 == 0:
-            angle = random.uniform(0, math.pi * 2)
+            phase = random.randrange(_SIN_STEPS)
             speed = random.uniform(0.5, 2)
             self.sparkles.append(
-                {
-                    "x": self.pos[0],
-                    "y": self.pos[1],
-                    "vx": math.cos(angle) * speed,
-                    "vy": math.sin(angle) * speed,
-                    "life": 30,
-                    "max_life": 30,
-                    "size": random.randint(2, 4),
-                    "color": random.choice(
-                        [NEON_YELLOW, NEON_CYAN, NEON_PINK, NEON_GREEN]
-                    ),
-                }
+                Sparkle(
+                    self.pos[0],
+                    self.pos[1],
+                    _SIN_LIST[(phase + _COS_OFFSET) & _SIN_MASK] * speed,
+                    _SIN_LIST[phase] * speed,
+                    random.randint(2, 4),
+                    random.choice([NEON_YELLOW, NEON_CYAN, NEON_PINK, NEON_GREEN]),
+                )
             )
 
-        # Update existing sparkles
-        for sparkle in self.sparkles[:]:
-            sparkle["x"] += sparkle["vx"]
-            sparkle["y"] += sparkle["vy"]
-            sparkle["life"] -= 1
+        # Update existing sparkles, compacting survivors in place
+        sparkles = self.sparkles
+        write = 0
+        for sparkle in sparkles:
+            sparkle.x += sparkle.vx
+            sparkle.y += sparkle.vy
+            sparkle.life -= 1
 
-            if sparkle["life"] <= 0:
-                self.sparkles.remove(sparkle)
+            if sparkle.life > 0:
+                sparkles[write] = sparkle
+                write += 1
+        del sparkles[write:]
 
     def draw(self, surface: pygame.Surface):
         """Draw sparkles."""
+        specs = []
         for sparkle in self.sparkles:
-            alpha = int(255 * (sparkle["life"] / sparkle["max_life"]))
-
-            # Draw star shape
-            cx, cy = int(sparkle["x"]), int(sparkle["y"])
-            size = sparkle["size"]
-
-            # Four-pointed star
-            points = [
-                (cx, cy - size),
-                (cx + size // 2, cy - size // 2),
-                (cx + size, cy),
-                (cx + size // 2, cy + size // 2),
-                (cx, cy + size),
-                (cx - size // 2, cy + size // 2),
-                (cx - size, cy),
-                (cx - size // 2, cy - size // 2),
-            ]
-
-            # Draw with glow
-            temp_surf = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            pygame.draw.polygon(temp_surf, (*sparkle["color"], alpha), points)
-            surface.blit(temp_surf, (0, 0))
+            alpha = int(255 * (sparkle.life / sparkle.max_life))
+            size = sparkle.size
+            sprite = _get_sparkle_sprite(sparkle.color, size, alpha)
+            specs.append((sprite, (int(sparkle.x) - size, int(sparkle.y) - size)))
+        surface.blits(specs, doreturn=False)
 
 
 # Preset color schemes for different game elements
@@ -681,12 +869,41 @@ NEON_COLORS = {
 }
 
 
+# Neon versions of sprites keyed by pixel content, color and glow radius
+_neon_surfaces: dict[tuple, pygame.Surface] = {}
+
+
 def create_neon_surface(
     original_surface: pygame.Surface,
     color: tuple[int, int, int],
     glow_radius: int = 5,
 ) -> pygame.Surface:
-    """Apply neon glow effect to a surface."""
+    """Apply neon glow effect to a surface, rendering each sprite look once."""
+    # Key on the pixels rather than id(): sprites are generated surfaces and
+    # an id can be reused once the original is freed
+    key = (
+        original_surface.get_size(),
+        pygame.image.tobytes(original_surface, "RGBA"),
+        color,
+        glow_radius,
+    )
+    neon_surface = _neon_surfaces.get(key)
+    if neon_surface is None:
+        # A fixed sprite set needs few entries; start over if it grows large
+        if len(_neon_surfaces) >= 128:
+            _neon_surfaces.clear()
+        neon_surface = _render_neon_surface(original_surface, color, glow_radius)
+        _neon_surfaces[key] = neon_surface
+    # Hand out a copy so callers can still draw on their result
+    return neon_surface.copy()
+
+
+def _render_neon_surface(
+    original_surface: pygame.Surface,
+    color: tuple[int, int, int],
+    glow_radius: int,
+) -> pygame.Surface:
+    """Render the glow layers and core for create_neon_surface."""
     # Create a larger surface for the glow
     width = original_surface.get_width() + glow_radius * 4
     height = original_surface.get_height() + glow_radius * 4
@@ -0,0 +1,90 @@
+"""Numeric kernels for particle motion and point projection.
+
+Numba is optional: when it is installed the kernels are JIT-compiled to tight
+native loops, otherwise NumPy broadcast implementations are used.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
+
+
+def _project_points_loop(points, scale_x, scale_y):
+    """Scale (x, y) float positions and truncate them to int32 coordinates."""
+    out = np.empty((points.shape[0], 2), dtype=np.int32)
+    for i in range(points.shape[0]):
+        out[i, 0] = int(points[i, 0] * scale_x)
+        out[i, 1] = int(points[i, 1] * scale_y)
+    return out
+
+
+def _project_points_numpy(points, scale_x, scale_y):
+    """Broadcast fallback for _project_points_loop when Numba is unavailable."""
+    return (points * np.array([scale_x, scale_y])).astype(np.int32)
+
+
+if njit is not None:
+    project_points = njit(cache=True, fastmath=True)(_project_points_loop)
+else:
+    project_points = _project_points_numpy
+
+
+def _step_particles_loop(px, py, vx, vy, life):
+    """Advance particles one frame in place: move, apply gravity, age."""
+    for i in range(px.shape[0]):
+        px[i] += vx[i]
+        py[i] += vy[i]
+        life[i] -= 1
+        # Add slight gravity effect
+        vy[i] += 0.1
+
+
+def _step_particles_numpy(px, py, vx, vy, life):
+    """Broadcast fallback for _step_particles_loop when Numba is unavailable."""
+    px += vx
+    py += vy
+    life -= 1
+    vy += 0.1
+
+
+if njit is not None:
+    step_particles = njit(cache=True)(_step_particles_loop)
+else:
+    step_particles = _step_particles_numpy
+
+
+def _step_pool_particles_loop(pos, vel, life, active):
+    """Advance active pool slots in place, retire expired ones, return count."""
+    died = 0
+    for i in range(pos.shape[0]):
+        if active[i]:
+            pos[i, 0] += vel[i, 0]
+            pos[i, 1] += vel[i, 1]
+            vel[i, 1] += 0.1  # Gravity
+            life[i] -= 1
+            if life[i] <= 0:
+                active[i] = False
+                died += 1
+    return died
+
+
+def _step_pool_particles_numpy(pos, vel, life, active):
+    """Broadcast fallback for _step_pool_particles_loop."""
+    live = np.flatnonzero(active)
+    if not len(live):
+        return 0
+    pos[live] += vel[live]
+    vel[live, 1] += 0.1  # Gravity
+    life[live] -= 1
+    dead = live[life[live] <= 0]
+    active[dead] = False
+    return len(dead)
+
+
+if njit is not None:
+    step_pool_particles = njit(cache=True)(_step_pool_particles_loop)
+else:
+    step_pool_particles = _step_pool_particles_numpy
@@ -3,52 +3,43 @@
 from collections import deque
 from typing import TYPE_CHECKING
 
+import numpy as np
 import pygame
 
+from .collision_kernels import aabb_pairs
+
 if TYPE_CHECKING:
-    from .entities import Bullet, Explosion
+    from .entities import Bonus, Bullet, Enemy, Explosion
 
 
 class BulletPool:
     """Object pool for bullet sprites to reduce allocation overhead."""
 
     def __init__(self, pool_size: int = 100):
-        self.pool_size = pool_size
-        self.available: deque[Bullet] = deque()
+        self.pool_size = pool_size  # Maximum free bullets kept per class
+        # Free list per bullet class, popped from the tail
+        self.available: dict[type, list[Bullet]] = {}
         self.active: set[Bullet] = set()
 
     def get_bullet(self, bullet_class, *args, **kwargs) -> "Bullet":
         """Get a bullet from the pool or create a new one."""
-        # Try to reuse an available bullet
-        while self.available:
-            bullet = self.available.popleft()
-            if isinstance(bullet, bullet_class):
-                # Reinitialize the bullet with new parameters
-                # Reset the bullet state instead of calling __init__
-                bullet.rect.centerx = args[0]
-                bullet.rect.centery = args[1]
-                bullet.speed = args[2]
-                bullet.owner = args[3]
-                # Reset optional attributes
-                bullet.x_velocity = 0
-                bullet.x_direction = 0
-                self.active.add(bullet)
-                return bullet  # type: ignore[no-any-return]
-            # Put it back if it's not the right type
-            self.available.append(bullet)
-            break
-
-        # Create a new bullet if none available
-        bullet = bullet_class(*args, **kwargs)
+        free = self.available.get(bullet_class)
+        if free:
+            bullet = free.pop()
+            # Reset the bullet state instead of calling __init__
+            bullet.reset(*args, **kwargs)
+        else:
+            bullet = bullet_class(*args, **kwargs)
         self.active.add(bullet)
-        return bullet  # type: ignore[no-any-return]
+        return bullet
 
     def release_bullet(self, bullet: "Bullet") -> None:
         """Return a bullet to the pool."""
         if bullet in self.active:
             self.active.remove(bullet)
-            if len(self.available) < self.pool_size:
-                self.available.append(bullet)
+            free = self.available.setdefault(bullet.pool_cls, [])
+            if len(free) < self.pool_size:
+                free.append(bullet)
                 # Reset the bullet's groups
                 bullet.kill()
 
@@ -88,25 +79,150 @@ class ExplosionPool:
                 explosion.kill()
 
 
-class OptimizedGroup(pygame.sprite.Group):
+class EnemyPool:
+    """Object pool for enemy sprites reused between waves."""
+
+    def __init__(self, pool_size: int = 60):
+        self.pool_size = pool_size
+        self.available: deque[Enemy] = deque()
+        self.active: set[Enemy] = set()
+
+    def get_enemy(self, enemy_class, *args, **kwargs) -> "Enemy":
+        """Get an enemy from the pool or create a new one."""
+        if self.available:
+            enemy = self.available.popleft()
+            # Reset enemy state instead of calling __init__
+            enemy.reset(*args, **kwargs)
+            self.active.add(enemy)
+            return enemy
+
+        # Create new enemy if none available
+        enemy = enemy_class(*args, **kwargs)
+        self.active.add(enemy)
+        return enemy  # type: ignore[no-any-return]
+
+    def release_enemy(self, enemy: "Enemy") -> None:
+        """Return an enemy to the pool."""
+        if enemy in self.active:
+            self.active.remove(enemy)
+            if len(self.available) < self.pool_size:
+                self.available.append(enemy)
+
+
+class BonusPool:
+    """Object pool for bonus pickups."""
+
+    def __init__(self, pool_size: int = 20):
+        self.pool_size = pool_size
+        self.available: deque[Bonus] = deque()
+        self.active: set[Bonus] = set()
+
+    def get_bonus(self, bonus_class, *args, **kwargs) -> "Bonus":
+        """Get a bonus from the pool or create a new one."""
+        if self.available:
+            bonus = self.available.popleft()
+            # Reset bonus state instead of calling __init__
+            bonus.reset(*args, **kwargs)
+            self.active.add(bonus)
+            return bonus
+
+        # Create new bonus if none available
+        bonus = bonus_class(*args, **kwargs)
+        self.active.add(bonus)
+        return bonus  # type: ignore[no-any-return]
+
+    def release_bonus(self, bonus: "Bonus") -> None:
+        """Return a bonus to the pool."""
+        if bonus in self.active:
+            self.active.remove(bonus)
+            if len(self.available) < self.pool_size:
+                self.available.append(bonus)
+                bonus.kill()
+
+
+class EffectPool:
+    """Object pool for short-lived visual effects like sparkles and pulses."""
+
+    def __init__(self, pool_size: int = 20):
+        self.pool_size = pool_size  # Maximum free effects kept per class
+        # Free list per effect class, popped from the tail
+        self.available: dict[type, list] = {}
+
+    def get_effect(self, effect_class, *args, **kwargs):
+        """Get an effect from the pool or create a new one."""
+        free = self.available.get(effect_class)
+        if free:
+            effect = free.pop()
+            # Reset effect state instead of calling __init__
+            effect.reset(*args, **kwargs)
+            return effect
+        return effect_class(*args, **kwargs)
+
+    def release_effect(self, effect) -> None:
+        """Return an effect that is no longer displayed to the pool."""
+        free = self.available.setdefault(type(effect), [])
+        if len(free) < self.pool_size:
+            free.append(effect)
+
+    def release_all(self, effects: list) -> None:
+        """Return every effect in a list to the pool and empty the list."""
+        for effect in effects:
+            self.release_effect(effect)
+        effects.clear()
+
+
+class PooledGroup(pygame.sprite.Group):
+    """Sprite group that hands removed sprites back to an object pool."""
+
+    def __init__(self, release, *sprites, on_add=None):
+        self._release = release
+        self._on_add = on_add  # Optional callback for sprites joining the group
+        super().__init__(*sprites)
+
+    def add_internal(self, sprite, layer=None):
+        """Add sprite to the group and notify the owner."""
+        super().add_internal(sprite, layer)
+        if self._on_add:
+            self._on_add(sprite)
+
+    def remove_internal(self, sprite):
+        """Remove sprite from the group and release it to the pool."""
+        super().remove_internal(sprite)
+        self._release(sprite)
+
+
+class FastDrawGroup(pygame.sprite.Group):
+    """Sprite group with a batched draw that skips dirty-rect bookkeeping."""
+
+    def fast_draw(self, surface: pygame.Surface) -> None:
+        """Draw all sprites with a single blits call."""
+        # Unlike Group.draw, don't collect the blitted rects into spritedict
+        surface.blits(
+            [(sprite.image, sprite.rect) for sprite in self.sprites()], doreturn=False
+        )
+
+
+class OptimizedGroup(FastDrawGroup):
     """Optimized sprite group with spatial partitioning for collision detection."""
 
-    def __init__(self, *sprites):
+    def __init__(self, *sprites, grid_size: int = 48):
+        self.grid_size = grid_size  # Size of each grid cell
+        self.grid: dict[tuple[int, int], set] = {}
+        # Cell each sprite was filed under, so removal works after it moved
+        self._grid_keys: dict[pygame.sprite.Sprite, tuple[int, int]] = {}
+        # Largest half-extent seen, used to widen rect queries
+        self._max_half_extent = 0
         super().__init__(*sprites)
-        self.grid_size = 100  # Size of each grid cell
-        self.grid = {}
 
-    def add(self, *sprites):
-        """Add sprites and update grid."""
-        super().add(*sprites)
-        for sprite in sprites:
-            self._add_to_grid(sprite)
+    def add_internal(self, sprite, layer=None):
+        """Add sprite and file it in the grid (also covers Sprite.add)."""
+        super().add_internal(sprite, layer)
+        self._add_to_grid(sprite)
 
-    def remove(self, *sprites):
-        """Remove sprites and update grid."""
-        super().remove(*sprites)
-        for sprite in sprites:
-            self._remove_from_grid(sprite)
+    def remove_internal(self, sprite):
+        """Remove sprite and drop it from the grid (also covers Sprite.kill)."""
+        super().remove_internal(sprite)
+        self._remove_from_grid(sprite)
 
     def _get_grid_key(self, rect):
         """Get grid cell key for a rect."""
@@ -119,35 +235,46 @@ class OptimizedGroup(pygame.sprite.Group):
             if key not in self.grid:
                 self.grid[key] = set()
             self.grid[key].add(sprite)
+            self._grid_keys[sprite] = key
+            half_extent = (max(sprite.rect.width, sprite.rect.height) + 1) // 2
+            self._max_half_extent = max(self._max_half_extent, half_extent)
 
     def _remove_from_grid(self, sprite):
         """Remove sprite from spatial grid."""
-        if hasattr(sprite, "rect"):
-            key = self._get_grid_key(sprite.rect)
-            if key in self.grid:
-                self.grid[key].discard(sprite)
-                if not self.grid[key]:
-                    del self.grid[key]
+        key = self._grid_keys.pop(sprite, None)
+        if key in self.grid:
+            self.grid[key].discard(sprite)
+            if not self.grid[key]:
+                del self.grid[key]
 
     def update(self, *args):
         """Update sprites and maintain grid."""
-        # Store old positions
-        old_positions = {}
-        for sprite in self.sprites():
-            if hasattr(sprite, "rect"):
-                old_positions[sprite] = self._get_grid_key(sprite.rect)
-
         # Update sprites
         super().update(*args)
 
-        # Update grid for moved sprites
-        for sprite in self.sprites():
-            if hasattr(sprite, "rect") and sprite in old_positions:
-                new_key = self._get_grid_key(sprite.rect)
-                old_key = old_positions[sprite]
-                if new_key != old_key:
-                    self._remove_from_grid(sprite)
-                    self._add_to_grid(sprite)
+        # Re-file sprites whose cell changed since they were last filed; one
+        # key computation per sprite and no grid churn for sprites that stay
+        grid = self.grid
+        grid_keys = self._grid_keys
+        size = self.grid_size
+        for sprite, old_key in grid_keys.items():
+            rect = sprite.rect
+            new_key = (rect.centerx // size, rect.centery // size)
+            if new_key == old_key:
+                continue
+            cell = grid[old_key]
+            cell.discard(sprite)
+            if not cell:
+                del grid[old_key]
+            new_cell = grid.get(new_key)
+            if new_cell is None:
+                grid[new_key] = {sprite}
+            else:
+                new_cell.add(sprite)
+            # Replacing a value keeps the dict size, so iteration stays valid
+            grid_keys[sprite] = new_key
+            half_extent = (max(rect.width, rect.height) + 1) // 2
+            self._max_half_extent = max(self._max_half_extent, half_extent)
 
     def get_sprites_near(self, rect, radius=1):
         """Get sprites in nearby grid cells."""
@@ -162,6 +289,59 @@ class OptimizedGroup(pygame.sprite.Group):
 
         return list(nearby_sprites)
 
+    def query_rect(self, rect) -> list:
+        """Get candidate sprites from every cell a rect could overlap."""
+        # Sprites are filed by center, so widen the query by their half-extent
+        margin = self._max_half_extent
+        size = self.grid_size
+        candidates: list = []
+        for cell_x in range(
+            (rect.left - margin) // size, (rect.right + margin) // size + 1
+        ):
+            for cell_y in range(
+                (rect.top - margin) // size, (rect.bottom + margin) // size + 1
+            ):
+                cell = self.grid.get((cell_x, cell_y))
+                if cell:
+                    candidates.extend(cell)
+        return candidates
+
+
+class CollisionBuffers:
+    """Reusable SoA rect buffers for vectorized AABB collision tests."""
+
+    def __init__(self, capacity: int = 64):
+        # Rows hold (left, top, right, bottom) for each sprite
+        self._buffers = [np.empty((capacity, 4), dtype=np.int32) for _ in range(2)]
+        # Output for (index_a, index_b) pairs, sized for the worst case
+        self._pairs = np.empty((capacity, 2), dtype=np.int32)
+
+    def _load(self, slot: int, sprites) -> np.ndarray:
+        """Copy sprite rects into a preallocated buffer, growing it if needed."""
+        count = len(sprites)
+        buffer = self._buffers[slot]
+        if count > len(buffer):
+            buffer = np.empty((max(count, len(buffer) * 2), 4), dtype=np.int32)
+            self._buffers[slot] = buffer
+        view = buffer[:count]
+        view[:] = [
+            (sprite.rect.left, sprite.rect.top, sprite.rect.right, sprite.rect.bottom)
+            for sprite in sprites
+        ]
+        return view
+
+    def overlap_pairs(self, sprites_a, sprites_b) -> np.ndarray:
+        """Return (index_a, index_b) pairs of overlapping sprites, ordered by a."""
+        if not sprites_a or not sprites_b:
+            return self._pairs[:0]
+        a = self._load(0, sprites_a)
+        b = self._load(1, sprites_b)
+        max_pairs = len(a) * len(b)
+        if max_pairs > len(self._pairs):
+            self._pairs = np.empty((max_pairs, 2), dtype=np.int32)
+        count = aabb_pairs(a, b, self._pairs)
+        return self._pairs[:count]
+
 
 class DirtySprite(pygame.sprite.Sprite):
     """Sprite that tracks if it needs redrawing."""
@@ -183,3 +363,6 @@ class DirtySprite(pygame.sprite.Sprite):
 # Global object pools
 bullet_pool = BulletPool(pool_size=200)
 explosion_pool = ExplosionPool(pool_size=100)
+enemy_pool = EnemyPool(pool_size=60)
+bonus_pool = BonusPool(pool_size=20)
+effect_pool = EffectPool(pool_size=20)
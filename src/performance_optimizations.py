@@ -1,9 +1,11 @@
 """Performance optimizations for the game."""
 
-import random
-from typing import TypedDict
-
+import numpy as np
 import pygame
+import pygame.gfxdraw
+
+from .neon_effects import _get_scratch, _premultiply, _quantize_alpha
+from .particle_kernels import step_pool_particles
 
 
 class RenderCache:
@@ -12,185 +14,198 @@ class RenderCache:
     def __init__(self) -> None:
         self.cache: dict[str, pygame.Surface] = {}
         self.glow_cache: dict[tuple[tuple[int, int, int], int], pygame.Surface] = {}
+        self.text_cache: dict[tuple, pygame.Surface] = {}
 
     def get_glow_surface(
         self, color: tuple[int, int, int], radius: int
     ) -> pygame.Surface:
-        """Get or create a cached glow surface."""
+        """Get or create a cached glow surface.
+
+        The radius is snapped up to a multiple of 4, so nearby radii share one
+        surface and the cache stays small.
+        """
+        radius = (radius + 3) & ~3
         key = (color, radius)
         if key not in self.glow_cache:
             size = radius * 4
             surface = pygame.Surface((size, size), pygame.SRCALPHA)
+            surface.fill((*color, 0))
             center = size // 2
 
-            # Create glow with fewer layers for performance
-            for i in range(0, radius, 2):  # Skip every other layer
-                alpha = int(255 * (1 - i / radius) * 0.2)  # Reduced alpha
-                r = radius - i
-                glow_color = (*color, alpha)
-                pygame.draw.circle(surface, glow_color, (center, center), r)
+            # Fade alpha linearly from 20% at the center to 0 at the radius in
+            # one pass, instead of stacking a circle per ring
+            ys, xs = np.ogrid[:size, :size]
+            distance = np.hypot(xs - center, ys - center)
+            alpha = np.clip(1 - distance / radius, 0, 1) * (255 * 0.2)
+            pygame.surfarray.pixels_alpha(surface)[:] = alpha.astype(np.uint8)
 
             self.glow_cache[key] = surface
 
         return self.glow_cache[key]
 
+    def get_text(
+        self, font: pygame.font.Font, text: str, color: tuple[int, ...]
+    ) -> pygame.Surface:
+        """Get or render a cached antialiased text surface.
+
+        Keyed on the font object itself so a freed font's id can never be
+        matched by a new one. The cache is dropped once it grows past 256
+        entries, which only happens when many distinct strings are drawn.
+        """
+        key = (font, text, tuple(color))
+        surface = self.text_cache.get(key)
+        if surface is None:
+            if len(self.text_cache) >= 256:
+                self.text_cache.clear()
+            surface = font.render(text, True, color)
+            self.text_cache[key] = surface
+        return surface
+
     def clear(self) -> None:
         """Clear all caches."""
         self.cache.clear()
         self.glow_cache.clear()
+        self.text_cache.clear()
 
 
 class OptimizedStarField:
     """Optimized starfield with pre-rendered stars."""
 
     def __init__(self, star_count: int):
-        self.stars = []
-        self.star_surface = pygame.Surface((800, 600), pygame.SRCALPHA)
-
-        # Pre-render star sprites
-        self.star_sprites = []
+        # Pre-render star sprites for every size and 8 brightness levels, so
+        # brightness costs nothing per frame
+        self.star_sprites: list[list[pygame.Surface]] = []
         for size in range(1, 4):
-            surface = pygame.Surface((size * 4, size * 4), pygame.SRCALPHA)
-            # Simple star without expensive glow
-            pygame.draw.circle(surface, (100, 200, 200), (size * 2, size * 2), size)
-            self.star_sprites.append(surface)
-
-        # Initialize stars
-        import random
-
-        for _ in range(star_count):
-            self.stars.append(
-                {
-                    "x": random.randint(0, 800),
-                    "y": random.randint(0, 600),
-                    "speed": random.uniform(0.5, 2),
-                    "sprite_idx": random.randint(0, 2),
-                    "brightness": random.uniform(0.5, 1.0),
-                }
-            )
+            levels = []
+            for level in range(8):
+                surface = pygame.Surface((size * 4, size * 4), pygame.SRCALPHA)
+                # Simple star without expensive glow
+                color = (100 * level // 7, 200 * level // 7, 200 * level // 7)
+                pygame.draw.circle(surface, color, (size * 2, size * 2), size)
+                levels.append(surface)
+            self.star_sprites.append(levels)
+
+        # Initialize stars as parallel arrays so update() moves them all at once
+        self.x = np.random.randint(0, 801, star_count)
+        self.y = np.random.randint(0, 601, star_count).astype(float)
+        self.speed = np.random.uniform(0.5, 2, star_count)
+        self.sprite_idx = np.random.randint(0, 3, star_count)
+        self.brightness = np.random.uniform(0.5, 1.0, star_count)
+        self.bright_idx = (self.brightness * 7).astype(int)
 
     def update(self) -> None:
         """Update star positions."""
-        for star in self.stars:
-            star["y"] += star["speed"]
-            if star["y"] > 600:
-                star["y"] = 0
-                star["x"] = random.randint(0, 800)
+        self.y += self.speed
+        wrapped = self.y > 600
+        count = int(np.count_nonzero(wrapped))
+        if count:
+            self.y[wrapped] = 0
+            self.x[wrapped] = np.random.randint(0, 801, count)
 
     def draw(self, surface: pygame.Surface) -> None:
-        """Draw stars efficiently."""
-        self.star_surface.fill((0, 0, 0, 0))
-
-        for star in self.stars:
-            sprite = self.star_sprites[int(star["sprite_idx"])]
-            # Apply brightness without creating new surface
-            pos = (
-                int(star["x"]) - sprite.get_width() // 2,
-                int(star["y"]) - sprite.get_height() // 2,
-            )
-            self.star_surface.blit(sprite, pos)
-
-        surface.blit(self.star_surface, (0, 0))
-
-
-class Particle(TypedDict):
-    active: bool
-    x: float
-    y: float
-    vx: float
-    vy: float
-    life: int
-    max_life: int
-    color: tuple[int, int, int]
-    size: int
+        """Draw stars efficiently with a single blits call."""
+        # Sprites are fully opaque or fully clear, so they go straight onto
+        # the target instead of through a screen-sized intermediate surface
+        sprites = self.star_sprites
+        offsets = [levels[0].get_width() // 2 for levels in sprites]
+        surface.blits(
+            [
+                (sprites[idx][bright], (x - offsets[idx], y - offsets[idx]))
+                for x, y, idx, bright in zip(
+                    self.x.tolist(),
+                    self.y.astype(int).tolist(),
+                    self.sprite_idx.tolist(),
+                    self.bright_idx.tolist(),
+                    strict=True,
+                )
+            ],
+            doreturn=False,
+        )
 
 
 class ParticlePool:
     """Efficient particle system with object pooling."""
 
     def __init__(self, max_particles: int = 200):
-        self.particles: list[Particle] = []
         self.active_count = 0
         self.max_particles = max_particles
-
-        # Pre-allocate particles
-        for _ in range(max_particles):
-            self.particles.append(
-                Particle(
-                    active=False,
-                    x=0.0,
-                    y=0.0,
-                    vx=0.0,
-                    vy=0.0,
-                    life=0,
-                    max_life=30,
-                    color=(255, 255, 255),
-                    size=2,
-                )
-            )
+        self.max_life = 30
+        # Pre-allocated particle slots as parallel arrays
+        self.pos = np.zeros((max_particles, 2))
+        self.vel = np.zeros((max_particles, 2))
+        self.life = np.zeros(max_particles, dtype=np.int32)
+        self.size = np.full(max_particles, 2, dtype=np.int32)
+        self.color = np.full((max_particles, 3), 255, dtype=np.uint8)
+        self.active = np.zeros(max_particles, dtype=bool)
+        # Particle circles by (color, size, alpha)
+        self._sprites: dict[tuple, pygame.Surface] = {}
 
     def emit(self, x: float, y: float, count: int, color: tuple[int, int, int]) -> None:
         """Emit particles from pool."""
-        import math
-        import random
-
-        emitted = 0
-        for particle in self.particles:
-            if not particle["active"] and emitted < count:
-                angle = random.uniform(0, 2 * math.pi)
-                speed = random.uniform(1, 3)
-
-                particle["active"] = True
-                particle["x"] = x
-                particle["y"] = y
-                particle["vx"] = math.cos(angle) * speed
-                particle["vy"] = math.sin(angle) * speed
-                particle["life"] = particle["max_life"]
-                particle["color"] = color
-                particle["size"] = random.randint(1, 3)
-
-                emitted += 1
-                self.active_count += 1
-
-                if emitted >= count:
-                    break
+        # Fill the first free slots, as many as are available
+        slots = np.flatnonzero(~self.active)[:count]
+        emitted = len(slots)
+        if not emitted:
+            return
+
+        angle = np.random.uniform(0, 2 * np.pi, emitted)
+        speed = np.random.uniform(1, 3, emitted)
+
+        self.active[slots] = True
+        self.pos[slots] = (x, y)
+        self.vel[slots, 0] = np.cos(angle) * speed
+        self.vel[slots, 1] = np.sin(angle) * speed
+        self.life[slots] = self.max_life
+        self.color[slots] = color
+        self.size[slots] = np.random.randint(1, 4, emitted)
+        self.active_count += emitted
+
+    def has_live(self) -> bool:
+        """Whether any particle is still active."""
+        return self.active_count > 0
 
     def update(self) -> None:
         """Update active particles."""
-        for particle in self.particles:
-            if particle["active"]:
-                particle["x"] += particle["vx"]
-                particle["y"] += particle["vy"]
-                particle["vy"] += 0.1  # Gravity
-                particle["life"] -= 1
+        self.active_count -= step_pool_particles(
+            self.pos, self.vel, self.life, self.active
+        )
 
-                if particle["life"] <= 0:
-                    particle["active"] = False
-                    self.active_count -= 1
+    def _get_sprite(
+        self, color: tuple[int, int, int], size: int, alpha: int
+    ) -> pygame.Surface:
+        """Get a pre-rendered particle circle for a color, size and alpha."""
+        key = (color, size, alpha)
+        sprite = self._sprites.get(key)
+        if sprite is None:
+            sprite = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
+            # Draw opaque, then scale alpha (gfxdraw would blend with the clear pixels)
+            pygame.gfxdraw.filled_circle(sprite, size, size, size, color)
+            sprite.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+            self._sprites[key] = sprite
+        return sprite
+
+    def collect_blits(self) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        """Get (surface, position) pairs for every active particle."""
+        live = np.flatnonzero(self.active)
+        # Simple circles without glow, faded by remaining life; alpha is
+        # rounded to a multiple of 16 so particles share sprites
+        alphas = _quantize_alpha((self.life[live] / self.max_life * 150).astype(int))
+        blits = []
+        for x, y, size, color, alpha in zip(
+            self.pos[live, 0].astype(int).tolist(),
+            self.pos[live, 1].astype(int).tolist(),
+            self.size[live].tolist(),
+            map(tuple, self.color[live].tolist()),
+            alphas.tolist(),
+            strict=True,
+        ):
+            sprite = self._get_sprite(color, size, alpha)
+            blits.append((sprite, (x - size, y - size)))
+        return blits
 
     def draw(self, surface: pygame.Surface) -> None:
-        """Draw particles efficiently."""
-        for particle in self.particles:
-            if particle["active"]:
-                alpha = float(particle["life"]) / float(particle["max_life"])
-                # Draw simple circles without glow
-                color = (
-                    particle["color"][0],
-                    particle["color"][1],
-                    particle["color"][2],
-                    int(alpha * 150),
-                )
-                pos = (int(particle["x"]), int(particle["y"]))
-
-                # Use pygame.gfxdraw for antialiased circles (faster)
-                try:
-                    import pygame.gfxdraw
-
-                    pygame.gfxdraw.filled_circle(
-                        surface, pos[0], pos[1], int(particle["size"]), color
-                    )
-                except:
-                    pygame.draw.circle(surface, color[:3], pos, int(particle["size"]))
+        """Draw particles efficiently with a single blits call."""
+        surface.blits(self.collect_blits(), doreturn=False)
 
 
 class FastNeonEffect:
@@ -208,9 +223,30 @@ class FastNeonEffect:
         width: int = 2,
     ):
         """Draw line with simple glow effect."""
-        # Draw just one glow layer
-        glow_color = (*color, 50)
-        pygame.draw.line(surface, glow_color, start, end, width + 4)
+        # Draw just one glow layer, added onto the target through a scratch
+        # surface covering only the line
+        glow_width = width + 4
+        bounds = pygame.Rect(
+            min(start[0], end[0]) - glow_width,
+            min(start[1], end[1]) - glow_width,
+            abs(end[0] - start[0]) + glow_width * 2,
+            abs(end[1] - start[1]) + glow_width * 2,
+        )
+        if not surface.get_rect().contains(bounds):
+            # Lines are clipped to the target before rasterizing, so ones that
+            # leave it need a target-sized scratch to keep the same pixels
+            bounds = surface.get_rect()
+        scratch = _get_scratch(bounds.size)
+        pygame.draw.line(
+            scratch,
+            _premultiply(color, 50),
+            (start[0] - bounds.x, start[1] - bounds.y),
+            (end[0] - bounds.x, end[1] - bounds.y),
+            glow_width,
+        )
+        surface.blit(
+            scratch, bounds, pygame.Rect((0, 0), bounds.size), pygame.BLEND_RGBA_ADD
+        )
         # Draw core
         pygame.draw.line(surface, color, start, end, width)
 
@@ -1,5 +1,7 @@
 """Enhanced settings menu with improved layout and visual effects."""
 
+import bisect
+import math
 from typing import Any
 
 import pygame
@@ -14,6 +16,7 @@ from .config import (
     GameState,
 )
 from .neon_effects import NeonEffect, NeonText
+from .performance_optimizations import render_cache
 from .sounds import sound_manager
 
 
@@ -83,20 +86,31 @@ class SettingsMenu:
             },
         ]
 
-        # Flatten settings for navigation
+        # One glow effect per category, reused for its separator line
+        self.category_effects = {
+            category["name"]: NeonEffect(category["color"])
+            for category in self.categories
+        }
+
+        # Flatten settings for navigation; category info lives in parallel
+        # lists so the settings themselves are shared, not copied
         self.all_settings: list[dict[str, Any]] = []
+        self.setting_category: list[str] = []
+        self.setting_category_color: list[tuple[int, int, int]] = []
         for category in self.categories:
             for setting in category["settings"]:
-                # Create a copy of the setting to avoid modifying the original
-                setting_copy = dict(setting)  # Use dict() to create a copy
-                setting_copy["category"] = category["name"]
-                setting_copy["category_color"] = category["color"]
-                self.all_settings.append(setting_copy)
+                self.all_settings.append(setting)
+                self.setting_category.append(category["name"])
+                self.setting_category_color.append(category["color"])
 
         self.selected_index = 0
         self.animation_offset = 0
         self.pulse_timer = 0
 
+        # Volume set by the slider but not yet pushed to the mixer
+        self._pending_volume: float | None = None
+        self._applied_volume: float | None = None
+
         # Scrolling support
         self.scroll_offset = 0
         self.visible_area_top = 140  # Below title
@@ -107,19 +121,29 @@ class SettingsMenu:
         self._calculate_content_height()
 
     def _calculate_content_height(self):
-        """Calculate the total height of all settings content."""
+        """Calculate the total height of all settings content.
+
+        Also records the y position of every category header and setting, in
+        all_settings order, so scrolling to the selection is a single lookup and
+        drawing can skip settings outside the visible area.
+        """
         y_offset = 0
         current_category = None
+        self.category_y_offsets: list[int] = []
+        self.setting_y_offsets: list[int] = []
 
         for category in self.categories:
             if current_category != category["name"]:
                 current_category = category["name"]
                 if y_offset > 0:
                     y_offset += 35  # Space for separator
+                self.category_y_offsets.append(y_offset)
                 y_offset += 50  # Category header
 
             # Settings in this category
-            y_offset += len(category["settings"]) * 70
+            for _setting in category["settings"]:
+                self.setting_y_offsets.append(y_offset)
+                y_offset += 70
             y_offset += 20  # Extra space between categories
 
         self.content_height = y_offset
@@ -143,29 +167,7 @@ class SettingsMenu:
 
     def _update_scroll_for_selection(self):
         """Update scroll position to keep selected item visible."""
-        # Calculate y position of selected item
-        y_offset = 0
-        current_category = None
-        setting_index = 0
-        selected_y = 0
-
-        for category in self.categories:
-            if current_category != category["name"]:
-                current_category = category["name"]
-                if y_offset > 0:
-                    y_offset += 35  # Space for separator
-                y_offset += 50  # Category header
-
-            for _setting in category["settings"]:
-                if setting_index == self.selected_index:
-                    selected_y = y_offset
-                    break
-                y_offset += 70
-                setting_index += 1
-            else:
-                y_offset += 20  # Extra space between categories
-                continue
-            break
+        selected_y = self.setting_y_offsets[self.selected_index]
 
         # Calculate actual screen position
         screen_y = selected_y - self.scroll_offset
@@ -215,10 +217,10 @@ class SettingsMenu:
                     self.game.sound_volume = max(0, self.game.sound_volume - 0.1)
                 elif key == pygame.K_RIGHT and self.game.sound_volume < 1:
                     self.game.sound_volume = min(1, self.game.sound_volume + 0.1)
-                # Update sound volumes
-                for sound in sound_manager.sounds.values():
-                    sound.set_volume(self.game.sound_volume)
-                sound_manager.set_music_volume(self.game.sound_volume)
+                # Sound volumes are updated once per frame in update() (or on
+                # leaving the menu), so a held key does not hit the mixer for
+                # every repeat
+                self._pending_volume = self.game.sound_volume
 
         elif setting["type"] == "choice" and setting["name"] == "Difficulty":
             choices = setting["choices"]
@@ -232,13 +234,18 @@ class SettingsMenu:
     def update(self):
         """Update animations."""
         self.pulse_timer += 0.1
-        # Create a simple oscillation without using math.sin
-        # This creates a smooth back-and-forth animation
-        cycle = self.pulse_timer % (2 * 3.14159)  # Approximate 2*pi
-        if cycle < 3.14159:
-            self.animation_offset = (cycle / 3.14159) * 5
-        else:
-            self.animation_offset = ((2 * 3.14159 - cycle) / 3.14159) * 5
+        self.animation_offset = math.sin(self.pulse_timer) * 5
+        self.apply_pending_volume()
+
+    def apply_pending_volume(self):
+        """Apply the latest volume change, skipping it if nothing changed."""
+        if self._pending_volume is not None:
+            if self._pending_volume != self._applied_volume:
+                for sound in sound_manager.sounds.values():
+                    sound.set_volume(self._pending_volume)
+                sound_manager.set_music_volume(self._pending_volume)
+                self._applied_volume = self._pending_volume
+            self._pending_volume = None
 
     def draw_slider(self, x, y, width, height, value, color, selected=False):
         """Draw a visual slider."""
@@ -268,7 +275,7 @@ class SettingsMenu:
 
         # Value text
         percent_text = f"{int(value * 100)}%"
-        value_surface = self.small_font.render(percent_text, True, color)
+        value_surface = render_cache.get_text(self.small_font, percent_text, color)
         value_rect = value_surface.get_rect(center=(x + width // 2, y + height + 20))
         self.screen.blit(value_surface, value_rect)
 
@@ -308,7 +315,7 @@ class SettingsMenu:
         # Status text
         status_text = "ON" if enabled else "OFF"
         text_color = color if enabled else (*color, 100)
-        status_surface = self.small_font.render(status_text, True, text_color)
+        status_surface = render_cache.get_text(self.small_font, status_text, text_color)
         text_x = x + width + 20
         text_rect = status_surface.get_rect(midleft=(text_x, y + height // 2))
         self.screen.blit(status_surface, text_rect)
@@ -324,7 +331,7 @@ class SettingsMenu:
     ):
         """Draw a choice selector with arrows."""
         # Current choice text
-        choice_surface = self.font.render(current_choice, True, color)
+        choice_surface = render_cache.get_text(self.font, current_choice, color)
         choice_rect = choice_surface.get_rect(center=(x, y))
 
         if selected:
@@ -339,14 +346,14 @@ class SettingsMenu:
             arrow_offset = self.animation_offset
 
             # Left arrow
-            left_arrow = self.font.render("◄", True, NEON_PINK)
+            left_arrow = render_cache.get_text(self.font, "◄", NEON_PINK)
             left_rect = left_arrow.get_rect(
                 midright=(choice_rect.left - 20 - arrow_offset, y)
             )
             self.screen.blit(left_arrow, left_rect)
 
             # Right arrow
-            right_arrow = self.font.render("►", True, NEON_PINK)
+            right_arrow = render_cache.get_text(self.font, "►", NEON_PINK)
             right_rect = right_arrow.get_rect(
                 midleft=(choice_rect.right + 20 + arrow_offset, y)
             )
@@ -370,104 +377,91 @@ class SettingsMenu:
         )
         self.screen.set_clip(clip_rect)
 
-        # Draw categories and settings with scroll offset
-        y_offset = self.visible_area_top - self.scroll_offset
-        current_category = None
-        setting_index = 0
-
-        for category in self.categories:
-            # Category header
-            if current_category != category["name"]:
-                current_category = category["name"]
-
-                # Category separator line
-                if y_offset > self.visible_area_top - self.scroll_offset:
-                    line_y = y_offset - 15
-                    # Only draw if visible
-                    if self.visible_area_top <= line_y <= self.visible_area_bottom:
-                        # Create a new NeonEffect for the category color
-                        category_effect = NeonEffect(category["color"])
-                        category_effect.draw_glowing_line(
-                            self.screen,
-                            (SCREEN_WIDTH // 4, line_y),
-                            (3 * SCREEN_WIDTH // 4, line_y),
-                            1,
-                        )
-
-                # Category name
-                if (
-                    self.visible_area_top - 50
-                    <= y_offset
-                    <= self.visible_area_bottom + 50
-                ):
-                    category_surface = self.font.render(
-                        category["name"].upper(), True, category["color"]
-                    )
-                    category_rect = category_surface.get_rect(
-                        center=(SCREEN_WIDTH // 2, y_offset)
-                    )
-                    self.screen.blit(category_surface, category_rect)
-                y_offset += 50
-
-            # Draw settings in this category
-            for setting in category["settings"]:
-                # Only draw if visible
-                if (
-                    self.visible_area_top - 100
-                    <= y_offset
-                    <= self.visible_area_bottom + 100
-                ):
-                    is_selected = setting_index == self.selected_index
-
-                    # Setting name
-                    name_color = (
-                        category["color"] if is_selected else (*category["color"], 180)
-                    )
-                    name_surface = self.font.render(
-                        setting["name"] + ":", True, name_color
-                    )
-                    name_rect = name_surface.get_rect(
-                        midright=(SCREEN_WIDTH // 2 - 30, y_offset)
-                    )
-                    self.screen.blit(name_surface, name_rect)
-
-                    # Setting value/control
-                    control_x = SCREEN_WIDTH // 2 + 30
-
-                    if setting["type"] == "toggle":
-                        self.draw_toggle(
-                            control_x,
-                            y_offset - 15,
-                            80,
-                            30,
-                            setting["value_getter"](),
-                            category["color"],
-                            is_selected,
-                        )
-                    elif setting["type"] == "slider":
-                        self.draw_slider(
-                            control_x,
-                            y_offset - 20,
-                            150,
-                            40,
-                            setting["value_getter"](),
-                            category["color"],
-                            is_selected,
-                        )
-                    elif setting["type"] == "choice":
-                        self.draw_choice_selector(
-                            control_x + 75,
-                            y_offset,
-                            setting["choices"],
-                            setting["value_getter"](),
-                            category["color"],
-                            is_selected,
-                        )
+        # Content y positions are relative to the top of the scrolled content
+        base_y = self.visible_area_top - self.scroll_offset
+        top = self.visible_area_top
+        bottom = self.visible_area_bottom
 
-                y_offset += 70
-                setting_index += 1
+        # Draw category separators and headers; the clip rect trims anything
+        # that is only partly visible, so one generous check skips the rest
+        for index, category in enumerate(self.categories):
+            y_offset = base_y + self.category_y_offsets[index]
+            if not top - 50 <= y_offset <= bottom + 50:
+                continue
 
-            y_offset += 20  # Extra space between categories
+            # Category separator line
+            if index > 0:
+                line_y = y_offset - 30
+                category_effect = self.category_effects[category["name"]]
+                category_effect.draw_glowing_line(
+                    self.screen,
+                    (SCREEN_WIDTH // 4, line_y),
+                    (3 * SCREEN_WIDTH // 4, line_y),
+                    1,
+                )
+
+            # Category name
+            category_surface = render_cache.get_text(
+                self.font, category["name"].upper(), category["color"]
+            )
+            category_rect = category_surface.get_rect(
+                center=(SCREEN_WIDTH // 2, y_offset)
+            )
+            self.screen.blit(category_surface, category_rect)
+
+        # Draw only the settings near the visible area; offsets are sorted, so
+        # the range is found by bisection
+        offsets = self.setting_y_offsets
+        first = bisect.bisect_left(offsets, top - 100 - base_y)
+        last = bisect.bisect_right(offsets, bottom + 100 - base_y)
+        for setting_index in range(first, last):
+            setting = self.all_settings[setting_index]
+            y_offset = base_y + offsets[setting_index]
+            color = self.setting_category_color[setting_index]
+            is_selected = setting_index == self.selected_index
+
+            # Setting name
+            name_color = color if is_selected else (*color, 180)
+            name_surface = render_cache.get_text(
+                self.font, setting["name"] + ":", name_color
+            )
+            name_rect = name_surface.get_rect(
+                midright=(SCREEN_WIDTH // 2 - 30, y_offset)
+            )
+            self.screen.blit(name_surface, name_rect)
+
+            # Setting value/control
+            control_x = SCREEN_WIDTH // 2 + 30
+
+            if setting["type"] == "toggle":
+                self.draw_toggle(
+                    control_x,
+                    y_offset - 15,
+                    80,
+                    30,
+                    setting["value_getter"](),
+                    color,
+                    is_selected,
+                )
+            elif setting["type"] == "slider":
+                self.draw_slider(
+                    control_x,
+                    y_offset - 20,
+                    150,
+                    40,
+                    setting["value_getter"](),
+                    color,
+                    is_selected,
+                )
+            elif setting["type"] == "choice":
+                self.draw_choice_selector(
+                    control_x + 75,
+                    y_offset,
+                    setting["choices"],
+                    setting["value_getter"](),
+                    color,
+                    is_selected,
+                )
 
         # Remove clipping
         self.screen.set_clip(None)
@@ -475,7 +469,7 @@ class SettingsMenu:
         # Draw scroll indicators if needed
         if self.scroll_offset > 0:
             # Up arrow indicator
-            up_arrow = self.font.render("▲", True, NEON_PURPLE)
+            up_arrow = render_cache.get_text(self.font, "▲", NEON_PURPLE)
             up_rect = up_arrow.get_rect(
                 center=(SCREEN_WIDTH // 2, self.visible_area_top - 20)
             )
@@ -483,7 +477,7 @@ class SettingsMenu:
 
         if self.scroll_offset < self.content_height - self.visible_area_height:
             # Down arrow indicator
-            down_arrow = self.font.render("▼", True, NEON_PURPLE)
+            down_arrow = render_cache.get_text(self.font, "▼", NEON_PURPLE)
             down_rect = down_arrow.get_rect(
                 center=(SCREEN_WIDTH // 2, self.visible_area_bottom + 20)
             )
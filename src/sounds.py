@@ -1,9 +1,38 @@
 """Sound generation and management for Neon Invaders."""
 
+import contextlib
+import functools
+import hashlib
+import os
+import tempfile
+
 import numpy as np
 import pygame
 
 from .config import SOUND_ENABLED, SOUND_VOLUME
+from .synth_kernels import arpeggio_notes, bass_notes, lead_notes
+
+# Generated samples are cached on disk so later launches skip synthesis. The
+# cache is keyed on the synthesis source, so editing a generator regenerates it.
+SOUND_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "neon-invanders",
+    "sounds.npz",
+)
+SOUND_SOURCE_PATHS = (
+    __file__,
+    os.path.join(os.path.dirname(__file__), "synth_kernels.py"),
+)
+
+
+@functools.cache
+def _sound_cache_key() -> str:
+    """Hash the modules that synthesize the samples stored in the cache."""
+    digest = hashlib.sha256()
+    for path in SOUND_SOURCE_PATHS:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
 
 
 class SoundManager:
@@ -25,24 +54,80 @@ class SoundManager:
         pygame.mixer.init(frequency=22050, size=-16, channels=2, buffer=512)
         pygame.mixer.set_num_channels(12)  # Increased for music channels
 
-        # Generate and cache all sounds
-        self.sounds = {
-            "player_shoot": self._generate_laser_sound(),
-            "enemy_shoot": self._generate_enemy_laser_sound(),
-            "explosion": self._generate_explosion_sound(),
-            "bonus_collect": self._generate_bonus_sound(),
-            "wave_clear": self._generate_wave_clear_sound(),
-            "game_over": self._generate_game_over_sound(),
-            "power_up": self._generate_power_up_sound(),
-            "shield_hit": self._generate_shield_hit_sound(),
-        }
+        # Load sounds and music from the disk cache, or generate and cache them
+        if not self._load_cached_sounds():
+            self.sounds = {
+                "player_shoot": self._generate_laser_sound(),
+                "enemy_shoot": self._generate_enemy_laser_sound(),
+                "explosion": self._generate_explosion_sound(),
+                "bonus_collect": self._generate_bonus_sound(),
+                "wave_clear": self._generate_wave_clear_sound(),
+                "game_over": self._generate_game_over_sound(),
+                "power_up": self._generate_power_up_sound(),
+                "shield_hit": self._generate_shield_hit_sound(),
+            }
+
+            # Generate background music
+            self._generate_all_music_themes()
+            self._save_cached_sounds()
 
         # Set volume for all sounds
         for sound in self.sounds.values():
             sound.set_volume(SOUND_VOLUME)
 
-        # Generate background music
-        self._generate_all_music_themes()
+    def _load_cached_sounds(self) -> bool:
+        """Load sounds and music themes from the disk cache.
+
+        Returns False when there is no usable cache, leaving state untouched.
+        """
+        try:
+            with np.load(SOUND_CACHE_PATH) as archive:
+                if str(archive["key"]) != _sound_cache_key():
+                    return False
+                sounds = {
+                    name.removeprefix("sfx_"): pygame.sndarray.make_sound(archive[name])
+                    for name in archive.files
+                    if name.startswith("sfx_")
+                }
+                themes = [
+                    [
+                        pygame.sndarray.make_sound(archive[f"music_{theme}_{track}"])
+                        for track in range(3)
+                    ]
+                    for theme in range(3)
+                ]
+        except (OSError, KeyError, ValueError, pygame.error):
+            return False
+
+        self.sounds = sounds
+        self.all_music_themes = themes
+        return True
+
+    def _save_cached_sounds(self):
+        """Write all generated samples to the disk cache, ignoring failures."""
+        temp_path = None
+        try:
+            arrays = {"key": np.array(_sound_cache_key())}
+            for name, sound in self.sounds.items():
+                arrays[f"sfx_{name}"] = pygame.sndarray.array(sound)
+            for theme, tracks in enumerate(self.all_music_themes):
+                for track, sound in enumerate(tracks):
+                    arrays[f"music_{theme}_{track}"] = pygame.sndarray.array(sound)
+
+            cache_dir = os.path.dirname(SOUND_CACHE_PATH)
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write a uniquely named temp file and rename it, so a crash never
+            # leaves a truncated cache and concurrent launches don't collide
+            with tempfile.NamedTemporaryFile(
+                dir=cache_dir, suffix=".tmp", delete=False
+            ) as f:
+                temp_path = f.name
+                np.savez(f, **arrays)
+            os.replace(temp_path, SOUND_CACHE_PATH)
+        except (OSError, pygame.error):
+            if temp_path is not None:
+                with contextlib.suppress(OSError):
+                    os.remove(temp_path)
 
     def play(self, sound_name: str):
         """Play a sound by name."""
@@ -96,10 +181,7 @@ class SoundManager:
     ) -> np.ndarray:
         """Generate a pure sine wave tone."""
         frames = int(duration * sample_rate)
-        arr = np.zeros(frames)
-        for i in range(frames):
-            arr[i] = np.sin(2 * np.pi * frequency * i / sample_rate)
-        return arr
+        return np.sin(2 * np.pi * frequency * np.arange(frames) / sample_rate)
 
     def _generate_noise(self, duration: float, sample_rate: int = 22050) -> np.ndarray:
         """Generate white noise."""
@@ -142,6 +224,21 @@ class SoundManager:
 
         return sound * envelope
 
+    def _make_stereo_sound(
+        self, sound: np.ndarray, gain: float = 1.0
+    ) -> pygame.mixer.Sound:
+        """Scale, clip and convert a mono signal to a 16-bit stereo sound.
+
+        Works in place on `sound` and writes both channels in one pass.
+        """
+        if gain != 1.0:
+            sound *= gain
+        np.clip(sound, -1, 1, out=sound)
+        sound *= 32767
+        stereo_sound = np.empty((len(sound), 2), dtype=np.int16)
+        stereo_sound[:] = sound[:, None]
+        return pygame.sndarray.make_sound(stereo_sound)
+
     def _generate_laser_sound(self) -> pygame.mixer.Sound:
         """Generate player laser sound - high pitched descending beep."""
         duration = 0.15
@@ -159,16 +256,8 @@ class SoundManager:
         # Add slight resonance
         sound += 0.3 * np.sin(4 * np.pi * frequency * t)
 
-        # Normalize and convert to 16-bit
-        sound = np.clip(sound * 0.3, -1, 1)
-        sound = (sound * 32767).astype(np.int16)
-
-        # Create stereo sound
-        stereo_sound = np.zeros((len(sound), 2), dtype=np.int16)
-        stereo_sound[:, 0] = sound
-        stereo_sound[:, 1] = sound
-
-        return pygame.sndarray.make_sound(stereo_sound)
+        # Normalize and convert to 16-bit stereo
+        return self._make_stereo_sound(sound, 0.3)
 
     def _generate_enemy_laser_sound(self) -> pygame.mixer.Sound:
         """Generate enemy laser sound - lower pitched ascending beep."""
@@ -187,16 +276,8 @@ class SoundManager:
         # Add some buzz
         sound += 0.2 * np.sin(8 * np.pi * frequency * t)
 
-        # Normalize and convert to 16-bit
-        sound = np.clip(sound * 0.25, -1, 1)
-        sound = (sound * 32767).astype(np.int16)
-
-        # Create stereo sound
-        stereo_sound = np.zeros((len(sound), 2), dtype=np.int16)
-        stereo_sound[:, 0] = sound
-        stereo_sound[:, 1] = sound
-
-        return pygame.sndarray.make_sound(stereo_sound)
+        # Normalize and convert to 16-bit stereo
+        return self._make_stereo_sound(sound, 0.25)
 
     def _generate_explosion_sound(self) -> pygame.mixer.Sound:
         """Generate explosion sound - noise burst with low frequency rumble."""
@@ -218,16 +299,8 @@ class SoundManager:
         envelope = np.exp(-t * 8)  # Quick decay
         sound = sound * envelope
 
-        # Normalize and convert to 16-bit
-        sound = np.clip(sound * 0.5, -1, 1)
-        sound = (sound * 32767).astype(np.int16)
-
-        # Create stereo sound
-        stereo_sound = np.zeros((len(sound), 2), dtype=np.int16)
-        stereo_sound[:, 0] = sound
-        stereo_sound[:, 1] = sound
-
-        return pygame.sndarray.make_sound(stereo_sound)
+        # Normalize and convert to 16-bit stereo
+        return self._make_stereo_sound(sound, 0.5)
 
     def _generate_bonus_sound(self) -> pygame.mixer.Sound:
         """Generate bonus collection sound - ascending arpeggio."""
@@ -256,16 +329,8 @@ class SoundManager:
         # Combine notes
         sound = np.concatenate([note1, note2, note3])
 
-        # Normalize and convert to 16-bit
-        sound = np.clip(sound * 0.3, -1, 1)
-        sound = (sound * 32767).astype(np.int16)
-
-        # Create stereo sound
-        stereo_sound = np.zeros((len(sound), 2), dtype=np.int16)
-        stereo_sound[:, 0] = sound
-        stereo_sound[:, 1] = sound
-
-        return pygame.sndarray.make_sound(stereo_sound)
+        # Normalize and convert to 16-bit stereo
+        return self._make_stereo_sound(sound, 0.3)
 
     def _generate_wave_clear_sound(self) -> pygame.mixer.Sound:
         """Generate wave clear sound - triumphant fanfare."""
@@ -277,27 +342,24 @@ class SoundManager:
         # Major chord progression
         sound = np.zeros(len(t))
 
-        # Add harmonics for richness
+        # Add harmonics for richness, sharing one phase ramp and sine buffer
         frequencies = [261.63, 329.63, 392.00, 523.25]  # C major chord
+        phase = 2 * np.pi * t
+        wave = np.empty_like(phase)
         for i, freq in enumerate(frequencies):
             amplitude = 0.3 / (i + 1)
-            sound += amplitude * np.sin(2 * np.pi * freq * t)
+            np.multiply(phase, freq, out=wave)
+            np.sin(wave, out=wave)
+            wave *= amplitude
+            sound += wave
 
         # Apply envelope
         sound = self._apply_envelope(
             sound, attack=0.1, decay=0.1, sustain=0.6, release=0.2
         )
 
-        # Normalize and convert to 16-bit
-        sound = np.clip(sound * 0.4, -1, 1)
-        sound = (sound * 32767).astype(np.int16)
-
-        # Create stereo sound
-        stereo_sound = np.zeros((len(sound), 2), dtype=np.int16)
-        stereo_sound[:, 0] = sound
-        stereo_sound[:, 1] = sound
-
-        return pygame.sndarray.make_sound(stereo_sound)
+        # Normalize and convert to 16-bit stereo
+        return self._make_stereo_sound(sound, 0.4)
 
     def _generate_game_over_sound(self) -> pygame.mixer.Sound:
         """Generate game over sound - descending sad tones."""
@@ -318,16 +380,8 @@ class SoundManager:
             )
             sound = np.concatenate([sound, note])
 
-        # Normalize and convert to 16-bit
-        sound = np.clip(sound * 0.3, -1, 1)
-        sound = (sound * 32767).astype(np.int16)
-
-        # Create stereo sound
-        stereo_sound = np.zeros((len(sound), 2), dtype=np.int16)
-        stereo_sound[:, 0] = sound
-        stereo_sound[:, 1] = sound
-
-        return pygame.sndarray.make_sound(stereo_sound)
+        # Normalize and convert to 16-bit stereo
+        return self._make_stereo_sound(sound, 0.3)
 
     def _generate_power_up_sound(self) -> pygame.mixer.Sound:
         """Generate power-up activation sound - energetic sweep up."""
@@ -339,10 +393,15 @@ class SoundManager:
         # Frequency sweep from low to high
         frequency = np.linspace(200, 1200, len(t))
 
-        # Generate sweep with harmonics
-        sound = np.sin(2 * np.pi * frequency * t)
-        sound += 0.3 * np.sin(2 * np.pi * frequency * 2 * t)  # Octave
-        sound += 0.2 * np.sin(2 * np.pi * frequency * 3 * t)  # Fifth
+        # Generate sweep with harmonics, sharing one phase ramp and sine buffer
+        phase = 2 * np.pi * frequency * t
+        sound = np.sin(phase)
+        wave = np.empty_like(phase)
+        for harmonic, amplitude in ((2, 0.3), (3, 0.2)):  # Octave, fifth
+            np.multiply(phase, harmonic, out=wave)
+            np.sin(wave, out=wave)
+            wave *= amplitude
+            sound += wave
 
         # Apply envelope
         sound = self._apply_envelope(
@@ -379,8 +438,14 @@ class SoundManager:
         harmonics = [1, 1.6, 2.3, 3.7, 4.9]
         amplitudes = [0.5, 0.3, 0.2, 0.15, 0.1]
 
+        # Share one phase ramp and sine buffer across the harmonics
+        phase = 2 * np.pi * base_freq * t
+        wave = np.empty_like(phase)
         for harmonic, amplitude in zip(harmonics, amplitudes, strict=False):
-            sound += amplitude * np.sin(2 * np.pi * base_freq * harmonic * t)
+            np.multiply(phase, harmonic, out=wave)
+            np.sin(wave, out=wave)
+            wave *= amplitude
+            sound += wave
 
         # Quick attack and decay for impact
         envelope = np.exp(-t * 20)
@@ -390,16 +455,8 @@ class SoundManager:
         ring = np.sin(2 * np.pi * 130 * t)
         sound = sound * (1 + 0.3 * ring)
 
-        # Normalize and convert to 16-bit
-        sound = np.clip(sound * 0.4, -1, 1)
-        sound = (sound * 32767).astype(np.int16)
-
-        # Create stereo sound
-        stereo_sound = np.zeros((len(sound), 2), dtype=np.int16)
-        stereo_sound[:, 0] = sound
-        stereo_sound[:, 1] = sound
-
-        return pygame.sndarray.make_sound(stereo_sound)
+        # Normalize and convert to 16-bit stereo
+        return self._make_stereo_sound(sound, 0.4)
 
     def _generate_all_music_themes(self):
         """Generate all music themes for different levels."""
@@ -459,6 +516,25 @@ class SoundManager:
             self._generate_arpeggio_track(loop_duration, sample_rate, "theme3"),
         ]
 
+    def _schedule_notes(
+        self, pattern: list[tuple[float, float]], frames: int, sample_rate: int
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Turn (frequency, seconds) notes into frequency and frame-count arrays.
+
+        Notes are played back to back and cut off at the end of the track.
+        """
+        freqs = np.empty(len(pattern))
+        lengths = np.empty(len(pattern), dtype=np.int64)
+        current_time = 0
+        for i, (freq, note_duration) in enumerate(pattern):
+            note_frames = int(note_duration * sample_rate)
+            if current_time + note_frames > frames:
+                note_frames = frames - current_time
+            freqs[i] = freq
+            lengths[i] = note_frames
+            current_time += note_frames
+        return freqs, lengths
+
     def _generate_bass_track(
         self, duration: float, sample_rate: int, theme: str = "theme1"
     ) -> pygame.mixer.Sound:
@@ -504,45 +580,15 @@ class SoundManager:
                 (27.50, 0.5),  # A0
             ]
 
-        # Create bass line
-        current_time = 0
-        for freq, note_duration in bass_pattern * 2:  # Repeat pattern twice
-            note_frames = int(note_duration * sample_rate)
-            if current_time + note_frames > frames:
-                note_frames = frames - current_time
-
-            # Generate bass note with saw wave for that analog feel
-            note_t = t[current_time : current_time + note_frames]
-            # Saw wave
-            note = 2 * (note_t * freq % 1) - 1
-            # Add sub bass sine wave
-            note += 0.5 * np.sin(2 * np.pi * freq * note_t)
-
-            # Apply envelope
-            envelope = np.ones(len(note))
-            attack_frames = int(0.01 * sample_rate)
-            release_frames = int(0.05 * sample_rate)
-            if len(note) > attack_frames:
-                envelope[:attack_frames] = np.linspace(0, 1, attack_frames)
-            if len(note) > release_frames:
-                envelope[-release_frames:] = np.linspace(1, 0, release_frames)
-
-            sound[current_time : current_time + note_frames] = note * envelope * 0.3
-            current_time += note_frames
+        # Create bass line, repeating the pattern twice
+        freqs, lengths = self._schedule_notes(bass_pattern * 2, frames, sample_rate)
+        bass_notes(sound, t, freqs, lengths, sample_rate)
 
         # Apply low-pass filter effect (simple averaging)
         filtered = np.convolve(sound, np.ones(5) / 5, mode="same")
 
-        # Normalize and convert
-        filtered = np.clip(filtered, -1, 1)
-        filtered = (filtered * 32767).astype(np.int16)
-
-        # Create stereo
-        stereo_sound = np.zeros((len(filtered), 2), dtype=np.int16)
-        stereo_sound[:, 0] = filtered
-        stereo_sound[:, 1] = filtered
-
-        return pygame.sndarray.make_sound(stereo_sound)
+        # Normalize and convert to 16-bit stereo
+        return self._make_stereo_sound(filtered)
 
     def _generate_lead_track(
         self, duration: float, sample_rate: int, theme: str = "theme1"
@@ -590,36 +636,8 @@ class SoundManager:
             ]
 
         # Create lead melody
-        current_time = 0
-        for freq, note_duration in lead_pattern:
-            note_frames = int(note_duration * sample_rate)
-            if current_time + note_frames > frames:
-                note_frames = frames - current_time
-
-            # Generate lead with detuned saw waves for that classic synth sound
-            note_t = t[current_time : current_time + note_frames]
-            # Two slightly detuned oscillators
-            osc1 = 2 * (note_t * freq % 1) - 1
-            osc2 = 2 * (note_t * (freq * 1.01) % 1) - 1
-            note = (osc1 + osc2) * 0.5
-
-            # Apply envelope with longer attack for smooth sound
-            envelope = np.ones(len(note))
-            attack_frames = int(0.05 * sample_rate)
-            decay_frames = int(0.1 * sample_rate)
-            release_frames = int(0.1 * sample_rate)
-
-            if len(note) > attack_frames:
-                envelope[:attack_frames] = np.linspace(0, 1, attack_frames)
-            if len(note) > attack_frames + decay_frames:
-                envelope[attack_frames : attack_frames + decay_frames] = np.linspace(
-                    1, 0.7, decay_frames
-                )
-            if len(note) > release_frames:
-                envelope[-release_frames:] = np.linspace(0.7, 0, release_frames)
-
-            sound[current_time : current_time + note_frames] = note * envelope * 0.15
-            current_time += note_frames
+        freqs, lengths = self._schedule_notes(lead_pattern, frames, sample_rate)
+        lead_notes(sound, t, freqs, lengths, sample_rate)
 
         # Apply vibrato for that synth feel
         vibrato_rate = 5  # Hz
@@ -686,33 +704,13 @@ class SoundManager:
 
         sixteenth_duration = (60.0 / bpm) / 4 / note_multiplier
 
-        # Create arpeggio
-        current_time = 0
-        note_index = 0
-        while current_time < frames:
-            note_frames = int(sixteenth_duration * sample_rate)
-            if current_time + note_frames > frames:
-                note_frames = frames - current_time
-
-            freq = arp_notes[note_index % len(arp_notes)]
-            note_t = t[current_time : current_time + note_frames]
-
-            # Square wave with PWM for that classic sound
-            pwm_width = 0.3 + 0.2 * np.sin(2 * np.pi * 0.5 * note_t)  # Slow PWM
-            note = np.where((note_t * freq % 1) < pwm_width, 1, -1)
-
-            # Quick envelope
-            envelope = np.ones(len(note))
-            attack_frames = int(0.005 * sample_rate)
-            release_frames = int(0.02 * sample_rate)
-            if len(note) > attack_frames:
-                envelope[:attack_frames] = np.linspace(0, 1, attack_frames)
-            if len(note) > release_frames:
-                envelope[-release_frames:] = np.linspace(1, 0, release_frames)
-
-            sound[current_time : current_time + note_frames] = note * envelope * 0.1
-            current_time += note_frames
-            note_index += 1
+        # Create arpeggio, cycling through the notes until the loop is full
+        note_frames = int(sixteenth_duration * sample_rate)
+        note_count = -(-frames // note_frames)
+        freqs = np.array(arp_notes)[np.arange(note_count) % len(arp_notes)]
+        lengths = np.full(note_count, note_frames)
+        lengths[-1] = frames - note_frames * (note_count - 1)
+        arpeggio_notes(sound, t, freqs, lengths, sample_rate)
 
         # Add delay effect
         delay_time = int(0.375 * sample_rate)  # Dotted eighth delay
@@ -24,6 +24,9 @@ class SpriteCache:
             NEON_GREEN, NEON_YELLOW
         )
         self._cache["enemy_bullet"] = self._create_bullet_sprite(NEON_RED, NEON_ORANGE)
+        self._cache["elite_bullet"] = self._create_elite_bullet_sprite(
+            self._cache["enemy_bullet"]
+        )
         self._cache["explosion"] = self._create_explosion_frames()
 
         # Create tetris bonus sprites
@@ -265,6 +268,14 @@ class SpriteCache:
         )
         return sprite
 
+    def _create_elite_bullet_sprite(self, base_sprite):
+        """Create a purple-tinted copy of the enemy bullet for elite enemies."""
+        sprite = base_sprite.copy()
+        tint = pygame.Surface(sprite.get_size())
+        tint.fill((255, 100, 255))
+        sprite.blit(tint, (0, 0), special_flags=pygame.BLEND_MULT)
+        return sprite
+
     def _create_tetris_sprite(self, shape_type):
         """Create a tetris-themed bonus sprite with enhanced visuals."""
         sprite = pygame.Surface((36, 36), pygame.SRCALPHA)  # Increased from 24x24
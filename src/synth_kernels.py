@@ -0,0 +1,198 @@
+"""Numeric kernels for synthesizing the music tracks note by note.
+
+Each kernel writes a whole track of back-to-back notes into a preallocated
+buffer. Numba is optional: when it is installed the oscillators and envelopes
+are fused into one native loop per track, otherwise each note is rendered with
+NumPy array expressions.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - depends on the environment
+    njit = None
+
+
+def _ramp_at(start, stop, num, k):
+    """Value k of np.linspace(start, stop, num), computed the same way."""
+    if num == 1:
+        return start
+    if k == num - 1:
+        return stop
+    return k * ((stop - start) / (num - 1)) + start
+
+
+if njit is not None:
+    _ramp_at = njit(cache=True)(_ramp_at)
+
+
+def _envelope_at(i, n, attack, decay, release, release_level):
+    """Gain at frame i of an n-frame note with linear attack, decay and release."""
+    gain = 1.0
+    if n > attack and i < attack:
+        gain = _ramp_at(0.0, 1.0, attack, i)
+    if n > attack + decay and attack <= i < attack + decay:
+        gain = _ramp_at(1.0, 0.7, decay, i - attack)
+    if n > release and i >= n - release:
+        gain = _ramp_at(release_level, 0.0, release, i - (n - release))
+    return gain
+
+
+if njit is not None:
+    _envelope_at = njit(cache=True)(_envelope_at)
+
+
+def _saw(note_t, freq):
+    """Saw wave 2 * (t * freq % 1) - 1, computed in one buffer."""
+    note = note_t * freq
+    np.remainder(note, 1, out=note)
+    note *= 2
+    note -= 1
+    return note
+
+
+def _bass_notes_loop(sound, t, freqs, lengths, sample_rate):
+    """Write saw + sub sine bass notes back to back into sound."""
+    attack = int(0.01 * sample_rate)
+    release = int(0.05 * sample_rate)
+    start = 0
+    for k in range(freqs.shape[0]):
+        freq = freqs[k]
+        n = lengths[k]
+        for i in range(n):
+            x = t[start + i]
+            # Saw wave for that analog feel, plus a sub bass sine wave
+            note = 2 * (x * freq % 1) - 1
+            note += 0.5 * np.sin(2 * np.pi * freq * x)
+            gain = _envelope_at(i, n, attack, 0, release, 1.0)
+            sound[start + i] = note * gain * 0.3
+        start += n
+
+
+def _bass_notes_numpy(sound, t, freqs, lengths, sample_rate):
+    """Per-note NumPy fallback for _bass_notes_loop when Numba is unavailable."""
+    attack_frames = int(0.01 * sample_rate)
+    release_frames = int(0.05 * sample_rate)
+    start = 0
+    for freq, note_frames in zip(freqs.tolist(), lengths.tolist(), strict=True):
+        note_t = t[start : start + note_frames]
+        note = _saw(note_t, freq)
+        sub = 2 * np.pi * freq * note_t
+        np.sin(sub, out=sub)
+        sub *= 0.5
+        note += sub
+
+        envelope = np.ones(len(note))
+        if len(note) > attack_frames:
+            envelope[:attack_frames] = np.linspace(0, 1, attack_frames)
+        if len(note) > release_frames:
+            envelope[-release_frames:] = np.linspace(1, 0, release_frames)
+
+        sound[start : start + note_frames] = note * envelope * 0.3
+        start += note_frames
+
+
+if njit is not None:
+    bass_notes = njit(cache=True)(_bass_notes_loop)
+else:
+    bass_notes = _bass_notes_numpy
+
+
+def _lead_notes_loop(sound, t, freqs, lengths, sample_rate):
+    """Write detuned twin-saw lead notes back to back into sound."""
+    attack = int(0.05 * sample_rate)
+    decay = int(0.1 * sample_rate)
+    release = int(0.1 * sample_rate)
+    start = 0
+    for k in range(freqs.shape[0]):
+        freq = freqs[k]
+        n = lengths[k]
+        for i in range(n):
+            x = t[start + i]
+            # Two slightly detuned oscillators
+            osc1 = 2 * (x * freq % 1) - 1
+            osc2 = 2 * (x * (freq * 1.01) % 1) - 1
+            note = (osc1 + osc2) * 0.5
+            gain = _envelope_at(i, n, attack, decay, release, 0.7)
+            sound[start + i] = note * gain * 0.15
+        start += n
+
+
+def _lead_notes_numpy(sound, t, freqs, lengths, sample_rate):
+    """Per-note NumPy fallback for _lead_notes_loop when Numba is unavailable."""
+    attack_frames = int(0.05 * sample_rate)
+    decay_frames = int(0.1 * sample_rate)
+    release_frames = int(0.1 * sample_rate)
+    start = 0
+    for freq, note_frames in zip(freqs.tolist(), lengths.tolist(), strict=True):
+        note_t = t[start : start + note_frames]
+        note = _saw(note_t, freq)
+        note += _saw(note_t, freq * 1.01)
+        note *= 0.5
+
+        envelope = np.ones(len(note))
+        if len(note) > attack_frames:
+            envelope[:attack_frames] = np.linspace(0, 1, attack_frames)
+        if len(note) > attack_frames + decay_frames:
+            envelope[attack_frames : attack_frames + decay_frames] = np.linspace(
+                1, 0.7, decay_frames
+            )
+        if len(note) > release_frames:
+            envelope[-release_frames:] = np.linspace(0.7, 0, release_frames)
+
+        sound[start : start + note_frames] = note * envelope * 0.15
+        start += note_frames
+
+
+if njit is not None:
+    lead_notes = njit(cache=True)(_lead_notes_loop)
+else:
+    lead_notes = _lead_notes_numpy
+
+
+def _arpeggio_notes_loop(sound, t, freqs, lengths, sample_rate):
+    """Write pulse-width modulated square notes back to back into sound."""
+    attack = int(0.005 * sample_rate)
+    release = int(0.02 * sample_rate)
+    start = 0
+    for k in range(freqs.shape[0]):
+        freq = freqs[k]
+        n = lengths[k]
+        for i in range(n):
+            x = t[start + i]
+            # Square wave with a slow PWM for that classic sound
+            pwm_width = 0.3 + 0.2 * np.sin(2 * np.pi * 0.5 * x)
+            note = 1.0 if x * freq % 1 < pwm_width else -1.0
+            gain = _envelope_at(i, n, attack, 0, release, 1.0)
+            sound[start + i] = note * gain * 0.1
+        start += n
+
+
+def _arpeggio_notes_numpy(sound, t, freqs, lengths, sample_rate):
+    """Per-note NumPy fallback for _arpeggio_notes_loop."""
+    attack_frames = int(0.005 * sample_rate)
+    release_frames = int(0.02 * sample_rate)
+    start = 0
+    for freq, note_frames in zip(freqs.tolist(), lengths.tolist(), strict=True):
+        note_t = t[start : start + note_frames]
+        pwm_width = 0.3 + 0.2 * np.sin(2 * np.pi * 0.5 * note_t)
+        # +1 below the pulse width, -1 above it, without np.where's int array
+        note = note_t * freq
+        np.remainder(note, 1, out=note)
+        note = 1.0 - 2.0 * (note >= pwm_width)
+
+        envelope = np.ones(len(note))
+        if len(note) > attack_frames:
+            envelope[:attack_frames] = np.linspace(0, 1, attack_frames)
+        if len(note) > release_frames:
+            envelope[-release_frames:] = np.linspace(1, 0, release_frames)
+
+        sound[start : start + note_frames] = note * envelope * 0.1
+        start += note_frames
+
+
+if njit is not None:
+    arpeggio_notes = njit(cache=True)(_arpeggio_notes_loop)
+else:
+    arpeggio_notes = _arpeggio_notes_numpy
@@ -0,0 +1,16 @@
+"""Shared pytest configuration for the Neon Invaders test suite."""
+
+import os
+import shutil
+import tempfile
+
+# src.sounds builds a SoundManager at import time, which writes its sample
+# cache under XDG_CACHE_HOME. Point that at a throwaway directory before any
+# test module imports the game, so test runs never touch the user's cache.
+_cache_dir = tempfile.mkdtemp(prefix="neon-invanders-tests-")
+os.environ["XDG_CACHE_HOME"] = _cache_dir
+
+
+def pytest_unconfigure():
+    """Remove the throwaway cache directory."""
+    shutil.rmtree(_cache_dir, ignore_errors=True)
@@ -0,0 +1,61 @@
+"""Unit tests for the numeric kernels in collision_kernels."""
+
+import os
+import sys
+
+import numpy as np
+import pygame
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.collision_kernels import _aabb_pairs_loop, _aabb_pairs_numpy, aabb_pairs
+
+
+def _as_ltrb(rects):
+    """Convert rects to the (left, top, right, bottom) layout used by kernels."""
+    return np.array(
+        [(r.left, r.top, r.right, r.bottom) for r in rects], dtype=np.int32
+    ).reshape(-1, 4)
+
+
+class TestAabbPairs:
+    """Test cases for the AABB pair kernels."""
+
+    def setup_method(self):
+        """Set up a mix of overlapping, touching and separate rects."""
+        self.a_rects = [
+            pygame.Rect(0, 0, 10, 10),
+            pygame.Rect(50, 50, 6, 10),
+            pygame.Rect(200, 200, 5, 5),
+        ]
+        self.b_rects = [
+            pygame.Rect(5, 5, 10, 10),  # overlaps a[0]
+            pygame.Rect(10, 0, 10, 10),  # touches a[0] edge only
+            pygame.Rect(48, 55, 20, 20),  # overlaps a[1]
+        ]
+
+    def _expected(self):
+        return [
+            [i, j]
+            for i, a in enumerate(self.a_rects)
+            for j, b in enumerate(self.b_rects)
+            if a.colliderect(b)
+        ]
+
+    def test_kernels_match_colliderect(self):
+        """Test every kernel agrees with Rect.colliderect."""
+        a = _as_ltrb(self.a_rects)
+        b = _as_ltrb(self.b_rects)
+        for kernel in (aabb_pairs, _aabb_pairs_loop, _aabb_pairs_numpy):
+            out = np.empty((len(a) * len(b), 2), dtype=np.int32)
+            count = kernel(a, b, out)
+            assert out[:count].tolist() == self._expected()
+
+    def test_kernels_handle_empty_input(self):
+        """Test kernels return no pairs for empty inputs."""
+        a = _as_ltrb(self.a_rects)
+        empty = _as_ltrb([])
+        out = np.empty((0, 2), dtype=np.int32)
+        assert aabb_pairs(a, empty, out) == 0
+        assert aabb_pairs(empty, a, out) == 0
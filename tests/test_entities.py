@@ -392,6 +392,27 @@ class TestTripleShotBullet:
         assert bullet.rect.y == initial_y - 5
         assert bullet.rect.x == initial_x + int(0.5 * 5)
 
+    def test_triple_shot_bullet_subpixel_movement(self):
+        """Test fractional horizontal velocity accumulates across frames."""
+        bullet = TripleShotBullet(100, 300, -5, "player", 0.1)
+        initial_x = bullet.rect.x
+        for _ in range(4):
+            bullet.update()
+        # 0.5 px per frame would truncate to 0 without the accumulator
+        assert bullet.rect.x == initial_x + 2
+
+    def test_triple_shot_bullet_pool_key_roundtrip(self):
+        """Test pool_key rebuilds an equivalent bullet via reset."""
+        bullet = TripleShotBullet(100, 200, -BULLET_SPEED, "player", 0.2)
+        cls, *args = bullet.pool_key()
+        assert cls is TripleShotBullet
+
+        reused = TripleShotBullet(0, 0, 1, "enemy", 0)
+        reused.reset(*args)
+        assert reused.rect.center == bullet.rect.center
+        assert reused.x_velocity == 0.2
+        assert reused.vx == bullet.vx
+
     def test_triple_shot_bullet_removal_sides(self):
         """Test triple shot bullet is removed when going off sides."""
         # Test left side
@@ -555,6 +576,23 @@ class TestEnemyGroup:
         self.enemy_group.create_formation(1)
         assert len(self.enemy_group.enemies) == ENEMY_ROWS * ENEMY_COLS
 
+    def test_create_formation_reuses_pooled_enemies(self):
+        """Test a new formation reuses enemies released by the previous one."""
+        self.enemy_group.create_formation(1)
+        first_wave = set(self.enemy_group.enemies)
+        # Move an enemy so reset has something to undo
+        moved = next(iter(first_wave))
+        moved.direction = -1
+        moved.drop_distance = 10
+
+        self.enemy_group.create_formation(1)
+        second_wave = set(self.enemy_group.enemies)
+        assert len(second_wave) == ENEMY_ROWS * ENEMY_COLS
+        assert first_wave & second_wave
+        for enemy in second_wave:
+            assert enemy.direction == 1
+            assert enemy.drop_distance == 0
+
     def test_create_formation_wave_2(self):
         """Test enemy formation for wave 2 includes elite enemies."""
         # Create formation for wave 2
@@ -666,6 +704,29 @@ class TestEnemyGroup:
                 ):
                     assert bottom_enemy.rect.bottom >= other_enemy.rect.bottom
 
+    def test_get_bottom_enemies_invalidated_on_kill(self):
+        """Test killing a shooter refreshes the bottom enemy cache."""
+        self.enemy_group.create_formation(1)
+        bottom_enemies = self.enemy_group.get_bottom_enemies()
+        assert self.enemy_group.get_bottom_enemies() is bottom_enemies
+
+        killed = bottom_enemies[0]
+        killed.kill()
+        refreshed = self.enemy_group.get_bottom_enemies()
+        assert killed not in refreshed
+        assert len(refreshed) == ENEMY_COLS
+
+    def test_get_bottom_enemies_invalidated_on_add_not_move(self):
+        """Test the shooter cache survives movement but not a new enemy."""
+        self.enemy_group.create_formation(1)
+        bottom_enemies = self.enemy_group.get_bottom_enemies()
+        self.enemy_group.update(0)
+        assert self.enemy_group.get_bottom_enemies() is bottom_enemies
+
+        newcomer = Enemy(bottom_enemies[0].rect.centerx, SCREEN_HEIGHT - 100, 0)
+        self.enemy_group.enemies.add(newcomer)
+        assert newcomer in self.enemy_group.get_bottom_enemies()
+
     def test_is_empty(self):
         """Test empty check."""
         assert self.enemy_group.is_empty() is True
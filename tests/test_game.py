@@ -2,7 +2,7 @@
 
 import os
 import sys
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pygame
 import pytest
@@ -15,14 +15,21 @@ from src.config import (
     ENEMY_COLS,
     ENEMY_ROWS,
     ENEMY_SCORE,
+    FPS,
     MUSIC_ENABLED,
+    NEON_CYAN,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
     SOUND_ENABLED,
     SOUND_VOLUME,
     WAVE_CLEAR_BONUS,
+    BonusType,
     GameState,
 )
 from src.entities import Bonus, Bullet, Player
 from src.game import Game
+from src.neon_effects import NeonEffect
+from src.performance import bullet_pool
 
 
 class TestGame:
@@ -179,6 +186,38 @@ class TestGame:
             assert self.game.player.score == initial_score + ENEMY_SCORE
         assert len(self.game.player_bullets) == 0  # Bullet removed
 
+    def test_check_collisions_one_enemy_absorbs_one_bullet(self):
+        """Test two bullets on the same enemy only spend the first bullet."""
+        self.game.reset_game()
+
+        enemy = next(iter(self.game.enemy_group.enemies))
+        first = Bullet(enemy.rect.centerx, enemy.rect.centery, 0, "player")
+        second = Bullet(enemy.rect.centerx, enemy.rect.centery, 0, "player")
+        self.game.player_bullets.add(first, second)
+        initial_enemies = len(self.game.enemy_group.enemies)
+
+        with patch("src.sounds.sound_manager.play"):
+            self.game.check_collisions()
+
+        assert len(self.game.enemy_group.enemies) == initial_enemies - 1
+        assert len(self.game.player_bullets) == 1
+
+    def test_check_collisions_returns_spent_bullet_to_pool(self):
+        """Test a bullet destroyed in a collision goes back to the bullet pool."""
+        self.game.reset_game()
+
+        enemy = next(iter(self.game.enemy_group.enemies))
+        bullet = bullet_pool.get_bullet(
+            Bullet, enemy.rect.centerx, enemy.rect.centery, 0, "player"
+        )
+        self.game.player_bullets.add(bullet)
+
+        with patch("src.sounds.sound_manager.play"):
+            self.game.check_collisions()
+
+        assert bullet not in bullet_pool.active
+        assert bullet in bullet_pool.available[Bullet]
+
     def test_check_collisions_enemy_bullet_hits_player(self):
         """Test collision detection for enemy bullets hitting player."""
         self.game.reset_game()
@@ -201,6 +240,25 @@ class TestGame:
             assert self.game.player.lives == initial_lives - 1
         assert len(self.game.enemy_bullets) == 0  # Bullet removed
 
+    def test_check_collisions_enemy_bullet_after_moving(self):
+        """Test the bullet grid tracks moved bullets and forgets killed ones."""
+        self.game.reset_game()
+        assert self.game.player is not None
+
+        # Bullet starts far above the player and falls onto it
+        player_rect = self.game.player.rect
+        bullet = Bullet(player_rect.centerx, player_rect.centery - 200, 200, "enemy")
+        self.game.enemy_bullets.add(bullet)
+        self.game.enemy_bullets.update()
+        initial_lives = self.game.player.lives
+
+        with patch("src.sounds.sound_manager.play"):
+            self.game.check_collisions()
+
+        assert self.game.player.lives == initial_lives - 1
+        assert len(self.game.enemy_bullets) == 0
+        assert self.game.enemy_bullets.grid == {}
+
     def test_check_collisions_player_collects_bonus(self):
         """Test collision detection for player collecting bonuses."""
         self.game.reset_game()
@@ -221,6 +279,105 @@ class TestGame:
             assert self.game.player.score == initial_score + BONUS_SCORE
         assert len(self.game.bonuses) == 0  # Bonus removed
 
+    def test_shield_matches_glowing_circle(self):
+        """Test the pre-rendered shield looks like NeonEffect's glowing circle."""
+        reference = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.game.screen = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+        # Draw twice so the second pass goes through the cached rings
+        for _ in range(2):
+            NeonEffect(NEON_CYAN).draw_glowing_circle(reference, (400, 500), 35, 3)
+            self.game._draw_shield((400, 500))
+
+        assert pygame.image.tobytes(self.game.screen, "RGB") == pygame.image.tobytes(
+            reference, "RGB"
+        )
+
+    def test_fps_surface_rendered_once_per_value(self):
+        """Test each FPS value is rendered once and then reused."""
+        self.game.clock = MagicMock()
+        self.game.clock.get_fps.return_value = 60.4
+        first = self.game._get_fps_surface()
+        assert self.game._get_fps_surface() is first
+
+        self.game.clock.get_fps.return_value = 59.0
+        second = self.game._get_fps_surface()
+        assert second is not first
+
+        # Flipping back to an earlier value reuses its surface
+        self.game.clock.get_fps.return_value = 60.0
+        assert self.game._get_fps_surface() is first
+
+    def test_run_paces_frames_with_busy_loop(self):
+        """Test the main loop waits for each frame with tick_busy_loop."""
+        self.game.clock = MagicMock()
+        self.game.vsync = False
+
+        def stop():
+            self.game.running = False
+
+        with (
+            patch.object(self.game, "handle_events", side_effect=stop),
+            patch.object(self.game, "draw"),
+        ):
+            self.game.run()
+
+        self.game.clock.tick_busy_loop.assert_called_once_with(FPS)
+        self.game.clock.tick.assert_not_called()
+
+    def test_run_keeps_fps_cap_with_vsync(self):
+        """Test vsync replaces the busy loop but keeps the FPS cap."""
+        self.game.clock = MagicMock()
+        self.game.vsync = True
+
+        def stop():
+            self.game.running = False
+
+        with (
+            patch.object(self.game, "handle_events", side_effect=stop),
+            patch.object(self.game, "draw"),
+        ):
+            self.game.run()
+
+        self.game.clock.tick.assert_called_once_with(FPS)
+        self.game.clock.tick_busy_loop.assert_not_called()
+
+    def test_create_screen_falls_back_without_vsync(self):
+        """Test a window is still opened when vsync cannot be set."""
+        real_set_mode = pygame.display.set_mode
+
+        def set_mode(size, flags=0, **kwargs):
+            if kwargs.get("vsync"):
+                raise pygame.error("vsync not available")
+            return real_set_mode(size, flags)
+
+        with (
+            patch("pygame.display.get_driver", return_value="x11"),
+            patch("pygame.display.set_mode", side_effect=set_mode) as mock_set_mode,
+        ):
+            screen = self.game._create_screen()
+
+        assert mock_set_mode.call_count == 2
+
+        assert screen.get_size() == (SCREEN_WIDTH, SCREEN_HEIGHT)
+        assert self.game.vsync is False
+
+    def test_apply_bonus_effect_dispatch(self):
+        """Test each bonus type runs its handler and awards the bonus score."""
+        self.game.reset_game()
+        player = self.game.player
+        assert player is not None
+
+        with patch("src.sounds.sound_manager.play"):
+            self.game.apply_bonus_effect(BonusType.SHIELD)
+            assert player.shield_active
+            self.game.apply_bonus_effect(BonusType.TRIPLE_SHOT)
+            assert player.triple_shot_active
+            # Unknown types still play the sound but award nothing
+            self.game.apply_bonus_effect(99)
+
+        assert player.score == 2 * BONUS_SCORE
+
     def test_game_over_no_lives(self):
         """Test game over when player has no lives."""
         self.game.reset_game()
@@ -367,6 +524,59 @@ class TestGameStates:
         self.game.handle_events()
         assert self.game.state == GameState.PLAYING
 
+    def test_paused_screen_presented_once(self):
+        """Test the static pause screen is only redrawn after leaving pause."""
+        self.game.reset_game()
+        self.game.state = GameState.PAUSED
+
+        with patch("pygame.display.flip") as mock_flip:
+            self.game.draw()
+            self.game.draw()
+            assert mock_flip.call_count == 1
+
+            self.game.state = GameState.PLAYING
+            self.game.draw()
+            self.game.state = GameState.PAUSED
+            self.game.draw()
+            assert mock_flip.call_count == 3
+
+    def test_visual_effects_freeze_while_paused(self):
+        """Test the background stays still under the once-drawn pause screen."""
+        self.game.state = GameState.PAUSED
+        with patch.object(self.game, "_update_visual_effects") as mock_effects:
+            self.game.update()
+            mock_effects.assert_not_called()
+
+            self.game.state = GameState.MENU
+            self.game.update()
+            mock_effects.assert_called_once()
+
+    @pytest.mark.parametrize("event_type", [pygame.WINDOWEXPOSED, pygame.VIDEORESIZE])
+    def test_paused_screen_redrawn_when_window_exposed(self, event_type):
+        """Test an exposed or resized window gets the pause screen again."""
+        self.game.reset_game()
+        self.game.state = GameState.PAUSED
+
+        with patch("pygame.display.flip") as mock_flip:
+            self.game.draw()
+            pygame.event.post(pygame.event.Event(event_type))
+            self.game.handle_events()
+            self.game.draw()
+            self.game.draw()
+            assert mock_flip.call_count == 2
+
+    def test_draw_dispatches_on_state(self):
+        """Test draw() calls the drawer registered for the current state."""
+        drawer = MagicMock()
+        self.game._draw_handlers[GameState.GAME_OVER] = drawer
+        self.game.state = GameState.GAME_OVER
+
+        with patch("pygame.display.flip") as mock_flip:
+            self.game.draw()
+
+        drawer.assert_called_once_with()
+        mock_flip.assert_called_once()
+
     def test_paused_state_quit_to_menu(self):
         """Test quitting to menu from paused state."""
         self.game.state = GameState.PAUSED
@@ -643,6 +853,31 @@ class TestParticleEffects:
         # Explosion should be created
         assert len(self.game.explosions) == initial_explosions + 1
 
+    def test_particles_reenabled_explosion_on_enemy_kill(self):
+        """Test toggling particles off and on restores explosions."""
+        self.game.particles_enabled = False
+        self.game.particles_enabled = True
+
+        enemy = next(iter(self.game.enemy_group.enemies))
+        bullet = Bullet(enemy.rect.centerx, enemy.rect.centery, 0, "player")
+        self.game.player_bullets.add(bullet)
+
+        with patch("src.sounds.sound_manager.play"):
+            self.game.check_collisions()
+
+        assert len(self.game.explosions) == 1
+
+    def test_disabling_particles_clears_effects(self):
+        """Test turning particles off drops effects already in flight."""
+        self.game._spawn_sparkle(100, 100)
+        self.game._spawn_rainbow_pulse(100, 100)
+
+        self.game.particles_enabled = False
+        self.game._update_visual_effects()
+
+        assert self.game.sparkle_effects == []
+        assert self.game.rainbow_pulses == []
+
     def test_particles_disabled_no_explosion_on_enemy_kill(self):
         """Test that no explosions are created when particles are disabled."""
         self.game.particles_enabled = False
@@ -832,6 +1067,24 @@ class TestMusicSettings:
             # Music should be toggled off
             assert self.game.music_enabled is False
 
+    def test_leaving_settings_applies_pending_volume(self):
+        """Test a volume change made in the frame settings is closed still lands."""
+        self.game.sound_volume = 0.5
+        self.game.state = GameState.SETTINGS
+        self.game.settings_menu.selected_index = 2  # Volume setting
+
+        for key in (pygame.K_RIGHT, pygame.K_ESCAPE):
+            pygame.event.post(pygame.event.Event(pygame.KEYDOWN, {"key": key}))
+
+        with patch("src.settings_menu.sound_manager") as mock_sound_manager:
+            mock_sound_manager.sounds = {}
+            self.game.handle_events()
+
+        assert self.game.state == GameState.MENU
+        mock_sound_manager.set_music_volume.assert_called_once_with(
+            self.game.sound_volume
+        )
+
     def test_sound_disable_also_disables_music(self):
         """Test that disabling sound also disables music."""
         self.game.sound_enabled = True
@@ -0,0 +1,80 @@
+"""Unit tests for the optimized game components."""
+
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pygame
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.config import NEON_GREEN, SCREEN_HEIGHT, SCREEN_WIDTH
+from src.game_optimized import OptimizedGame, OptimizedNeonTrail
+
+
+class TestOptimizedNeonTrail:
+    """Test cases for OptimizedNeonTrail."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        self.trail = OptimizedNeonTrail(NEON_GREEN, 8)
+        yield
+        pygame.quit()
+
+    def test_draw_matches_per_segment_lines(self):
+        """Test the single strip matches drawing each segment separately."""
+        for pos in [(100, 500), (120, 480), (150, 470), (190, 475), (230, 490)]:
+            self.trail.add_point(pos)
+
+        expected = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        points = self.trail.trail_points
+        for i in range(1, len(points)):
+            pygame.draw.line(expected, NEON_GREEN, points[i - 1], points[i], 1)
+
+        actual = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.trail.draw(actual)
+
+        assert pygame.image.tobytes(actual, "RGB") == pygame.image.tobytes(
+            expected, "RGB"
+        )
+
+    def test_draw_skips_short_trail(self):
+        """Test nothing is drawn until the trail has two points."""
+        self.trail.add_point((100, 100))
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.trail.draw(surface)
+        assert pygame.image.tobytes(surface, "RGB") == bytes(
+            SCREEN_WIDTH * SCREEN_HEIGHT * 3
+        )
+
+
+class TestOptimizedGame:
+    """Test cases for OptimizedGame."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        self.game = OptimizedGame()
+        yield
+        if os.path.exists("highscore.json"):
+            os.remove("highscore.json")
+        pygame.quit()
+
+    def test_particles_disabled_skips_effect_updates(self):
+        """Test no pulse or sparkle is stepped while particles are off."""
+        self.game.particles_enabled = False
+        pulse = MagicMock()
+        sparkle = MagicMock()
+        self.game.rainbow_pulses.append(pulse)
+        self.game.sparkle_effects.append(sparkle)
+
+        for _ in range(2):  # Sparkles only update on every other frame
+            self.game._update_visual_effects()
+
+        pulse.update.assert_not_called()
+        sparkle.update.assert_not_called()
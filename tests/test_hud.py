@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch
 import pygame
 
 from src.config import (
+    NEON_CYAN,
     NEON_GREEN,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
@@ -126,6 +127,34 @@ class TestAnimatedText(unittest.TestCase):
         text_surface.get_rect.assert_called_with(topleft=(20, 10))
         screen.blit.assert_called_once()
 
+    def test_render_reuses_surface_until_text_changes(self):
+        """Test the text is only re-rendered when it changes."""
+        screen = Mock()
+        text = AnimatedText("Score: 0", self.font, NEON_GREEN, (20, 10), align="left")
+
+        text.render(screen)
+        text.render(screen)
+        assert self.font.render.call_count == 1
+
+        text.text = "Score: 10"
+        text.render(screen)
+        assert self.font.render.call_count == 2
+        assert screen.blit.call_count == 3
+
+    def test_render_cache_is_bounded(self):
+        """Test finished surfaces are cached per state and capped in size."""
+        screen = Mock()
+        text = AnimatedText("Test", self.font, NEON_GREEN, (100, 50))
+
+        for alpha in range(AnimatedText.CACHE_SIZE + 4):
+            text.alpha = alpha
+            text.render(screen)
+
+        assert len(text._cache) == AnimatedText.CACHE_SIZE
+        # The oldest alpha values were evicted first
+        assert ("Test", NEON_GREEN, 1.0, 0) not in text._cache
+        assert self.font.render.call_count == 1
+
 
 class TestHUD(unittest.TestCase):
     """Test cases for HUD class."""
@@ -176,11 +205,33 @@ class TestHUD(unittest.TestCase):
         self.player.score = 100
 
         with patch.object(self.hud.score_text, "start_effect") as mock_effect:
-            self.hud.update(self.player, 1, self.enemy_group)
+            self.hud.update(self.player, 1, self.enemy_group, 1000)
 
             assert self.hud.score_text.text == "Score: 100"
             assert self.hud.last_score == 100
-            mock_effect.assert_called_once_with("pulse", 500)
+            mock_effect.assert_called_once_with("pulse", 500, 1000)
+
+    @patch("pygame.time.get_ticks")
+    def test_update_uses_passed_frame_time(self, mock_get_ticks):
+        """Test a frame time passed to update() replaces every clock read."""
+        self.player.score = 50
+        self.hud.update(self.player, 1, self.enemy_group, 1000)
+
+        mock_get_ticks.assert_not_called()
+        assert self.hud.score_text.effect_start_time == 1000
+        assert self.hud.score_change_texts[0][2] == 1000
+
+    def test_update_drops_expired_score_changes_in_place(self):
+        """Test score texts older than two seconds are removed in place."""
+        self.hud.add_score_change(10, 1000)
+        self.hud.add_score_change(20, 2500)
+        texts = self.hud.score_change_texts
+        self.hud.last_score = self.player.score  # No new score change
+
+        self.hud.update(self.player, 1, self.enemy_group, 3200)
+
+        assert self.hud.score_change_texts is texts
+        assert [value for *_, value in texts] == [20]
 
     @patch("pygame.time.get_ticks")
     def test_add_score_change(self, mock_get_ticks):
@@ -244,6 +295,32 @@ class TestHUD(unittest.TestCase):
         assert self.hud.bonus_indicators[1]["pos"] == (20, 105)  # Rapid fire
         assert self.hud.bonus_indicators[2]["pos"] == (20, 140)  # Triple shot
 
+    @patch("pygame.time.get_ticks")
+    def test_bonus_indicator_labels_cached(self, mock_get_ticks):
+        """Test indicator labels are rendered once while their text is unchanged."""
+        mock_get_ticks.return_value = 1000
+        self.player.triple_shot_active = True
+        self.hud.update_bonus_indicators(self.player)
+
+        self.hud.small_font = Mock(spec=pygame.font.Font)
+        self.hud.render()
+        self.hud.render()
+
+        labels = [c.args[0] for c in self.hud.small_font.render.call_args_list]
+        assert labels.count("Triple Shot Ready!") == 1
+
+    def test_bonus_indicator_progress_bar(self):
+        """Test each indicator's bar is filled below its label."""
+        self.player.shield_active = True
+        self.player.shield_end_time = 2500
+        self.hud.update_bonus_indicators(self.player, 1000)
+
+        self.hud.render(1000)
+
+        fills = [c.args for c in self.screen.fill.call_args_list]
+        assert ((*NEON_CYAN, 64), (20, 95, 100, 4)) in fills  # Background
+        assert (NEON_CYAN, (20, 95, 50, 4)) in fills  # Half the shield left
+
     def test_show_wave_transition(self):
         """Test wave transition animation."""
         self.hud.show_wave_transition(2)
@@ -335,6 +412,50 @@ class TestMinimapHUD(unittest.TestCase):
         # Note: The exact positions depend on the scaling calculations
         # The important thing is that y-positions use full screen height for scaling
 
+    @patch("pygame.draw.rect")
+    def test_render_reuses_background(self, mock_rect):
+        """Test the minimap chrome is drawn once, not every frame."""
+        self.minimap.render(self.enemy_group, self.player)
+        self.minimap.render(self.enemy_group, self.player)
+
+        mock_rect.assert_not_called()
+        self.screen.blit.assert_called_with(
+            self.minimap._surface, (self.minimap.x, self.minimap.y)
+        )
+
+    @patch("pygame.draw.circle")
+    def test_render_projects_enemy_positions(self, mock_circle):
+        """Test enemies are drawn at their scaled minimap positions."""
+        self.minimap.render(self.enemy_group, self.player)
+
+        scale_x = 120 / SCREEN_WIDTH
+        scale_y = 80 / SCREEN_HEIGHT
+        enemy_calls = mock_circle.call_args_list[:2]
+        assert enemy_calls[0].args[2] == [int(115 * scale_x), int(115 * scale_y)]
+        assert enemy_calls[1].args[2] == [int(615 * scale_x), int(315 * scale_y)]
+        assert enemy_calls[1].args[1] == MinimapHUD.ELITE_COLOR
+
+    @patch("pygame.draw.circle")
+    def test_render_rebuilds_at_reduced_rate(self, mock_circle):
+        """Test markers are redrawn every REFRESH_INTERVAL frames."""
+        for _ in range(MinimapHUD.REFRESH_INTERVAL):
+            self.minimap.render(self.enemy_group, self.player)
+
+        assert mock_circle.call_count == 3  # One rebuild: 2 enemies + player
+        assert self.screen.blit.call_count == MinimapHUD.REFRESH_INTERVAL
+
+        self.minimap.render(self.enemy_group, self.player)
+        assert mock_circle.call_count == 6
+
+    @patch("pygame.draw.circle")
+    def test_render_rebuilds_when_enemy_count_changes(self, mock_circle):
+        """Test a killed enemy disappears from the minimap immediately."""
+        self.minimap.render(self.enemy_group, self.player)
+        self.enemy_group.enemies = [self.enemy1]
+        self.minimap.render(self.enemy_group, self.player)
+
+        assert mock_circle.call_count == 5  # 2 + 1 enemies, player twice
+
 
 if __name__ == "__main__":
     unittest.main()
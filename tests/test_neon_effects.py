@@ -0,0 +1,638 @@
+"""Unit tests for neon visual effects."""
+
+import math
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pygame
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src import neon_effects
+from src.config import NEON_CYAN, SCREEN_HEIGHT, SCREEN_WIDTH
+from src.neon_effects import (
+    HUE_RGB,
+    HeartBeat,
+    NeonEffect,
+    NeonExplosion,
+    NeonGrid,
+    NeonPulse,
+    NeonText,
+    NeonTrail,
+    RainbowPulse,
+    SparkleEffect,
+    StarField,
+    _quantize_alpha,
+    _scratch_surfaces,
+    create_neon_surface,
+)
+
+
+def _premultiplied(color, alpha):
+    """Color scaled by alpha, as additive glow layers draw it."""
+    return tuple(c * alpha // 255 for c in color)
+
+
+def _full_screen_glow_line(surface, color, start, end, width):
+    """Reference glow line added through screen-sized temp surfaces."""
+    for i in range(3):
+        temp = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        glow_color = _premultiplied(color, 50 + i * 30)
+        pygame.draw.line(temp, glow_color, start, end, width + (3 - i) * 2)
+        surface.blit(temp, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+    pygame.draw.line(surface, color, start, end, width)
+
+
+def _full_screen_particles(surface, color, particles):
+    """Reference explosion particles drawn on screen-sized temp surfaces."""
+    for x, y, life, max_life, size in particles:
+        alpha = (int(110 * (life / max_life)) + 8) & 0xF0
+        center = (int(x), int(y))
+        temp = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        glow_color = _premultiplied(color, alpha // 4)
+        pygame.draw.circle(temp, glow_color, center, size + 3)
+        surface.blit(temp, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        temp = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        pygame.draw.circle(temp, (*color, alpha), center, size)
+        surface.blit(temp, (0, 0))
+
+
+class TestNeonEffect:
+    """Test cases for NeonEffect."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        self.effect = NeonEffect(NEON_CYAN)
+        yield
+        pygame.quit()
+
+    @pytest.mark.parametrize(
+        ("start", "end"),
+        [((100, 100), (300, 250)), ((-20, 500), (400, 620)), ((790, 10), (810, 40))],
+    )
+    def test_glowing_line_matches_full_screen_layers(self, start, end):
+        """Test scratch-surface glow lines match full-screen temp surfaces."""
+        expected = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        _full_screen_glow_line(expected, NEON_CYAN, start, end, 2)
+
+        actual = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.effect.draw_glowing_line(actual, start, end, 2)
+
+        assert pygame.image.tobytes(actual, "RGB") == pygame.image.tobytes(
+            expected, "RGB"
+        )
+
+    def test_glowing_rect_reuses_scratch_surface(self):
+        """Test repeated glow rects share one scratch surface."""
+        _scratch_surfaces.clear()
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.effect.draw_glowing_rect(surface, pygame.Rect(100, 100, 50, 30), 2, 5)
+        scratches = dict(_scratch_surfaces)
+        self.effect.draw_glowing_rect(surface, pygame.Rect(300, 200, 50, 30), 2, 5)
+
+        assert _scratch_surfaces == scratches
+        assert all(s.get_width() < SCREEN_WIDTH for s in scratches.values())
+
+
+class TestNeonTrail:
+    """Test cases for NeonTrail."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        self.trail = NeonTrail(NEON_CYAN, 6)
+        yield
+        pygame.quit()
+
+    def test_add_point_keeps_newest_points(self):
+        """Test the trail drops its oldest points beyond max_length."""
+        for x in range(10):
+            self.trail.add_point((x, 0))
+        assert list(self.trail.trail_points) == [(x, 0) for x in range(4, 10)]
+
+    @pytest.mark.parametrize("start", [(400, 300), (5, 595)])
+    def test_draw_matches_full_screen_segments(self, start):
+        """Test the shared scratch matches screen-sized temp surfaces."""
+        x, y = start
+        for dx, dy in [(0, 0), (12, -4), (9, 7), (-6, 11), (14, 3), (3, -9)]:
+            x, y = x + dx, y + dy
+            self.trail.add_point((x, y))
+
+        expected = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        points = self.trail.trail_points
+        for i in range(1, len(points)):
+            alpha = int(255 * (i / len(points)) * 0.5)
+            width = max(1, int(3 * (i / len(points))))
+            # Additive glow segment, then the alpha-blended core segment
+            temp = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            glow_color = _premultiplied(NEON_CYAN, alpha // 3)
+            pygame.draw.line(temp, glow_color, points[i - 1], points[i], width + 4)
+            expected.blit(temp, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            temp = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            pygame.draw.line(temp, (*NEON_CYAN, alpha), points[i - 1], points[i], width)
+            expected.blit(temp, (0, 0))
+
+        actual = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.trail.draw(actual)
+
+        assert pygame.image.tobytes(actual, "RGB") == pygame.image.tobytes(
+            expected, "RGB"
+        )
+
+
+class TestNeonPulse:
+    """Test cases for NeonPulse."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        yield
+        pygame.quit()
+
+    @pytest.mark.parametrize("center", [(400, 300), (10, 590)])
+    def test_draw_matches_full_screen_rings(self, center):
+        """Test rings drawn through the scratch match screen-sized surfaces."""
+        pulse = NeonPulse(center, NEON_CYAN, max_radius=60, speed=3)
+        for _ in range(6):
+            pulse.update()
+
+        expected = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        for i in range(3):
+            radius = int(pulse.current_radius - i * 5)
+            alpha = max(0, pulse.alpha - i * 50)
+            temp = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            pygame.draw.circle(temp, (*NEON_CYAN, alpha), center, radius, 2)
+            expected.blit(temp, (0, 0))
+
+        actual = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pulse.draw(actual)
+
+        assert pygame.image.tobytes(actual, "RGB") == pygame.image.tobytes(
+            expected, "RGB"
+        )
+
+
+class TestRainbowPulse:
+    """Test cases for RainbowPulse."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        yield
+        pygame.quit()
+
+    def test_hue_table_matches_color_hsva(self):
+        """Test every hue table entry equals the Color.hsva conversion."""
+        for hue in range(360):
+            color = pygame.Color(0)
+            color.hsva = (hue, 100, 100, 100)
+            assert HUE_RGB[hue] == (color.r, color.g, color.b)
+
+    def test_draw_matches_hsva_colors(self):
+        """Test hue table rings match colors built with Color.hsva."""
+        pulse = RainbowPulse((400, 300), max_radius=60)
+        for _ in range(14):  # Hue passes 60 so rings straddle several hues
+            pulse.update()
+
+        expected = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        for i in range(5):
+            color = pygame.Color(0)
+            color.hsva = ((pulse.hue + i * 30) % 360, 100, 100, 50 - i * 10)
+            temp = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            radius = int(pulse.current_radius - i * 3)
+            pygame.draw.circle(temp, color, (400, 300), radius, 2)
+            expected.blit(temp, (0, 0))
+
+        actual = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        pulse.draw(actual)
+
+        assert pygame.image.tobytes(actual, "RGB") == pygame.image.tobytes(
+            expected, "RGB"
+        )
+
+
+class TestNeonText:
+    """Test cases for NeonText."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        self.font = pygame.font.Font(None, 48)
+        yield
+        pygame.quit()
+
+    @pytest.mark.parametrize("pos", [(400, 80), (10, 590)])
+    def test_draw_matches_per_layer_rendering(self, pos):
+        """Test cached layers match rendering and scaling every glow layer."""
+        expected = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        for i in range(3):
+            glow_size = (3 - i) * 2
+            glow = self.font.render("SETTINGS", True, (*NEON_CYAN, 50 + i * 30))
+            glow = pygame.transform.smoothscale(
+                glow, (glow.get_width() + glow_size, glow.get_height() + glow_size)
+            )
+            temp = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            temp.blit(glow, glow.get_rect(center=pos))
+            expected.blit(temp, (0, 0))
+        core = self.font.render("SETTINGS", True, NEON_CYAN)
+        expected.blit(core, core.get_rect(center=pos))
+
+        actual = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        NeonText.draw_glowing_text(actual, "SETTINGS", self.font, pos, NEON_CYAN)
+
+        assert pygame.image.tobytes(actual, "RGB") == pygame.image.tobytes(
+            expected, "RGB"
+        )
+
+    def test_render_matches_per_layer_compositing(self):
+        """Test the cached text surface matches compositing every glow layer."""
+        core = self.font.render("PAUSED", True, NEON_CYAN)
+        expected = pygame.Surface(
+            (core.get_width() + 6, core.get_height() + 6), pygame.SRCALPHA
+        )
+        center = expected.get_rect().center
+        for i in range(3):
+            glow_size = (3 - i) * 2
+            glow = self.font.render("PAUSED", True, (*NEON_CYAN, 50 + i * 30))
+            glow = pygame.transform.smoothscale(
+                glow, (glow.get_width() + glow_size, glow.get_height() + glow_size)
+            )
+            expected.blit(glow, glow.get_rect(center=center))
+        expected.blit(core, core.get_rect(center=center))
+
+        actual = NeonText.render_glowing_text("PAUSED", self.font, NEON_CYAN)
+
+        assert actual is NeonText.render_glowing_text("PAUSED", self.font, NEON_CYAN)
+        assert pygame.image.tobytes(actual, "RGBA") == pygame.image.tobytes(
+            expected, "RGBA"
+        )
+
+    def test_repeated_text_renders_once(self):
+        """Test drawing the same text again reuses the cached layers."""
+        font = MagicMock()
+        font.render.return_value = pygame.Surface((40, 20), pygame.SRCALPHA)
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+
+        for _ in range(3):
+            NeonText.draw_glowing_text(surface, "WAVE 1", font, (100, 100), NEON_CYAN)
+
+        assert font.render.call_count == 4  # 3 glow layers + core text
+
+
+class TestQuantizeAlpha:
+    """Test cases for the shared particle alpha rounding."""
+
+    def test_rounds_to_nearest_multiple_of_16(self):
+        """Test alphas round to the nearest multiple of 16."""
+        alphas = np.array([0, 7, 8, 23, 24, 110, 150])
+        assert _quantize_alpha(alphas).tolist() == [0, 0, 16, 16, 32, 112, 144]
+
+    def test_nearly_opaque_alpha_does_not_wrap(self):
+        """Test alphas of 248 and up stay opaque instead of wrapping to 0."""
+        alphas = np.array([247, 248, 255])
+        assert _quantize_alpha(alphas).tolist() == [240, 240, 240]
+        assert _quantize_alpha(255) == 240
+
+
+class TestNeonExplosion:
+    """Test cases for NeonExplosion particles."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        yield
+        pygame.quit()
+
+    def test_draw_matches_full_screen_circles(self):
+        """Test cached particle sprites match circles drawn on temp surfaces."""
+        explosion = NeonExplosion((3, 200), NEON_CYAN, particle_count=1)
+        explosion.pulse.active = False  # Compare particles only
+        explosion.vx[:] = 1.5
+        explosion.vy[:] = -2.0
+        explosion.size[:] = 4
+        explosion.life[:] = explosion.max_life[:] = 60
+        for _ in range(7):
+            explosion.update()
+
+        expected = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        _full_screen_particles(
+            expected,
+            NEON_CYAN,
+            [(explosion.pos_x[0], explosion.pos_y[0], 53, 60, 4)],
+        )
+        actual = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        explosion.draw(actual)
+
+        assert pygame.image.tobytes(actual, "RGB") == pygame.image.tobytes(
+            expected, "RGB"
+        )
+
+    def test_explosion_draws_particles_in_one_blits_call(self):
+        """Test an explosion submits all particle sprites at once."""
+        explosion = NeonExplosion((400, 300), NEON_CYAN, particle_count=5)
+        surface = MagicMock(spec=pygame.Surface)
+        explosion.life[0] = 1
+        explosion.update()
+
+        explosion.draw(surface)
+
+        surface.blits.assert_called_once()
+        assert len(surface.blits.call_args.args[0]) == 8  # Glow + core each
+
+    def test_explosion_matches_per_particle_reference(self):
+        """Test the array-backed explosion moves and draws like single particles."""
+        explosion = NeonExplosion((400, 300), NEON_CYAN, particle_count=6)
+        explosion.pulse.active = False  # Compare particles only
+        # [x, y, vx, vy, life, max_life, size], stepped one particle at a time
+        particles = [
+            [400.0, 300.0, vx, vy, life, life, size]
+            for vx, vy, life, size in zip(
+                explosion.vx.tolist(),
+                explosion.vy.tolist(),
+                explosion.life.tolist(),
+                explosion.size.tolist(),
+                strict=True,
+            )
+        ]
+        for _ in range(35):
+            explosion.update()
+            for particle in particles:
+                particle[0] += particle[2]
+                particle[1] += particle[3]
+                particle[4] -= 1
+                particle[3] += 0.1  # Gravity
+            particles = [p for p in particles if p[4] > 0]
+
+        assert explosion.pos_x.tolist() == [p[0] for p in particles]
+        assert explosion.pos_y.tolist() == [p[1] for p in particles]
+
+        expected = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        _full_screen_particles(
+            expected,
+            NEON_CYAN,
+            [
+                (x, y, life, max_life, size)
+                for x, y, _, _, life, max_life, size in particles
+            ],
+        )
+        actual = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        explosion.draw(actual)
+        assert pygame.image.tobytes(actual, "RGB") == pygame.image.tobytes(
+            expected, "RGB"
+        )
+
+
+class TestNeonGrid:
+    """Test cases for NeonGrid."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        self.grid = NeonGrid(60, NEON_CYAN, 20)
+        yield
+        pygame.quit()
+
+    @pytest.mark.parametrize("offset", [0, 13.5, 59.5])
+    def test_draw_matches_line_drawing(self, offset):
+        """Test line sprites match drawing the grid lines on a temp surface."""
+        self.grid.offset = offset
+        temp = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        for x in range(0, SCREEN_WIDTH + 60, 60):
+            pygame.draw.line(temp, self.grid.color, (x, 0), (x, SCREEN_HEIGHT), 1)
+        for y in self.grid._row_positions():
+            pygame.draw.line(temp, self.grid.color, (0, y), (SCREEN_WIDTH, y), 1)
+        expected = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        expected.blit(temp, (0, 0))
+
+        actual = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.grid.draw(actual)
+
+        assert pygame.image.tobytes(actual, "RGB") == pygame.image.tobytes(
+            expected, "RGB"
+        )
+
+    def test_rows_move_with_perspective(self):
+        """Test lower rows scroll further than upper ones."""
+        before = self.grid._row_positions()
+        self.grid.offset = 30
+        after = self.grid._row_positions()
+        assert after[0] == before[0]
+        assert after[-1] - before[-1] > after[1] - before[1]
+
+
+class TestStarField:
+    """Test cases for StarField."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        self.starfield = StarField(20)
+        yield
+        pygame.quit()
+
+    def test_update_moves_stars_down(self):
+        """Test every star moves by its own speed."""
+        self.starfield.y[:] = 0
+        self.starfield.update()
+        assert (self.starfield.y == self.starfield.speed).all()
+
+    def test_update_wraps_stars_to_top(self):
+        """Test stars leaving the bottom restart at the top."""
+        self.starfield.y[:] = SCREEN_HEIGHT
+        self.starfield.update()
+        assert (self.starfield.y == 0).all()
+        assert ((self.starfield.x >= 0) & (self.starfield.x <= SCREEN_WIDTH)).all()
+
+    def test_draw_reuses_star_surfaces(self):
+        """Test drawing caches one core surface per star size."""
+        surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.starfield.draw(surface)
+        self.starfield.draw(surface)
+        assert set(self.starfield._cores) <= {1, 2, 3}
+
+    def test_twinkle_phase_wraps_around_table(self):
+        """Test the integer twinkle phase stays a valid sine table index."""
+        self.starfield.twinkle[:] = 1020
+        self.starfield.update()
+        assert (self.starfield.twinkle == (1020 + 16) % 1024).all()
+
+
+class TestSparkleEffect:
+    """Test cases for SparkleEffect."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        self.effect = SparkleEffect((100, 100))
+        yield
+        pygame.quit()
+
+    def test_update_drops_expired_sparkles_in_order(self):
+        """Test expired sparkles are removed and survivors keep their order."""
+        for _ in range(10):
+            self.effect.update()
+        survivors = self.effect.sparkles[:]
+        self.effect.sparkles[0].life = 1
+
+        self.effect.update()
+
+        assert self.effect.sparkles[: len(survivors) - 1] == survivors[1:]
+        assert all(sparkle.life > 0 for sparkle in self.effect.sparkles)
+
+    def test_spawned_sparkles_use_slots(self):
+        """Test sparkles store their fields in slots rather than a dict."""
+        for _ in range(5):
+            self.effect.update()
+        sparkle = self.effect.sparkles[0]
+        assert not hasattr(sparkle, "__dict__")
+        assert sparkle.max_life == 30
+        assert sparkle.life == 29
+
+    def test_spawned_sparkles_use_unit_direction(self):
+        """Test sine table directions keep sparkle speed in its range."""
+        for _ in range(50):
+            self.effect.update()
+        for sparkle in self.effect.sparkles:
+            speed = math.hypot(sparkle.vx, sparkle.vy)
+            assert 0.5 - 1e-6 <= speed <= 2 + 1e-6
+
+    def test_draw_matches_full_screen_polygons(self):
+        """Test cached star sprites match stars drawn on screen-sized surfaces."""
+        self.effect.pos = (3, 100)  # Some sparkles drift off the left edge
+        for _ in range(25):
+            self.effect.update()
+
+        expected = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        for sparkle in self.effect.sparkles:
+            alpha = int(255 * (sparkle.life / sparkle.max_life))
+            cx, cy = int(sparkle.x), int(sparkle.y)
+            size = sparkle.size
+            points = [
+                (cx, cy - size),
+                (cx + size // 2, cy - size // 2),
+                (cx + size, cy),
+                (cx + size // 2, cy + size // 2),
+                (cx, cy + size),
+                (cx - size // 2, cy + size // 2),
+                (cx - size, cy),
+                (cx - size // 2, cy - size // 2),
+            ]
+            temp = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            pygame.draw.polygon(temp, (*sparkle.color, alpha), points)
+            expected.blit(temp, (0, 0))
+
+        actual = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self.effect.draw(actual)
+
+        # Polygons are clipped to the screen before rasterizing, so a star
+        # crossing the edge can differ by a pixel in the outermost column
+        inner = actual.get_rect().inflate(-2, -2)
+        assert pygame.image.tobytes(
+            actual.subsurface(inner), "RGB"
+        ) == pygame.image.tobytes(expected.subsurface(inner), "RGB")
+
+
+class TestHeartBeat:
+    """Test cases for HeartBeat."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        self.heart = HeartBeat((400, 300))
+        yield
+        pygame.quit()
+
+    @staticmethod
+    def _reference(surface, pos, color, scale):
+        """Reference heart drawn on freshly allocated surfaces."""
+        size = int(20 * scale)
+        heart = pygame.Surface((size * 2, size * 2), pygame.SRCALPHA)
+        pygame.draw.circle(
+            heart, color, (size - size // 4, size - size // 4), size // 3
+        )
+        pygame.draw.circle(
+            heart, color, (size + size // 4, size - size // 4), size // 3
+        )
+        pygame.draw.polygon(
+            heart,
+            color,
+            [
+                (size - size // 2, size),
+                (size + size // 2, size),
+                (size, size + size // 2),
+            ],
+        )
+        glow = pygame.Surface((size * 3, size * 3), pygame.SRCALPHA)
+        pygame.draw.circle(glow, (*color, 50), (size * 1.5, size * 1.5), size)
+        surface.blit(glow, (pos[0] - size * 1.5, pos[1] - size * 1.5))
+        surface.blit(heart, (pos[0] - size, pos[1] - size))
+
+    def test_draw_matches_per_frame_rendering(self):
+        """Test cached heart sprites match drawing the heart every frame."""
+        for _ in range(20):
+            self.heart.update()
+            expected = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self._reference(
+                expected, self.heart.pos, self.heart.color, self.heart.scale
+            )
+            actual = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+            self.heart.draw(actual)
+            assert pygame.image.tobytes(actual, "RGB") == pygame.image.tobytes(
+                expected, "RGB"
+            )
+
+
+class TestCreateNeonSurface:
+    """Test cases for create_neon_surface."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        neon_effects._neon_surfaces.clear()
+        self.sprite = pygame.Surface((20, 16), pygame.SRCALPHA)
+        pygame.draw.rect(self.sprite, (255, 255, 255), (4, 4, 12, 8))
+        yield
+        pygame.quit()
+
+    def test_same_sprite_is_rendered_once(self):
+        """Test repeated calls reuse the glow render but return copies."""
+        with patch(
+            "src.neon_effects._render_neon_surface",
+            wraps=neon_effects._render_neon_surface,
+        ) as render:
+            first = create_neon_surface(self.sprite, NEON_CYAN, 4)
+            second = create_neon_surface(self.sprite.copy(), NEON_CYAN, 4)
+
+        assert render.call_count == 1
+        assert first is not second
+        assert pygame.image.tobytes(first, "RGBA") == pygame.image.tobytes(
+            second, "RGBA"
+        )
+
+    def test_changed_pixels_render_again(self):
+        """Test a sprite with different pixels gets its own glow."""
+        with patch(
+            "src.neon_effects._render_neon_surface",
+            wraps=neon_effects._render_neon_surface,
+        ) as render:
+            create_neon_surface(self.sprite, NEON_CYAN, 4)
+            self.sprite.fill((255, 0, 0))
+            create_neon_surface(self.sprite, NEON_CYAN, 4)
+
+        assert render.call_count == 2
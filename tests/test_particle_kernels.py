@@ -0,0 +1,82 @@
+"""Unit tests for the numeric kernels in particle_kernels."""
+
+import os
+import sys
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.particle_kernels import (
+    _project_points_loop,
+    _project_points_numpy,
+    _step_particles_loop,
+    _step_particles_numpy,
+    _step_pool_particles_loop,
+    _step_pool_particles_numpy,
+    project_points,
+    step_particles,
+    step_pool_particles,
+)
+
+
+class TestProjectPoints:
+    """Test cases for the point projection kernels."""
+
+    def test_kernels_match_int_truncation(self):
+        """Test every kernel scales and truncates like int()."""
+        points = np.array([(115, 115), (615, 315), (799, 599)], dtype=np.float64)
+        scale_x, scale_y = 120 / 800, 80 / 600
+        expected = [[int(x * scale_x), int(y * scale_y)] for x, y in points.tolist()]
+        for kernel in (project_points, _project_points_loop, _project_points_numpy):
+            out = kernel(points, scale_x, scale_y)
+            assert out.dtype == np.int32
+            assert out.tolist() == expected
+
+    def test_kernels_handle_empty_input(self):
+        """Test kernels return an empty (0, 2) array for no points."""
+        points = np.empty((0, 2), dtype=np.float64)
+        for kernel in (project_points, _project_points_loop, _project_points_numpy):
+            assert kernel(points, 0.5, 0.5).shape == (0, 2)
+
+
+class TestStepParticles:
+    """Test cases for the particle step kernels."""
+
+    def test_kernels_move_age_and_apply_gravity(self):
+        """Test every kernel advances particles in place the same way."""
+        for kernel in (step_particles, _step_particles_loop, _step_particles_numpy):
+            px = np.array([10.0, 20.0])
+            py = np.array([5.0, 8.0])
+            vx = np.array([1.5, -2.0])
+            vy = np.array([-3.0, 0.5])
+            life = np.array([30, 1])
+            kernel(px, py, vx, vy, life)
+            assert px.tolist() == [11.5, 18.0]
+            assert py.tolist() == [2.0, 8.5]
+            assert vy.tolist() == [-3.0 + 0.1, 0.5 + 0.1]
+            assert life.tolist() == [29, 0]
+
+
+class TestStepPoolParticles:
+    """Test cases for the particle pool step kernels."""
+
+    def test_kernels_step_active_slots_and_retire_expired(self):
+        """Test every kernel skips free slots and reports expired ones."""
+        for kernel in (
+            step_pool_particles,
+            _step_pool_particles_loop,
+            _step_pool_particles_numpy,
+        ):
+            pos = np.array([[10.0, 5.0], [20.0, 8.0], [0.0, 0.0]])
+            vel = np.array([[1.5, -3.0], [-2.0, 0.5], [1.0, 1.0]])
+            life = np.array([30, 1, 0], dtype=np.int32)
+            active = np.array([True, True, False])
+
+            assert kernel(pos, vel, life, active) == 1
+
+            assert pos.tolist() == [[11.5, 2.0], [18.0, 8.5], [0.0, 0.0]]
+            assert vel[:, 1].tolist() == [-3.0 + 0.1, 0.5 + 0.1, 1.0]
+            assert life.tolist() == [29, 0, 0]
+            assert active.tolist() == [True, False, False]
@@ -0,0 +1,412 @@
+"""Unit tests for performance helpers and object pools."""
+
+import os
+import sys
+
+import pygame
+import pytest
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.entities import Bullet, EliteBullet
+from src.neon_effects import RainbowPulse, SparkleEffect
+from src.performance import BulletPool, EffectPool, OptimizedGroup
+from src.performance_optimizations import (
+    FastNeonEffect,
+    OptimizedStarField,
+    ParticlePool,
+    RenderCache,
+)
+
+
+class TestBulletPool:
+    """Test cases for BulletPool."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        self.pool = BulletPool(pool_size=2)
+        yield
+        pygame.quit()
+
+    def test_reuses_released_bullet_of_same_class(self):
+        """Test a released bullet is handed out again for its own class."""
+        bullet = self.pool.get_bullet(Bullet, 100, 100, -5, "player")
+        self.pool.release_bullet(bullet)
+
+        reused = self.pool.get_bullet(Bullet, 200, 300, 5, "enemy")
+        assert reused is bullet
+        assert reused.rect.center == (200, 300)
+        assert reused.owner == "enemy"
+        assert reused in self.pool.active
+
+    def test_free_lists_are_per_class(self):
+        """Test a free bullet of another class is not blocking reuse."""
+        elite = self.pool.get_bullet(EliteBullet, 100, 100, 5, "enemy", 1)
+        bullet = self.pool.get_bullet(Bullet, 100, 100, -5, "player")
+        self.pool.release_bullet(elite)
+        self.pool.release_bullet(bullet)
+
+        assert self.pool.get_bullet(Bullet, 0, 0, -5, "player") is bullet
+        assert self.pool.get_bullet(EliteBullet, 0, 0, 5, "enemy", -1) is elite
+
+    def test_release_files_bullet_under_pool_cls(self):
+        """Test released bullets land in the free list named by pool_cls."""
+        assert Bullet.pool_cls is Bullet
+        assert EliteBullet.pool_cls is EliteBullet
+
+        elite = self.pool.get_bullet(EliteBullet, 100, 100, 5, "enemy", 1)
+        self.pool.release_bullet(elite)
+        assert self.pool.available[EliteBullet] == [elite]
+
+    def test_subclass_can_alias_pool_cls(self):
+        """Test a declared pool_cls is kept; undeclared subclasses get their own."""
+
+        class AliasBullet(Bullet):
+            pool_cls = Bullet
+
+        class ChildBullet(AliasBullet):
+            pass
+
+        assert AliasBullet.pool_cls is Bullet
+        assert ChildBullet.pool_cls is ChildBullet
+
+    def test_free_list_is_capped(self):
+        """Test released bullets beyond pool_size are dropped."""
+        bullets = [self.pool.get_bullet(Bullet, 0, 0, -5, "player") for _ in range(3)]
+        for bullet in bullets:
+            self.pool.release_bullet(bullet)
+
+        assert len(self.pool.available[Bullet]) == 2
+        assert not self.pool.active
+
+
+class TestEffectPool:
+    """Test cases for EffectPool."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        self.pool = EffectPool(pool_size=2)
+        yield
+        pygame.quit()
+
+    def test_reuses_released_effect_with_fresh_state(self):
+        """Test a released pulse is reset when handed out again."""
+        pulse = self.pool.get_effect(RainbowPulse, (10, 10))
+        pulse.current_radius = pulse.max_radius
+        pulse.active = False
+        self.pool.release_effect(pulse)
+
+        reused = self.pool.get_effect(RainbowPulse, (50, 60))
+        assert reused is pulse
+        assert reused.center == (50, 60)
+        assert reused.current_radius == 0
+        assert reused.active
+
+    def test_sparkle_reset_clears_sparkles(self):
+        """Test a reused sparkle effect starts without old sparkles."""
+        sparkle = self.pool.get_effect(SparkleEffect, (10, 10))
+        for _ in range(10):
+            sparkle.update()
+        self.pool.release_effect(sparkle)
+
+        reused = self.pool.get_effect(SparkleEffect, (30, 40))
+        assert reused is sparkle
+        assert reused.pos == (30, 40)
+        assert reused.sparkles == []
+
+    def test_release_all_empties_list_and_caps_pool(self):
+        """Test release_all keeps at most pool_size effects per class."""
+        effects = [self.pool.get_effect(SparkleEffect, (0, 0)) for _ in range(3)]
+        self.pool.release_all(effects)
+
+        assert effects == []
+        assert len(self.pool.available[SparkleEffect]) == 2
+
+
+class _Mover(pygame.sprite.Sprite):
+    """Sprite that moves by a fixed step on every update."""
+
+    def __init__(self, x, y, dx):
+        super().__init__()
+        self.image = pygame.Surface((10, 10))
+        self.rect = self.image.get_rect(center=(x, y))
+        self.dx = dx
+
+    def update(self):
+        self.rect.x += self.dx
+
+
+class TestOptimizedGroup:
+    """Test cases for OptimizedGroup grid maintenance."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        self.group = OptimizedGroup(grid_size=48)
+        yield
+        pygame.quit()
+
+    def test_update_refiles_sprites_that_change_cell(self):
+        """Test a sprite crossing a cell border moves to the new cell."""
+        sprite = _Mover(40, 10, 10)
+        self.group.add(sprite)
+        assert self.group.grid == {(0, 0): {sprite}}
+
+        self.group.update()
+
+        assert self.group.grid == {(1, 0): {sprite}}
+        assert self.group._grid_keys[sprite] == (1, 0)
+        assert self.group.query_rect(sprite.rect) == [sprite]
+
+    def test_update_leaves_grid_alone_within_cell(self):
+        """Test sprites staying in their cell keep the same cell set."""
+        first = _Mover(10, 10, 1)
+        second = _Mover(20, 10, 0)
+        self.group.add(first, second)
+        cell = self.group.grid[(0, 0)]
+
+        self.group.update()
+
+        assert self.group.grid == {(0, 0): {first, second}}
+        assert self.group.grid[(0, 0)] is cell
+
+    def test_killed_sprite_leaves_grid(self):
+        """Test killing a sprite that moved removes it from its new cell."""
+        sprite = _Mover(40, 10, 10)
+        self.group.add(sprite)
+        self.group.update()
+        sprite.kill()
+
+        assert self.group.grid == {}
+        assert self.group._grid_keys == {}
+
+
+class TestParticlePool:
+    """Test cases for ParticlePool."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        self.pool = ParticlePool(max_particles=10)
+        yield
+        pygame.quit()
+
+    def test_collect_blits_covers_active_particles(self):
+        """Test one blit is collected per active particle."""
+        self.pool.emit(100, 100, 4, (255, 0, 0))
+        blits = self.pool.collect_blits()
+        assert len(blits) == 4
+        for sprite, (x, y) in blits:
+            size = (sprite.get_width() - 1) // 2
+            assert (x + size, y + size) == (100, 100)
+
+    def test_emit_fills_free_slots_only(self):
+        """Test emitting past capacity only uses the free slots."""
+        self.pool.emit(100, 100, 7, (255, 0, 0))
+        self.pool.emit(200, 200, 7, (0, 255, 0))
+
+        assert self.pool.active_count == 10
+        assert self.pool.active.all()
+        assert self.pool.pos[7:].tolist() == [[200, 200]] * 3
+        assert self.pool.color[7:].tolist() == [[0, 255, 0]] * 3
+
+    def test_update_moves_particles_with_gravity(self):
+        """Test live particles move by their velocity and fall faster."""
+        self.pool.emit(100, 100, 2, (255, 0, 0))
+        vel = self.pool.vel[:2].copy()
+
+        self.pool.update()
+
+        assert self.pool.pos[:2, 0].tolist() == (vel[:, 0] + 100).tolist()
+        assert self.pool.pos[:2, 1].tolist() == (vel[:, 1] + 100).tolist()
+        assert self.pool.vel[:2, 1].tolist() == (vel[:, 1] + 0.1).tolist()
+        assert self.pool.life[:2].tolist() == [self.pool.max_life - 1] * 2
+        assert self.pool.pos[2:].tolist() == [[0, 0]] * 8  # Free slots untouched
+
+    def test_has_live_tracks_active_particles(self):
+        """Test has_live turns off once every emitted particle expires."""
+        assert not self.pool.has_live()
+        self.pool.emit(100, 100, 3, (255, 0, 0))
+        assert self.pool.has_live()
+
+        for _ in range(self.pool.max_life):
+            self.pool.update()
+        assert not self.pool.has_live()
+
+    def test_particle_sprites_are_shared(self):
+        """Test particles with the same look share one cached sprite."""
+        self.pool.emit(100, 100, 10, (255, 0, 0))
+        sprites = {id(sprite) for sprite, _ in self.pool.collect_blits()}
+        assert len(sprites) <= 3  # One per particle size
+
+    def test_particle_alpha_is_quantized(self):
+        """Test sprite alphas are rounded to multiples of 16 as particles fade."""
+        self.pool.emit(100, 100, 10, (255, 0, 0))
+        for _ in range(20):
+            self.pool.collect_blits()
+            self.pool.update()
+
+        alphas = {alpha for _color, _size, alpha in self.pool._sprites}
+        assert alphas
+        assert all(alpha % 16 == 0 for alpha in alphas)
+
+
+class TestRenderCache:
+    """Test cases for RenderCache."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        self.cache = RenderCache()
+        yield
+        pygame.quit()
+
+    def test_glow_radius_is_snapped_to_multiple_of_four(self):
+        """Test nearby radii share one glow surface sized for the snapped radius."""
+        glows = {
+            id(self.cache.get_glow_surface((0, 255, 255), r)) for r in range(37, 41)
+        }
+        assert len(glows) == 1
+        assert self.cache.get_glow_surface((0, 255, 255), 40).get_size() == (160, 160)
+        assert self.cache.get_glow_surface((0, 255, 255), 41).get_size() == (176, 176)
+        assert len(self.cache.glow_cache) == 2
+
+    def test_glow_alpha_fades_linearly_from_center(self):
+        """Test the glow is 20% alpha at the center and clear past the radius."""
+        glow = self.cache.get_glow_surface((0, 255, 255), 20)
+        assert glow.get_at((40, 40)) == (0, 255, 255, 51)
+        assert glow.get_at((50, 40)) == (0, 255, 255, 25)
+        assert glow.get_at((60, 40)).a == 0
+        assert glow.get_at((0, 0)).a == 0
+        row = [glow.get_at((x, 40)).a for x in range(40, 61)]
+        assert row == sorted(row, reverse=True)
+
+    def test_text_surfaces_are_cached_per_font_text_and_color(self):
+        """Test repeated text renders reuse one surface until something changes."""
+        font = pygame.font.Font(None, 24)
+        first = self.cache.get_text(font, "ON", (0, 255, 0))
+        assert self.cache.get_text(font, "ON", [0, 255, 0]) is first
+        assert self.cache.get_text(font, "OFF", (0, 255, 0)) is not first
+        assert self.cache.get_text(font, "ON", (0, 255, 0, 100)) is not first
+        assert (
+            self.cache.get_text(pygame.font.Font(None, 24), "ON", (0, 255, 0))
+            is not first
+        )
+        assert len(self.cache.text_cache) == 4
+
+        self.cache.clear()
+        assert self.cache.text_cache == {}
+
+
+class TestFastNeonEffect:
+    """Test cases for FastNeonEffect."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        self.neon = FastNeonEffect(RenderCache())
+        yield
+        pygame.quit()
+
+    def _expected_line(self, background, start, end):
+        """Draw the glow additively on a full-size layer, then the core."""
+        expected = pygame.Surface((200, 100))
+        expected.fill(background)
+        layer = pygame.Surface((200, 100), pygame.SRCALPHA)
+        pygame.draw.line(layer, (0, 50, 50), start, end, 6)
+        expected.blit(layer, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        pygame.draw.line(expected, (0, 255, 255), start, end, 2)
+        return expected
+
+    def test_glow_line_is_added_onto_target(self):
+        """Test the glow layer brightens the target instead of covering it."""
+        for start, end in (((20, 50), (180, 20)), ((-10, 90), (150, 120))):
+            surface = pygame.Surface((200, 100))
+            surface.fill((40, 0, 0))
+            self.neon.draw_fast_glow_line(surface, start, end, (0, 255, 255))
+
+            expected = self._expected_line((40, 0, 0), start, end)
+            assert pygame.image.tobytes(surface, "RGB") == pygame.image.tobytes(
+                expected, "RGB"
+            )
+
+    def test_glow_keeps_background_red_channel(self):
+        """Test glow pixels next to the core mix with the background."""
+        surface = pygame.Surface((200, 100))
+        surface.fill((40, 0, 0))
+        self.neon.draw_fast_glow_line(surface, (20, 50), (180, 50), (0, 255, 255))
+        assert surface.get_at((100, 52))[:3] == (40, 50, 50)
+
+
+class TestOptimizedStarField:
+    """Test cases for OptimizedStarField."""
+
+    @pytest.fixture(autouse=True)
+    def setup_and_teardown(self):
+        """Set up test fixtures and clean up after tests."""
+        pygame.init()
+        self.starfield = OptimizedStarField(10)
+        yield
+        pygame.quit()
+
+    def test_update_moves_stars_down(self):
+        """Test every star moves by its own speed."""
+        self.starfield.y[:] = 0
+        self.starfield.update()
+        assert (self.starfield.y == self.starfield.speed).all()
+
+    def test_update_wraps_stars_to_top(self):
+        """Test stars leaving the bottom restart at the top."""
+        self.starfield.y[:] = 600
+        self.starfield.speed[:] = 1
+        self.starfield.update()
+        assert (self.starfield.y == 0).all()
+        assert ((self.starfield.x >= 0) & (self.starfield.x <= 800)).all()
+
+    def test_draw_applies_star_brightness(self):
+        """Test each star is drawn with its pre-rendered brightness level."""
+        self.starfield.x[:2] = (100, 200)
+        self.starfield.y[:2] = (100, 100)
+        self.starfield.x[2:] = 700
+        self.starfield.sprite_idx[:2] = 2
+        self.starfield.bright_idx[:2] = (3, 7)
+
+        surface = pygame.Surface((800, 600))
+        self.starfield.draw(surface)
+
+        assert surface.get_at((100, 100))[:3] == (42, 85, 85)
+        assert surface.get_at((200, 100))[:3] == (100, 200, 200)
+        assert self.starfield.bright_idx.min() >= 3  # Brightness is 0.5 to 1.0
+
+    def test_draw_matches_intermediate_surface(self):
+        """Test blitting sprites directly matches compositing them first."""
+        self.starfield.update()
+        expected = pygame.Surface((800, 600))
+        layer = pygame.Surface((800, 600), pygame.SRCALPHA)
+        for x, y, idx, bright in zip(
+            self.starfield.x,
+            self.starfield.y,
+            self.starfield.sprite_idx,
+            self.starfield.bright_idx,
+            strict=True,
+        ):
+            sprite = self.starfield.star_sprites[idx][bright]
+            half = sprite.get_width() // 2
+            layer.blit(sprite, (int(x) - half, int(y) - half))
+        expected.blit(layer, (0, 0))
+
+        actual = pygame.Surface((800, 600))
+        self.starfield.draw(actual)
+
+        assert pygame.image.tobytes(actual, "RGB") == pygame.image.tobytes(
+            expected, "RGB"
+        )
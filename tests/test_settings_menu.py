@@ -1,5 +1,6 @@
 """Unit tests for the settings menu with scrolling functionality."""
 
+import math
 import os
 import sys
 from unittest.mock import MagicMock, patch
@@ -11,6 +12,7 @@ import pytest
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.config import NEON_CYAN, NEON_GREEN, NEON_PURPLE, SCREEN_HEIGHT, GameState
+from src.performance_optimizations import render_cache
 from src.settings_menu import SettingsMenu
 
 
@@ -73,9 +75,19 @@ class TestSettingsMenu:
     def test_flattened_settings(self):
         """Test settings are flattened correctly for navigation."""
         # Check that all settings have category info
-        for setting in self.settings_menu.all_settings:
-            assert "category" in setting
-            assert "category_color" in setting
+        menu = self.settings_menu
+        assert menu.setting_category == ["Audio"] * 3 + ["Display"] * 2 + ["Gameplay"]
+        assert menu.setting_category_color == [
+            NEON_CYAN,
+            NEON_CYAN,
+            NEON_CYAN,
+            NEON_PURPLE,
+            NEON_PURPLE,
+            NEON_GREEN,
+        ]
+
+        # Settings are shared with their categories rather than copied
+        assert menu.all_settings[3] is menu.categories[1]["settings"][0]
 
         # Verify setting order
         assert self.settings_menu.all_settings[0]["name"] == "Sound"
@@ -217,6 +229,11 @@ class TestSettingsMenu:
             self.settings_menu.content_height > self.settings_menu.visible_area_height
         )
 
+    def test_setting_y_offsets_follow_layout(self):
+        """Test every setting has a precomputed y position in navigation order."""
+        assert self.settings_menu.setting_y_offsets == [50, 120, 190, 365, 435, 610]
+        assert self.settings_menu.content_height == 700
+
     def test_scroll_position_update(self):
         """Test scroll position updates when navigating."""
         # Start at top
@@ -267,6 +284,19 @@ class TestSettingsMenu:
             or self.settings_menu.pulse_timer < 0.2
         )
 
+    def test_animation_offset_follows_sine(self):
+        """Test arrow offset swings smoothly between -5 and 5."""
+        offsets = []
+        for _ in range(63):
+            self.settings_menu.update()
+            offsets.append(self.settings_menu.animation_offset)
+
+        assert self.settings_menu.animation_offset == pytest.approx(
+            math.sin(self.settings_menu.pulse_timer) * 5
+        )
+        assert max(offsets) == pytest.approx(5, abs=0.01)
+        assert min(offsets) == pytest.approx(-5, abs=0.01)
+
     def test_value_getters(self):
         """Test value getters return correct values."""
         for setting in self.settings_menu.all_settings:
@@ -351,6 +381,45 @@ class TestSettingsMenuDrawing:
         # Test drawing doesn't raise errors
         self.settings_menu.draw()
 
+    def test_draw_skips_settings_outside_visible_area(self):
+        """Test only settings near the visible area are drawn."""
+        menu = self.settings_menu
+        with (
+            patch.object(menu, "draw_toggle") as mock_toggle,
+            patch.object(menu, "draw_choice_selector") as mock_choice,
+        ):
+            menu.draw()
+            assert mock_toggle.call_count == 4
+            mock_choice.assert_not_called()
+
+            menu.scroll_offset = menu.content_height - menu.visible_area_height
+            mock_toggle.reset_mock()
+            menu.draw()
+            assert mock_toggle.call_count == 2  # Show FPS and Particles
+            mock_choice.assert_called_once()
+
+    def test_draw_skips_categories_outside_visible_area(self):
+        """Test headers far below the visible area are neither rendered nor drawn."""
+        menu = self.settings_menu
+        with patch(
+            "src.settings_menu.render_cache.get_text", wraps=render_cache.get_text
+        ) as mock_get_text:
+            menu.draw()
+        texts = [call.args[1] for call in mock_get_text.call_args_list]
+        assert "AUDIO" in texts
+        assert "DISPLAY" in texts
+        assert "GAMEPLAY" not in texts
+
+    def test_draw_reuses_category_effects(self):
+        """Test separator lines use the effects built with the menu."""
+        effects = dict(self.settings_menu.category_effects)
+        assert effects["Display"].color == NEON_PURPLE
+
+        with patch("src.settings_menu.NeonEffect") as mock_effect:
+            self.settings_menu.draw()
+        mock_effect.assert_not_called()
+        assert self.settings_menu.category_effects == effects
+
     @patch("pygame.draw.rect")
     @patch("pygame.draw.circle")
     @patch("pygame.draw.line")
@@ -435,6 +504,10 @@ class TestSettingsMenuIntegration:
         self.game.sound_volume = 0.5
         self.settings_menu.handle_value_change(pygame.K_RIGHT)
 
+        # Volumes are applied on the next update
+        mock_sound_manager.set_music_volume.assert_not_called()
+        self.settings_menu.update()
+
         # All sounds should have volume updated
         for sound in mock_sounds.values():
             sound.set_volume.assert_called_with(0.6)
@@ -442,6 +515,30 @@ class TestSettingsMenuIntegration:
         # Music volume should also be updated
         mock_sound_manager.set_music_volume.assert_called_with(0.6)
 
+    @patch("src.settings_menu.sound_manager")
+    def test_held_volume_key_applies_once_per_update(self, mock_sound_manager):
+        """Test several volume changes in one frame reach the mixer once."""
+        sound = MagicMock()
+        mock_sound_manager.sounds = {"shoot": sound}
+        self.settings_menu.selected_index = 2
+        self.game.sound_volume = 0.5
+
+        for _ in range(3):
+            self.settings_menu.handle_value_change(pygame.K_LEFT)
+        self.settings_menu.update()
+        self.settings_menu.update()
+
+        sound.set_volume.assert_called_once_with(self.game.sound_volume)
+        mock_sound_manager.set_music_volume.assert_called_once_with(
+            self.game.sound_volume
+        )
+
+        # A change that lands back on the applied volume is skipped
+        self.settings_menu.handle_value_change(pygame.K_RIGHT)
+        self.settings_menu.handle_value_change(pygame.K_LEFT)
+        self.settings_menu.update()
+        sound.set_volume.assert_called_once()
+
     def test_navigation_with_scrolling(self):
         """Test navigation triggers appropriate scrolling."""
         # Start at top
@@ -12,18 +12,20 @@ import pytest
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.config import SOUND_VOLUME
-from src.sounds import SoundManager
+from src.sounds import SoundManager, _sound_cache_key
 
 
 class TestSoundManager:
     """Test cases for SoundManager functionality."""
 
     @pytest.fixture(autouse=True)
-    def setup(self):
+    def setup(self, tmp_path):
         """Set up test fixtures."""
         pygame.init()
         pygame.mixer.quit()  # Quit first to ensure clean state
-        yield
+        # Keep every test away from the user's real sound cache
+        with patch("src.sounds.SOUND_CACHE_PATH", str(tmp_path / "sounds.npz")):
+            yield
         pygame.mixer.quit()
         pygame.quit()
 
@@ -171,6 +173,14 @@ class TestSoundManager:
         assert np.all(tone >= -1)
         assert np.all(tone <= 1)
 
+    def test_generate_tone_matches_per_sample_sine(self):
+        """Test the vectorized tone equals sampling the sine one frame at a time."""
+        sound_manager = SoundManager.__new__(SoundManager)
+        tone = sound_manager._generate_tone(783.99, 0.1, 22050)
+
+        expected = [np.sin(2 * np.pi * 783.99 * i / 22050) for i in range(2205)]
+        assert tone.tolist() == expected
+
     def test_generate_noise(self):
         """Test noise generation."""
         sound_manager = SoundManager()
@@ -218,6 +228,31 @@ class TestSoundManager:
         # Release: should end near 0
         assert enveloped[-1] < 0.1
 
+    @patch("pygame.sndarray.make_sound")
+    def test_make_stereo_sound_clips_and_duplicates_channels(self, mock_make_sound):
+        """Test samples are scaled, clipped and copied to both channels."""
+        sound_manager = SoundManager.__new__(SoundManager)
+        sound_manager._make_stereo_sound(np.array([0.5, -4.0, 2.0, 0.1]), 0.5)
+
+        stereo = mock_make_sound.call_args[0][0]
+        assert stereo.dtype == np.int16
+        assert stereo.tolist() == [
+            [8191, 8191],
+            [-32767, -32767],
+            [32767, 32767],
+            [1638, 1638],
+        ]
+
+    def test_schedule_notes_cuts_off_at_track_end(self):
+        """Test notes are converted to frame counts and clipped to the track."""
+        sound_manager = SoundManager.__new__(SoundManager)
+        freqs, lengths = sound_manager._schedule_notes(
+            [(55.0, 0.5), (82.41, 0.5), (65.41, 0.5), (73.42, 0.5)], 30000, 22050
+        )
+
+        assert freqs.tolist() == [55.0, 82.41, 65.41, 73.42]
+        assert lengths.tolist() == [11025, 11025, 7950, 0]
+
     @patch("pygame.sndarray.make_sound")
     def test_generate_laser_sound(self, mock_make_sound):
         """Test laser sound generation."""
@@ -302,6 +337,26 @@ class TestSoundManager:
         mock_make_sound.assert_called_once()
         assert result == mock_sound
 
+    @patch("pygame.sndarray.make_sound")
+    def test_wave_clear_harmonics_match_direct_sum(self, mock_make_sound):
+        """Test the shared phase ramp renders the same chord as summing sines."""
+        sound_manager = SoundManager.__new__(SoundManager)
+        sound_manager._generate_wave_clear_sound()
+
+        t = np.linspace(0, 0.8, 17640)
+        chord = sum(
+            0.3 / (i + 1) * np.sin(2 * np.pi * freq * t)
+            for i, freq in enumerate([261.63, 329.63, 392.00, 523.25])
+        )
+        chord = sound_manager._apply_envelope(
+            chord, attack=0.1, decay=0.1, sustain=0.6, release=0.2
+        )
+        expected = (np.clip(chord * 0.4, -1, 1) * 32767).astype(np.int16)
+
+        stereo = mock_make_sound.call_args[0][0]
+        assert np.abs(stereo[:, 0].astype(int) - expected).max() <= 1
+        assert np.array_equal(stereo[:, 0], stereo[:, 1])
+
     @patch("pygame.sndarray.make_sound")
     def test_generate_game_over_sound(self, mock_make_sound):
         """Test game over sound generation."""
@@ -338,6 +393,68 @@ class TestSoundManager:
         mock_make_sound.assert_called_once()
         assert result == mock_sound
 
+    def test_second_manager_loads_sounds_from_cache(self):
+        """Test generated samples are cached and reused by the next manager."""
+        first = SoundManager()
+        expected = {
+            name: pygame.sndarray.array(sound) for name, sound in first.sounds.items()
+        }
+        music = pygame.sndarray.array(first.all_music_themes[2][1])
+
+        with patch.object(
+            SoundManager, "_generate_laser_sound", side_effect=AssertionError
+        ):
+            second = SoundManager()
+
+        assert second.sounds.keys() == expected.keys()
+        for name, samples in expected.items():
+            assert np.array_equal(pygame.sndarray.array(second.sounds[name]), samples)
+            assert second.sounds[name].get_volume() == pytest.approx(
+                SOUND_VOLUME, abs=0.01
+            )
+        assert np.array_equal(
+            pygame.sndarray.array(second.all_music_themes[2][1]), music
+        )
+
+    def test_stale_cache_key_is_regenerated(self):
+        """Test a cache written by other synthesis code is ignored and replaced."""
+        SoundManager()
+        with patch("src.sounds._sound_cache_key", return_value="stale"):
+            with patch.object(SoundManager, "_generate_all_music_themes") as mock_music:
+                SoundManager()
+            mock_music.assert_called_once()
+
+    def test_cache_key_follows_synthesis_source(self, tmp_path):
+        """Test editing the synthesis source changes the cache key."""
+        source = tmp_path / "synth.py"
+        source.write_text("A = 1\n")
+        with patch("src.sounds.SOUND_SOURCE_PATHS", (str(source),)):
+            _sound_cache_key.cache_clear()
+            before = _sound_cache_key()
+            source.write_text("A = 2\n")
+            _sound_cache_key.cache_clear()
+            after = _sound_cache_key()
+        _sound_cache_key.cache_clear()
+
+        assert before != after
+
+    def test_cache_write_leaves_no_temp_files(self, tmp_path):
+        """Test the cache is renamed into place from a unique temp file."""
+        sound_manager = SoundManager()
+        sound_manager._save_cached_sounds()  # Replace an existing cache too
+
+        assert [path.name for path in tmp_path.iterdir()] == ["sounds.npz"]
+
+    def test_unreadable_cache_falls_back_to_generation(self, tmp_path):
+        """Test a corrupt cache file does not stop sounds from loading."""
+        cache_path = tmp_path / "broken.npz"
+        cache_path.write_bytes(b"not a numpy archive")
+        with patch("src.sounds.SOUND_CACHE_PATH", str(cache_path)):
+            sound_manager = SoundManager()
+
+        assert len(sound_manager.sounds) == 8
+        assert len(sound_manager.all_music_themes) == 3
+
     def test_sound_names_mapping(self):
         """Test that sound names match expected game events."""
         expected_sounds = {
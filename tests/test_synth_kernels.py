@@ -0,0 +1,71 @@
+"""Unit tests for the note synthesis kernels in synth_kernels."""
+
+import os
+import sys
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.synth_kernels import (
+    _arpeggio_notes_loop,
+    _arpeggio_notes_numpy,
+    _bass_notes_loop,
+    _bass_notes_numpy,
+    _lead_notes_loop,
+    _lead_notes_numpy,
+    _ramp_at,
+    arpeggio_notes,
+    bass_notes,
+    lead_notes,
+)
+
+SAMPLE_RATE = 22050
+
+
+def _schedule():
+    """A mix of long, short and cut-off notes filling 20000 frames."""
+    freqs = np.array([55.0, 440.0, 82.41, 60.0])
+    lengths = np.array([11025, 4000, 50, 4925], dtype=np.int64)
+    t = np.linspace(0, lengths.sum() / SAMPLE_RATE, lengths.sum())
+    return t, freqs, lengths
+
+
+class TestRampAt:
+    """Test cases for the scalar linspace helper."""
+
+    def test_matches_linspace(self):
+        """Test every value equals np.linspace, including the end point."""
+        for start, stop, num in ((0.0, 1.0, 220), (1.0, 0.7, 2205), (0.7, 0.0, 1)):
+            expected = np.linspace(start, stop, num).tolist()
+            assert [_ramp_at(start, stop, num, k) for k in range(num)] == expected
+
+
+class TestNoteKernels:
+    """Test cases for the bass, lead and arpeggio note kernels."""
+
+    def test_kernels_match_numpy_fallbacks(self):
+        """Test every kernel renders the same samples as its NumPy fallback."""
+        t, freqs, lengths = _schedule()
+        for kernels in (
+            (bass_notes, _bass_notes_loop, _bass_notes_numpy),
+            (lead_notes, _lead_notes_loop, _lead_notes_numpy),
+            (arpeggio_notes, _arpeggio_notes_loop, _arpeggio_notes_numpy),
+        ):
+            expected = np.zeros(len(t))
+            kernels[-1](expected, t, freqs, lengths, SAMPLE_RATE)
+            for kernel in kernels[:-1]:
+                sound = np.zeros(len(t))
+                kernel(sound, t, freqs, lengths, SAMPLE_RATE)
+                np.testing.assert_allclose(sound, expected, atol=1e-12)
+
+    def test_notes_fade_in_and_out(self):
+        """Test each note starts silent and its release ends at zero."""
+        t, freqs, lengths = _schedule()
+        for kernel in (bass_notes, lead_notes, arpeggio_notes):
+            sound = np.full(len(t), np.nan)
+            kernel(sound, t, freqs, lengths, SAMPLE_RATE)
+            assert not np.isnan(sound).any()
+            assert sound[0] == 0
+            assert sound[lengths[0] - 1] == 0